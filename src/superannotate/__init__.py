@@ -69,6 +69,7 @@ from superannotate.lib.app.interface.sdk_interface import (
 )
 from superannotate.lib.app.interface.sdk_interface import create_folder
 from superannotate.lib.app.interface.sdk_interface import create_fuse_image
+from superannotate.lib.app.interface.sdk_interface import create_fuse_images
 from superannotate.lib.app.interface.sdk_interface import create_project
 from superannotate.lib.app.interface.sdk_interface import create_project_from_metadata
 from superannotate.lib.app.interface.sdk_interface import delete_annotation_class
@@ -87,7 +88,11 @@ from superannotate.lib.app.interface.sdk_interface import (
 from superannotate.lib.app.interface.sdk_interface import download_export
 from superannotate.lib.app.interface.sdk_interface import download_image
 from superannotate.lib.app.interface.sdk_interface import download_image_annotations
+from superannotate.lib.app.interface.sdk_interface import (
+    download_image_annotations_bulk,
+)
 from superannotate.lib.app.interface.sdk_interface import download_image_preannotations
+from superannotate.lib.app.interface.sdk_interface import download_images
 from superannotate.lib.app.interface.sdk_interface import download_model
 from superannotate.lib.app.interface.sdk_interface import get_annotation_class_metadata
 from superannotate.lib.app.interface.sdk_interface import get_exports
@@ -237,7 +242,9 @@ __all__ = [
     "move_image",
     "delete_images",
     "download_image",
+    "download_images",
     "create_fuse_image",
+    "create_fuse_images",
     "pin_image",
     "get_image_metadata",
     "get_project_image_count",
@@ -245,6 +252,7 @@ __all__ = [
     "assign_images",
     "unassign_images",
     "download_image_annotations",
+    "download_image_annotations_bulk",
     "delete_annotations",
     "upload_image_to_project",
     "upload_image_annotations",
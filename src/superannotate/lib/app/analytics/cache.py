@@ -0,0 +1,104 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+import pandas as pd
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError(
+            "To use the aggregated annotations cache please install pyarrow package with # pip install pyarrow"
+        )
+    return pyarrow
+
+
+class AnnotationsCache:
+    """
+    Keeps the aggregated annotation rows of an export in a Parquet file,
+    with a manifest of the annotation files modification times and sizes,
+    so only the new and changed files have to be parsed again.
+
+    :param cache_dir: directory of the cache files, created if it doesn't exist
+    :param project_root: export path of the project
+    :param options: aggregation options, the rows aggregated with different options are not shared
+    """
+
+    VERSION = 1
+    # the annotation file path of every row
+    FILE_COLUMN = "_annotationPath"
+    # columns of dicts and lists, kept as json strings
+    JSON_COLUMNS = ("meta", "pointLabels")
+
+    def __init__(self, cache_dir: str, project_root: str, options: dict):
+        self._cache_dir = Path(cache_dir)
+        key = json.dumps(
+            {
+                "version": self.VERSION,
+                "project_root": str(Path(project_root).resolve()),
+                "options": options,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        name = hashlib.sha1(key.encode()).hexdigest()
+        self._data_path = self._cache_dir / f"{name}.parquet"
+        self._manifest_path = self._cache_dir / f"{name}.json"
+
+    @staticmethod
+    def get_file_stat(path) -> Tuple[int, int]:
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def load(self) -> Tuple[Dict[str, Tuple[int, int]], Optional[pd.DataFrame]]:
+        """
+        Returns the modification times and sizes of the cached annotation files and their rows.
+        """
+        if not self._manifest_path.is_file() or not self._data_path.is_file():
+            return {}, None
+        pyarrow = _import_pyarrow()
+        try:
+            with open(self._manifest_path) as file:
+                manifest = json.load(file)
+            df = pyarrow.parquet.read_table(self._data_path).to_pandas()
+        except (OSError, ValueError, pyarrow.ArrowException):
+            return {}, None
+        for column in manifest["json_columns"]:
+            # one decoder call for the whole column
+            df[column] = json.loads("[" + ",".join(df[column]) + "]")
+        files = {path: tuple(stat) for path, stat in manifest["files"].items()}
+        return files, df
+
+    def save(self, files: Dict[str, Tuple[int, int]], df: pd.DataFrame):
+        pyarrow = _import_pyarrow()
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        df = df.copy()
+        json_columns = []
+        for column in df.columns:
+            if column not in self.JSON_COLUMNS:
+                if df[column].dtype != object:
+                    continue
+                try:
+                    pyarrow.array(df[column])
+                    continue
+                except (pyarrow.ArrowException, TypeError, ValueError):
+                    # mixed value types
+                    pass
+            json_columns.append(column)
+            df[column] = [json.dumps(value) for value in df[column]]
+        temp_data_path = self._data_path.with_suffix(".parquet.tmp")
+        temp_manifest_path = self._manifest_path.with_suffix(".json.tmp")
+        pyarrow.parquet.write_table(
+            pyarrow.Table.from_pandas(df, preserve_index=False), temp_data_path
+        )
+        with open(temp_manifest_path, "w") as file:
+            json.dump({"json_columns": json_columns, "files": files}, file)
+        os.replace(temp_data_path, self._data_path)
+        os.replace(temp_manifest_path, self._manifest_path)
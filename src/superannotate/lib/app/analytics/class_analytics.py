@@ -13,7 +13,7 @@ logger = logging.getLogger()
 
 
 @Trackable
-def class_distribution(export_root, project_names, visualize=False):
+def class_distribution(export_root, project_names, visualize=False, cache_dir=None):
     """Aggregate distribution of classes across multiple projects.
 
     :param export_root: root export path of the projects
@@ -22,6 +22,9 @@ def class_distribution(export_root, project_names, visualize=False):
     :type project_names: list of str
     :param visualize: enables class histogram plot
     :type visualize: bool
+    :param cache_dir: directory to cache the aggregated annotations of the projects in,
+                      see aggregate_annotations_as_df
+    :type cache_dir: Pathlike (str or Path)
     :return: DataFrame on class distribution with columns ["className", "count"]
     :rtype: pandas DataFrame
     """
@@ -44,7 +47,7 @@ def class_distribution(export_root, project_names, visualize=False):
     for project_name in project_names:
         project_root = Path(export_root).joinpath(project_name)
         project_df = aggregate_annotations_as_df(
-            project_root, include_classes_wo_annotations=True
+            project_root, include_classes_wo_annotations=True, cache_dir=cache_dir
         )
         project_df = project_df[["imageName", "instanceId", "className"]]
         project_df["projectName"] = project_name
@@ -70,7 +73,7 @@ def class_distribution(export_root, project_names, visualize=False):
 
 
 @Trackable
-def attribute_distribution(export_root, project_names, visualize=False):
+def attribute_distribution(export_root, project_names, visualize=False, cache_dir=None):
     """Aggregate distribution of attributes across multiple projects.
 
     :param export_root: root export path of the projects
@@ -79,6 +82,9 @@ def attribute_distribution(export_root, project_names, visualize=False):
     :type project_names: list of str
     :param visulaize: enables attribute histogram plot
     :type visualize: bool
+    :param cache_dir: directory to cache the aggregated annotations of the projects in,
+                      see aggregate_annotations_as_df
+    :type cache_dir: Pathlike (str or Path)
     :return: DataFrame on attribute distribution with columns [
             "className", "attributeGroupName", "attributeName", "count"
         ]
@@ -95,7 +101,7 @@ def attribute_distribution(export_root, project_names, visualize=False):
     for project_name in project_names:
         project_root = Path(export_root).joinpath(project_name)
         project_df = aggregate_annotations_as_df(
-            project_root, include_classes_wo_annotations=True
+            project_root, include_classes_wo_annotations=True, cache_dir=cache_dir
         )
         project_df = project_df[
             [
@@ -1,9 +1,18 @@
+import concurrent.futures
+import functools
 import json
 import logging
 from pathlib import Path
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
+from lib.app.analytics.cache import AnnotationsCache
 from lib.app.exceptions import AppException
 from lib.core import DEPRICATED_DOCUMENT_VIDEO_MESSAGE
 
@@ -135,6 +144,383 @@ def df_to_annotations(df, output_dir):
     )
 
 
+ANNOTATION_COLUMNS = (
+    "imageName",
+    "imageHeight",
+    "imageWidth",
+    "imageStatus",
+    "imagePinned",
+    "instanceId",
+    "className",
+    "attributeGroupName",
+    "attributeName",
+    "type",
+    "error",
+    "locked",
+    "visible",
+    "trackingId",
+    "probability",
+    "pointLabels",
+    "meta",
+    "classColor",
+    "groupId",
+    "createdAt",
+    "creatorRole",
+    "creationType",
+    "creatorEmail",
+    "updatedAt",
+    "updatorRole",
+    "updatorEmail",
+    "folderName",
+    "imageAnnotator",
+    "imageQA",
+)
+CATEGORICAL_COLUMNS = (
+    "imageStatus",
+    "className",
+    "attributeGroupName",
+    "attributeName",
+    "type",
+    "classColor",
+    "creatorRole",
+    "creationType",
+    "updatorRole",
+    "folderName",
+)
+DATETIME_COLUMNS = ("createdAt", "updatedAt")
+
+
+def _load_json(path):
+    try:
+        import orjson
+
+        with open(path, "rb") as file:
+            return orjson.loads(file.read())
+    except ImportError:
+        with open(path) as file:
+            return json.load(file)
+
+
+def _get_annotation_meta(annotation, annotation_type):
+    if annotation_type in ["bbox", "polygon", "polyline", "cuboid"]:
+        return {"points": annotation["points"]}
+    elif annotation_type == "point":
+        return {"x": annotation["x"], "y": annotation["y"]}
+    elif annotation_type == "ellipse":
+        return {
+            "cx": annotation["cx"],
+            "cy": annotation["cy"],
+            "rx": annotation["rx"],
+            "ry": annotation["ry"],
+            "angle": annotation["angle"],
+        }
+    elif annotation_type == "mask":
+        return {"parts": annotation["parts"]}
+    elif annotation_type == "template":
+        return {
+            "connections": annotation["connections"],
+            "points": annotation["points"],
+        }
+
+
+def _get_user_metadata(annotation):
+    created_by = annotation.get("createdBy") or {}
+    updated_by = annotation.get("updatedBy") or {}
+    # the dates are converted once for the whole column
+    return {
+        "createdAt": annotation.get("createdAt"),
+        "creatorRole": created_by.get("role"),
+        "creatorEmail": created_by.get("email"),
+        "creationType": annotation.get("creationType"),
+        "updatedAt": annotation.get("updatedAt"),
+        "updatorRole": updated_by.get("role"),
+        "updatorEmail": updated_by.get("email"),
+    }
+
+
+def aggregate_annotation_file(
+    annotation_path: Path,
+    project_root: Path,
+    type_postfix: str,
+    class_name_to_color: dict,
+    class_group_name_to_values: dict,
+    include_comments: bool = False,
+    include_tags: bool = False,
+) -> Optional[Dict[str, list]]:
+    """
+    Returns the columns of the annotation file rows, None if the file is not an annotation file.
+    Module level to be usable in a process pool.
+    """
+    parts = annotation_path.name.split(type_postfix)
+    if len(parts) != 2:
+        return None
+    annotation_json = _load_json(annotation_path)
+    image_name = parts[0]
+    metadata = annotation_json["metadata"]
+    image_metadata = {
+        "imageName": image_name,
+        "imageHeight": metadata.get("height"),
+        "imageWidth": metadata.get("width"),
+        "imageStatus": metadata.get("status"),
+        "imagePinned": metadata.get("pinned"),
+        "imageAnnotator": metadata.get("annotatorEmail"),
+        "imageQA": metadata.get("qaEmail"),
+    }
+    folder_name = None
+    if annotation_path.parent != project_root:
+        folder_name = annotation_path.parent.name
+    rows = []
+    if include_comments:
+        for annotation in annotation_json["comments"]:
+            row = {
+                "type": "comment",
+                "meta": {
+                    "x": annotation["x"],
+                    "y": annotation["y"],
+                    "comments": annotation["correspondence"],
+                },
+                "commentResolved": annotation["resolved"],
+            }
+            row.update(_get_user_metadata(annotation))
+            row.update(image_metadata)
+            rows.append(row)
+    if include_tags:
+        for annotation in annotation_json["tags"]:
+            row = {"type": "tag", "tag": annotation}
+            row.update(image_metadata)
+            rows.append(row)
+    instance_id = 0
+    for annotation in annotation_json["instances"]:
+        annotation_type = annotation.get("type", "mask")
+        class_name = annotation.get("className")
+        if class_name is None or class_name not in class_name_to_color:
+            logger.warning(
+                "Annotation class %s not found in classes json. Skipping.",
+                class_name,
+            )
+            continue
+        instance_row = {
+            "imageName": image_name,
+            "instanceId": instance_id,
+            "className": class_name,
+            "type": annotation_type,
+            "locked": annotation.get("locked"),
+            "visible": annotation.get("visible"),
+            "trackingId": annotation.get("trackingId"),
+            "meta": _get_annotation_meta(annotation, annotation_type),
+            "error": annotation.get("error"),
+            "probability": annotation.get("probability"),
+            "pointLabels": annotation.get("pointLabels"),
+            "classColor": class_name_to_color[class_name],
+            "groupId": annotation.get("groupId"),
+            "folderName": folder_name,
+        }
+        instance_row.update(_get_user_metadata(annotation))
+        instance_row.update(image_metadata)
+        attributes = annotation.get("attributes")
+        if not attributes:
+            rows.append(instance_row)
+            instance_id += 1
+            continue
+        num_added = 0
+        for attribute in attributes:
+            attribute_group = attribute.get("groupName")
+            attribute_name = attribute.get("name")
+            if attribute_group not in class_group_name_to_values[class_name]:
+                logger.warning(
+                    "Annotation class group %s not in classes json. Skipping.",
+                    attribute_group,
+                )
+                continue
+            if (
+                attribute_name
+                not in class_group_name_to_values[class_name][attribute_group]
+            ):
+                logger.warning(
+                    "Annotation class group value %s not in classes json. Skipping.",
+                    attribute_name,
+                )
+                continue
+            row = dict(instance_row)
+            row["attributeGroupName"] = attribute_group
+            row["attributeName"] = attribute_name
+            rows.append(row)
+            num_added += 1
+        if num_added > 0:
+            instance_id += 1
+    columns = list(ANNOTATION_COLUMNS)
+    if include_comments:
+        columns.append("commentResolved")
+    if include_tags:
+        columns.append("tag")
+    return {column: [row.get(column) for row in rows] for column in columns}
+
+
+def _build_annotations_df(columns_data: Dict[str, list]) -> pd.DataFrame:
+    df = pd.DataFrame(columns_data)
+    for column in DATETIME_COLUMNS:
+        if df[column].notna().any():
+            df[column] = pd.to_datetime(df[column])
+    return df.astype({"probability": float})
+
+
+def _to_categorical(df: pd.DataFrame) -> pd.DataFrame:
+    return df.astype({column: "category" for column in CATEGORICAL_COLUMNS})
+
+
+def _get_classes_wo_annotations_data(
+    classes_json, columns, annotated_classes, annotated_attributes
+) -> Dict[str, list]:
+    rows = []
+    for class_meta in classes_json:
+        class_name = class_meta["name"]
+        class_color = class_meta["color"]
+        if class_name not in annotated_classes:
+            rows.append({"className": class_name, "classColor": class_color})
+            continue
+        for attribute_group in class_meta["attribute_groups"]:
+            for attribute in attribute_group["attributes"]:
+                if (
+                    class_name,
+                    attribute_group["name"],
+                    attribute["name"],
+                ) not in annotated_attributes:
+                    rows.append(
+                        {
+                            "className": class_name,
+                            "classColor": class_color,
+                            "attributeGroupName": attribute_group["name"],
+                            "attributeName": attribute["name"],
+                        }
+                    )
+    return {column: [row.get(column) for row in rows] for column in columns}
+
+
+def _merge_files_data(files_data: Iterable[Optional[Dict[str, list]]]):
+    merged_data = None
+    for file_data in files_data:
+        if file_data is None:
+            continue
+        if merged_data is None:
+            merged_data = {column: list(values) for column, values in file_data.items()}
+        else:
+            for column, values in file_data.items():
+                merged_data[column].extend(values)
+    return merged_data
+
+
+def _iter_files_data(
+    annotations_paths,
+    aggregate_file,
+    processing_workers: int = None,
+    chunk_size: int = None,
+) -> Iterator[Iterable[Optional[Dict[str, list]]]]:
+    """
+    Yields the columns of the annotation files in chunks of chunk_size files.
+    """
+    chunk_size = chunk_size or len(annotations_paths) or 1
+    executor = None
+    if processing_workers:
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=processing_workers
+        )
+    try:
+        for i in range(0, len(annotations_paths), chunk_size):
+            chunk_paths = annotations_paths[i : i + chunk_size]  # noqa: E203
+            if executor:
+                yield executor.map(
+                    aggregate_file,
+                    chunk_paths,
+                    chunksize=max(len(chunk_paths) // (processing_workers * 4), 1),
+                )
+            else:
+                yield map(aggregate_file, chunk_paths)
+    finally:
+        if executor:
+            executor.shutdown()
+
+
+def _concat_annotations_dfs(dfs: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenates the DataFrames with the dtypes a single DataFrame built from their rows would have,
+    the all empty columns take the dtype of the other DataFrames.
+    """
+    dfs = [df for df in dfs if len(df)] or dfs[:1]
+    if len(dfs) > 1:
+        for column in dfs[0].columns:
+            dtypes = {df[column].dtype for df in dfs if df[column].notna().any()}
+            if len(dtypes) != 1:
+                continue
+            dtype = dtypes.pop()
+            if pd.api.types.is_integer_dtype(dtype):
+                dtype = float
+            elif not (
+                pd.api.types.is_float_dtype(dtype)
+                or pd.api.types.is_datetime64_any_dtype(dtype)
+            ):
+                continue
+            for df in dfs:
+                if not df[column].notna().any():
+                    df[column] = df[column].astype(dtype)
+    return pd.concat(dfs, ignore_index=True)
+
+
+def _get_cached_annotations_df(
+    cache: AnnotationsCache,
+    annotations_paths,
+    aggregate_file,
+    columns,
+    processing_workers: int = None,
+) -> pd.DataFrame:
+    """
+    Returns the rows of the annotation files, parsing only the files changed since the cache was saved.
+    """
+    cached_files, cached_df = cache.load()
+    files = {}
+    paths_to_parse = []
+    for path in annotations_paths:
+        files[str(path)] = cache.get_file_stat(path)
+        if cached_files.get(str(path)) != files[str(path)]:
+            paths_to_parse.append(path)
+    dfs = []
+    if cached_df is not None:
+        unchanged_paths = set(files).difference(map(str, paths_to_parse))
+        dfs.append(
+            cached_df[cached_df[AnnotationsCache.FILE_COLUMN].isin(unchanged_paths)]
+        )
+    if paths_to_parse or cached_df is None:
+        logger.info(
+            "Aggregating %s changed of %s annotation files.",
+            len(paths_to_parse),
+            len(annotations_paths),
+        )
+        files_data = []
+        for chunk_files_data in _iter_files_data(
+            paths_to_parse, aggregate_file, processing_workers
+        ):
+            for path, file_data in zip(paths_to_parse, chunk_files_data):
+                if file_data is not None:
+                    file_data[AnnotationsCache.FILE_COLUMN] = [str(path)] * len(
+                        file_data[columns[0]]
+                    )
+                    files_data.append(file_data)
+        annotations_data = _merge_files_data(files_data) or {
+            column: [] for column in columns + [AnnotationsCache.FILE_COLUMN]
+        }
+        dfs.append(_build_annotations_df(annotations_data))
+    df = _concat_annotations_dfs(dfs)
+    # the rows of the files in the aggregation order
+    file_order = {path: idx for idx, path in enumerate(files)}
+    df = df.iloc[
+        np.argsort(
+            df[AnnotationsCache.FILE_COLUMN].map(file_order).to_numpy(), kind="stable"
+        )
+    ].reset_index(drop=True)
+    if paths_to_parse or cached_df is None or files.keys() != cached_files.keys():
+        cache.save(files, df)
+    return df.drop(columns=[AnnotationsCache.FILE_COLUMN])
+
+
 def aggregate_annotations_as_df(
     project_root,
     include_classes_wo_annotations=False,
@@ -142,6 +528,10 @@ def aggregate_annotations_as_df(
     include_tags=False,
     verbose=True,
     folder_names=None,
+    processing_workers=None,
+    chunk_size=None,
+    categorical=False,
+    cache_dir=None,
 ):
     """Aggregate annotations as pandas dataframe from project root.
 
@@ -157,6 +547,19 @@ def aggregate_annotations_as_df(
     :param folder_names: Aggregate the specified folders from project_root.
                                 If None aggregate all folders in the project_root.
     :type folder_names: (list of str)
+    :param processing_workers: number of processes parsing the annotation files.
+                               If None the files are parsed in the current process.
+    :type processing_workers: int
+    :param chunk_size: if set, an iterator of DataFrames each built from chunk_size annotation files
+                       is returned instead of a single DataFrame. The rows of the classes without
+                       annotations are in the last DataFrame.
+    :type chunk_size: int
+    :param categorical: stores the low cardinality columns such as "className" and "type" as categoricals
+    :type categorical: bool
+    :param cache_dir: directory to cache the aggregated rows of the annotation files in a Parquet file.
+                      Only new and changed files are parsed by the next aggregations of the same export.
+                      Requires pyarrow package, ignored if chunk_size is set.
+    :type cache_dir: Pathlike (str or Path)
 
     :return: DataFrame on annotations with columns:
                                         "imageName", "instanceId",
@@ -180,42 +583,11 @@ def aggregate_annotations_as_df(
     if verbose:
         logger.info("Aggregating annotations from %s as pandas DataFrame", project_root)
 
-    annotation_data = {
-        "imageName": [],
-        "imageHeight": [],
-        "imageWidth": [],
-        "imageStatus": [],
-        "imagePinned": [],
-        "instanceId": [],
-        "className": [],
-        "attributeGroupName": [],
-        "attributeName": [],
-        "type": [],
-        "error": [],
-        "locked": [],
-        "visible": [],
-        "trackingId": [],
-        "probability": [],
-        "pointLabels": [],
-        "meta": [],
-        "classColor": [],
-        "groupId": [],
-        "createdAt": [],
-        "creatorRole": [],
-        "creationType": [],
-        "creatorEmail": [],
-        "updatedAt": [],
-        "updatorRole": [],
-        "updatorEmail": [],
-        "folderName": [],
-        "imageAnnotator": [],
-        "imageQA": [],
-    }
-
+    columns = list(ANNOTATION_COLUMNS)
     if include_comments:
-        annotation_data["commentResolved"] = []
+        columns.append("commentResolved")
     if include_tags:
-        annotation_data["tag"] = []
+        columns.append("tag")
 
     classes_path = Path(project_root) / "classes" / "classes.json"
     if not classes_path.is_file():
@@ -239,51 +611,6 @@ def aggregate_annotations_as_df(
                     attribute["name"]
                 )
 
-    def __append_annotation(annotation_dict):
-        for annotation_key in annotation_data:
-            if annotation_key in annotation_dict:
-                annotation_data[annotation_key].append(annotation_dict[annotation_key])
-            else:
-                annotation_data[annotation_key].append(None)
-
-    def __get_image_metadata(image_name, annotations):
-        image_metadata = {"imageName": image_name}
-
-        image_metadata["imageHeight"] = annotations["metadata"].get("height")
-        image_metadata["imageWidth"] = annotations["metadata"].get("width")
-        image_metadata["imageStatus"] = annotations["metadata"].get("status")
-        image_metadata["imagePinned"] = annotations["metadata"].get("pinned")
-        image_metadata["imageAnnotator"] = annotations["metadata"].get("annotatorEmail")
-        image_metadata["imageQA"] = annotations["metadata"].get("qaEmail")
-        return image_metadata
-
-    def __get_user_metadata(annotation):
-        annotation_created_at = pd.to_datetime(annotation.get("createdAt"))
-        annotation_created_by = annotation.get("createdBy")
-        annotation_creator_email = None
-        annotation_creator_role = None
-        if annotation_created_by:
-            annotation_creator_email = annotation_created_by.get("email")
-            annotation_creator_role = annotation_created_by.get("role")
-        annotation_creation_type = annotation.get("creationType")
-        annotation_updated_at = pd.to_datetime(annotation.get("updatedAt"))
-        annotation_updated_by = annotation.get("updatedBy")
-        annotation_updator_email = None
-        annotation_updator_role = None
-        if annotation_updated_by:
-            annotation_updator_email = annotation_updated_by.get("email")
-            annotation_updator_role = annotation_updated_by.get("role")
-        user_metadata = {
-            "createdAt": annotation_created_at,
-            "creatorRole": annotation_creator_role,
-            "creatorEmail": annotation_creator_email,
-            "creationType": annotation_creation_type,
-            "updatedAt": annotation_updated_at,
-            "updatorRole": annotation_updator_role,
-            "updatorEmail": annotation_updator_email,
-        }
-        return user_metadata
-
     annotations_paths = []
 
     if folder_names is None:
@@ -307,203 +634,84 @@ def aggregate_annotations_as_df(
     else:
         type_postfix = "___pixel.json"
         logger.info("Found Pixel project")
-    for annotation_path in annotations_paths:
-        annotation_json = json.load(open(annotation_path))
-        parts = annotation_path.name.split(type_postfix)
-        if len(parts) != 2:
-            continue
-        image_name = parts[0]
-        image_metadata = __get_image_metadata(image_name, annotation_json)
-        annotation_instance_id = 0
-        if include_comments:
-            for annotation in annotation_json["comments"]:
-                comment_resolved = annotation["resolved"]
-                comment_meta = {
-                    "x": annotation["x"],
-                    "y": annotation["y"],
-                    "comments": annotation["correspondence"],
-                }
-                annotation_dict = {
-                    "type": "comment",
-                    "meta": comment_meta,
-                    "commentResolved": comment_resolved,
-                }
-                user_metadata = __get_user_metadata(annotation)
-                annotation_dict.update(user_metadata)
-                annotation_dict.update(image_metadata)
-                __append_annotation(annotation_dict)
-        if include_tags:
-            for annotation in annotation_json["tags"]:
-                annotation_dict = {"type": "tag", "tag": annotation}
-                annotation_dict.update(image_metadata)
-                __append_annotation(annotation_dict)
-        for annotation in annotation_json["instances"]:
-            annotation_type = annotation.get("type", "mask")
-            annotation_class_name = annotation.get("className")
-            if (
-                annotation_class_name is None
-                or annotation_class_name not in class_name_to_color
-            ):
-                logger.warning(
-                    "Annotation class %s not found in classes json. Skipping.",
-                    annotation_class_name,
-                )
-                continue
-            annotation_class_color = class_name_to_color[annotation_class_name]
-            annotation_group_id = annotation.get("groupId")
-            annotation_locked = annotation.get("locked")
-            annotation_visible = annotation.get("visible")
-            annotation_tracking_id = annotation.get("trackingId")
-            annotation_meta = None
-            if annotation_type in ["bbox", "polygon", "polyline", "cuboid"]:
-                annotation_meta = {"points": annotation["points"]}
-            elif annotation_type == "point":
-                annotation_meta = {"x": annotation["x"], "y": annotation["y"]}
-            elif annotation_type == "ellipse":
-                annotation_meta = {
-                    "cx": annotation["cx"],
-                    "cy": annotation["cy"],
-                    "rx": annotation["rx"],
-                    "ry": annotation["ry"],
-                    "angle": annotation["angle"],
-                }
-            elif annotation_type == "mask":
-                annotation_meta = {"parts": annotation["parts"]}
-            elif annotation_type == "template":
-                annotation_meta = {
-                    "connections": annotation["connections"],
-                    "points": annotation["points"],
-                }
-            annotation_error = annotation.get("error")
-            annotation_probability = annotation.get("probability")
-            annotation_point_labels = annotation.get("pointLabels")
-            attributes = annotation.get("attributes")
-            user_metadata = __get_user_metadata(annotation)
-            folder_name = None
-            if annotation_path.parent != Path(project_root):
-                folder_name = annotation_path.parent.name
-            num_added = 0
-            if not attributes:
-                annotation_dict = {
-                    "imageName": image_name,
-                    "instanceId": annotation_instance_id,
-                    "className": annotation_class_name,
-                    "type": annotation_type,
-                    "locked": annotation_locked,
-                    "visible": annotation_visible,
-                    "trackingId": annotation_tracking_id,
-                    "meta": annotation_meta,
-                    "error": annotation_error,
-                    "probability": annotation_probability,
-                    "pointLabels": annotation_point_labels,
-                    "classColor": annotation_class_color,
-                    "groupId": annotation_group_id,
-                    "folderName": folder_name,
-                }
-                annotation_dict.update(user_metadata)
-                annotation_dict.update(image_metadata)
-                __append_annotation(annotation_dict)
-                num_added = 1
-            else:
-                for attribute in attributes:
-                    attribute_group = attribute.get("groupName")
-                    attribute_name = attribute.get("name")
-                    if (
-                        attribute_group
-                        not in class_group_name_to_values[annotation_class_name]
-                    ):
-                        logger.warning(
-                            "Annotation class group %s not in classes json. Skipping.",
-                            attribute_group,
-                        )
-                        continue
-                    if (
-                        attribute_name
-                        not in class_group_name_to_values[annotation_class_name][
-                            attribute_group
-                        ]
-                    ):
-                        logger.warning(
-                            "Annotation class group value %s not in classes json. Skipping.",
-                            attribute_name,
-                        )
-                        continue
-                    annotation_dict = {
-                        "imageName": image_name,
-                        "instanceId": annotation_instance_id,
-                        "className": annotation_class_name,
-                        "attributeGroupName": attribute_group,
-                        "attributeName": attribute_name,
-                        "type": annotation_type,
-                        "locked": annotation_locked,
-                        "visible": annotation_visible,
-                        "trackingId": annotation_tracking_id,
-                        "meta": annotation_meta,
-                        "error": annotation_error,
-                        "probability": annotation_probability,
-                        "pointLabels": annotation_point_labels,
-                        "classColor": annotation_class_color,
-                        "groupId": annotation_group_id,
-                        "folderName": folder_name,
-                    }
-                    annotation_dict.update(user_metadata)
-                    annotation_dict.update(image_metadata)
-                    __append_annotation(annotation_dict)
-                    num_added += 1
-
-            if num_added > 0:
-                annotation_instance_id += 1
-
-    df = pd.DataFrame(annotation_data)
-
-    # Add classes/attributes w/o annotations
-    if include_classes_wo_annotations:
-        for class_meta in classes_json:
-            annotation_class_name = class_meta["name"]
-            annotation_class_color = class_meta["color"]
-
-            if annotation_class_name not in df["className"].unique():
-                __append_annotation(
-                    {
-                        "className": annotation_class_name,
-                        "classColor": annotation_class_color,
-                    }
-                )
-                continue
-
-            class_df = df[df["className"] == annotation_class_name][
-                ["className", "attributeGroupName", "attributeName"]
-            ]
-            attribute_groups = class_meta["attribute_groups"]
-
-            for attribute_group in attribute_groups:
 
-                attribute_group_name = attribute_group["name"]
-
-                attribute_group_df = class_df[
-                    class_df["attributeGroupName"] == attribute_group_name
-                ][["attributeGroupName", "attributeName"]]
-                attributes = attribute_group["attributes"]
-                for attribute in attributes:
-                    attribute_name = attribute["name"]
+    aggregate_file = functools.partial(
+        aggregate_annotation_file,
+        project_root=Path(project_root),
+        type_postfix=type_postfix,
+        class_name_to_color=class_name_to_color,
+        class_group_name_to_values=class_group_name_to_values,
+        include_comments=include_comments,
+        include_tags=include_tags,
+    )
 
-                    if not (
-                        attribute_name in attribute_group_df["attributeName"].unique()
-                    ):
-                        __append_annotation(
-                            {
-                                "className": annotation_class_name,
-                                "classColor": annotation_class_color,
-                                "attributeGroupName": attribute_group_name,
-                                "attributeName": attribute_name,
-                            }
-                        )
+    if cache_dir and not chunk_size:
+        df = _get_cached_annotations_df(
+            AnnotationsCache(
+                cache_dir,
+                project_root,
+                {
+                    "classes": AnnotationsCache.get_file_stat(classes_path),
+                    "type_postfix": type_postfix,
+                    "include_comments": include_comments,
+                    "include_tags": include_tags,
+                    "folder_names": folder_names,
+                },
+            ),
+            annotations_paths,
+            aggregate_file,
+            columns,
+            processing_workers,
+        )
+        if include_classes_wo_annotations:
+            # Add classes/attributes w/o annotations
+            classes_data = _get_classes_wo_annotations_data(
+                classes_json,
+                columns,
+                set(df["className"]),
+                set(
+                    zip(df["className"], df["attributeGroupName"], df["attributeName"])
+                ),
+            )
+            df = _concat_annotations_dfs([df, _build_annotations_df(classes_data)])
+        return _to_categorical(df) if categorical else df
 
-        df = pd.DataFrame(annotation_data)
+    def iter_annotations_data():
+        annotated_classes, annotated_attributes = set(), set()
+        for files_data in _iter_files_data(
+            annotations_paths, aggregate_file, processing_workers, chunk_size
+        ):
+            annotations_data = _merge_files_data(files_data)
+            if annotations_data is None:
+                continue
+            if include_classes_wo_annotations:
+                annotated_classes.update(annotations_data["className"])
+                annotated_attributes.update(
+                    zip(
+                        annotations_data["className"],
+                        annotations_data["attributeGroupName"],
+                        annotations_data["attributeName"],
+                    )
+                )
+            yield annotations_data
+        if include_classes_wo_annotations:
+            # Add classes/attributes w/o annotations
+            yield _get_classes_wo_annotations_data(
+                classes_json, columns, annotated_classes, annotated_attributes
+            )
 
-    df = df.astype({"probability": float})
+    if chunk_size:
+        return (
+            _to_categorical(df) if categorical else df
+            for df in map(_build_annotations_df, iter_annotations_data())
+        )
 
-    return df
+    annotation_data = {column: [] for column in columns}
+    for annotations_data in iter_annotations_data():
+        for column, values in annotations_data.items():
+            annotation_data[column].extend(values)
+    df = _build_annotations_df(annotation_data)
+    return _to_categorical(df) if categorical else df
 
 
 def instance_consensus(inst_1, inst_2):
@@ -515,11 +723,11 @@ def instance_consensus(inst_1, inst_2):
     :type inst_2: shapely object
 
     """
-    if inst_1.type == inst_2.type == "Polygon":
+    if inst_1.geom_type == inst_2.geom_type == "Polygon":
         intersect = inst_1.intersection(inst_2)
         union = inst_1.union(inst_2)
         score = intersect.area / union.area
-    elif inst_1.type == inst_2.type == "Point":
+    elif inst_1.geom_type == inst_2.geom_type == "Point":
         score = -1 * inst_1.distance(inst_2)
     else:
         raise NotImplementedError
@@ -527,137 +735,319 @@ def instance_consensus(inst_1, inst_2):
     return score
 
 
-def image_consensus(df, image_name, annot_type):
-    """Helper function that computes consensus score for instances of a single image:
+INSTANCE_KEY_COLUMNS = ["imageName", "instanceId", "folderName"]
 
-    :param df: Annotation data of all images
+
+def aggregate_instance_attributes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Collapses the attribute rows of the annotation data to one row per instance,
+    in the order of the first row of every instance.
+    The attributeGroupName and attributeName columns are replaced by an attributes column
+    of attribute group name to attribute names dicts, None for instances without attributes.
+
+    :param df: Annotation data of the instances
     :type df: pandas.DataFrame
-    :param image_name: The image name for which the consensus score will be computed
-    :type image_name: str
-    :param annot_type: Type of annotation instances to consider. Available candidates are: ["bbox", "polygon", "point"]
-    :type dataset_format: str
 
+    :return: DataFrame with a row per instance
+    :rtype: pandas.DataFrame
     """
+    df = df.dropna(subset=INSTANCE_KEY_COLUMNS)
+    attributes_df = df.loc[df["attributeGroupName"].notna()]
+    # a single pass over the attribute rows is faster than aggregating the groups to lists
+    instances_attributes = {}
+    for image_name, instance_id, folder_name, group_name, name in zip(
+        *(
+            attributes_df[column].values
+            for column in INSTANCE_KEY_COLUMNS + ["attributeGroupName", "attributeName"]
+        )
+    ):
+        instances_attributes.setdefault(
+            (image_name, instance_id, folder_name), {}
+        ).setdefault(group_name, []).append(name)
+
+    instances_df = (
+        df.drop(columns=["attributeGroupName", "attributeName"])
+        .drop_duplicates(subset=INSTANCE_KEY_COLUMNS)
+        .reset_index(drop=True)
+    )
+    instances_df["attributes"] = [
+        instances_attributes.get(instance_key)
+        for instance_key in zip(
+            *(instances_df[column] for column in INSTANCE_KEY_COLUMNS)
+        )
+    ]
+    return instances_df
+
 
+CONSENSUS_COLUMNS = [
+    "creatorEmail",
+    "imageName",
+    "instanceId",
+    "area",
+    "className",
+    "attributes",
+    "folderName",
+    "score",
+]
+
+
+def _import_shapely():
     try:
-        from shapely.geometry import box
-        from shapely.geometry import Point
-        from shapely.geometry import Polygon
+        import shapely.geometry
     except ImportError:
         raise ImportError(
             "To use superannotate.benchmark or superannotate.consensus functions please install "
             "shapely package in Anaconda enviornment with # conda install shapely"
         )
+    return shapely.geometry
 
-    image_df = df[df["imageName"] == image_name]
-    all_projects = list(set(df["folderName"]))
-    column_names = [
-        "creatorEmail",
-        "imageName",
-        "instanceId",
-        "area",
-        "className",
-        "attributes",
-        "folderName",
-        "score",
-    ]
-    instance_id = 0
-    image_data = {}
-    for column_name in column_names:
-        image_data[column_name] = []
-
-    projects_shaply_objs = {}
-    # generate shapely objects of instances
-    for _, row in image_df.iterrows():
-        if row["folderName"] not in projects_shaply_objs:
-            projects_shaply_objs[row["folderName"]] = []
-        inst_data = row["meta"]
+
+def _get_consensus_instances(image_df, annot_type) -> Dict[str, dict]:
+    """
+    Returns folder name to the valid instances of the image in the folder map.
+    The instances of a folder are kept in columns, with the bounds of every instance,
+    which are the coordinates for points.
+    """
+    geometry = _import_shapely()
+    folders_instances = {}
+    for folder_name, class_name, creator_email, attributes, inst_data in zip(
+        image_df["folderName"],
+        image_df["className"],
+        image_df["creatorEmail"],
+        image_df["attributes"],
+        image_df["meta"],
+    ):
+        if folder_name not in folders_instances:
+            folders_instances[folder_name] = {
+                "geometries": [],
+                "classes": [],
+                "emails": [],
+                "attributes": [],
+            }
         if annot_type == "bbox":
             inst_coords = inst_data["points"]
             x1, x2 = inst_coords["x1"], inst_coords["x2"]
             y1, y2 = inst_coords["y1"], inst_coords["y2"]
-            inst = box(min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+            inst = geometry.box(min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
         elif annot_type == "polygon":
             inst_coords = inst_data["points"]
-            shapely_format = []
-            for i in range(0, len(inst_coords) - 1, 2):
-                shapely_format.append((inst_coords[i], inst_coords[i + 1]))
-            inst = Polygon(shapely_format)
+            inst = geometry.Polygon(
+                [
+                    (inst_coords[i], inst_coords[i + 1])
+                    for i in range(0, len(inst_coords) - 1, 2)
+                ]
+            )
         elif annot_type == "point":
-            inst = Point(inst_data["x"], inst_data["y"])
+            inst = geometry.Point(inst_data["x"], inst_data["y"])
         if inst.is_valid:
-            projects_shaply_objs[row["folderName"]].append(
-                (inst, row["className"], row["creatorEmail"], row["attributes"])
-            )
+            instances = folders_instances[folder_name]
+            instances["geometries"].append(inst)
+            instances["classes"].append(class_name)
+            instances["emails"].append(creator_email)
+            instances["attributes"].append(attributes)
         else:
             logger.info(
                 "Invalid %s instance occured, skipping to the next one.", annot_type
             )
-    visited_instances = {}
-    for proj, instances in projects_shaply_objs.items():
-        visited_instances[proj] = [False] * len(instances)
-
-    # match instances
-    for curr_proj, curr_proj_instances in projects_shaply_objs.items():
-        for curr_id, curr_inst_data in enumerate(curr_proj_instances):
-            curr_inst, curr_class, _, _ = curr_inst_data
-            if visited_instances[curr_proj][curr_id] == True:
+    for instances in folders_instances.values():
+        instances["classes"] = np.array(instances["classes"], dtype=object)
+        instances["bounds"] = np.array(
+            [inst.bounds for inst in instances["geometries"]], dtype=float
+        ).reshape(-1, 4)
+        instances["visited"] = np.zeros(len(instances["geometries"]), dtype=bool)
+    return folders_instances
+
+
+def _bounds_overlap(bounds, other_bounds) -> np.ndarray:
+    """
+    Returns the mask of the other bounds having a positive area intersection with the bounds.
+    """
+    return (
+        np.minimum(bounds[2], other_bounds[:, 2])
+        > np.maximum(bounds[0], other_bounds[:, 0])
+    ) & (
+        np.minimum(bounds[3], other_bounds[:, 3])
+        > np.maximum(bounds[1], other_bounds[:, 1])
+    )
+
+
+def _instances_consensus(annot_type, instances, index, other_instances, other_indices):
+    """
+    Returns the consensus scores of an instance with the other instances,
+    the same scores instance_consensus computes for their shapely objects.
+    """
+    bounds = instances["bounds"][index]
+    other_bounds = other_instances["bounds"][other_indices]
+    if annot_type == "point":
+        dx = other_bounds[:, 0] - bounds[0]
+        dy = other_bounds[:, 1] - bounds[1]
+        return -np.sqrt(dx * dx + dy * dy)
+    if annot_type == "bbox":
+        width = np.minimum(bounds[2], other_bounds[:, 2]) - np.maximum(
+            bounds[0], other_bounds[:, 0]
+        )
+        height = np.minimum(bounds[3], other_bounds[:, 3]) - np.maximum(
+            bounds[1], other_bounds[:, 1]
+        )
+        intersection = np.clip(width, 0, None) * np.clip(height, 0, None)
+        area = (bounds[2] - bounds[0]) * (bounds[3] - bounds[1])
+        other_areas = (other_bounds[:, 2] - other_bounds[:, 0]) * (
+            other_bounds[:, 3] - other_bounds[:, 1]
+        )
+        return intersection / (area + other_areas - intersection)
+    inst = instances["geometries"][index]
+    return np.array(
+        [
+            instance_consensus(inst, other_instances["geometries"][other_index])
+            for other_index in other_indices
+        ],
+        dtype=float,
+    )
+
+
+def _image_consensus(
+    image_name, image_df, annot_type, folders_count
+) -> Dict[str, list]:
+    folders_instances = _get_consensus_instances(image_df, annot_type)
+    image_data = {column_name: [] for column_name in CONSENSUS_COLUMNS}
+    min_score = float("-inf") if annot_type == "point" else 0
+    instance_id = 0
+
+    # match every instance with the best scored unvisited instance of the same class in every other folder
+    for curr_folder, curr_instances in folders_instances.items():
+        for curr_id in range(len(curr_instances["geometries"])):
+            if curr_instances["visited"][curr_id]:
                 continue
             max_instances = []
-            for other_proj, other_proj_instances in projects_shaply_objs.items():
-                if curr_proj == other_proj:
-                    max_instances.append((curr_proj, *curr_inst_data))
-                    visited_instances[curr_proj][curr_id] = True
+            for other_folder, other_instances in folders_instances.items():
+                if curr_folder == other_folder:
+                    max_instances.append((curr_folder, curr_instances, curr_id))
+                    curr_instances["visited"][curr_id] = True
+                    continue
+                candidates = ~other_instances["visited"] & (
+                    other_instances["classes"] == curr_instances["classes"][curr_id]
+                )
+                if annot_type == "polygon":
+                    # the exact intersections are computed only for the overlapping bounding boxes
+                    candidates &= _bounds_overlap(
+                        curr_instances["bounds"][curr_id], other_instances["bounds"]
+                    )
+                other_ids = np.flatnonzero(candidates)
+                if not len(other_ids):
+                    continue
+                scores = _instances_consensus(
+                    annot_type, curr_instances, curr_id, other_instances, other_ids
+                )
+                max_index = int(np.argmax(scores))
+                if scores[max_index] > min_score:
+                    max_id = other_ids[max_index]
+                    max_instances.append((other_folder, other_instances, max_id))
+                    other_instances["visited"][max_id] = True
+
+            for curr_folder_name, instances, index in max_instances:
+                if len(max_instances) == 1:
+                    score = 0
                 else:
-                    if annot_type in ["polygon", "bbox"]:
-                        max_score = 0
-                    else:
-                        max_score = float("-inf")
-                    max_inst_data = None
-                    max_inst_id = -1
-                    for other_id, other_inst_data in enumerate(other_proj_instances):
-                        other_inst, other_class, _, _ = other_inst_data
-                        if visited_instances[other_proj][other_id] == True:
-                            continue
-                        score = instance_consensus(curr_inst, other_inst)
-                        if score > max_score and other_class == curr_class:
-                            max_score = score
-                            max_inst_data = other_inst_data
-                            max_inst_id = other_id
-                    if max_inst_data is not None:
-                        max_instances.append((other_proj, *max_inst_data))
-                        visited_instances[other_proj][max_inst_id] = True
-            if len(max_instances) == 1:
-                image_data["creatorEmail"].append(max_instances[0][3])
-                image_data["attributes"].append(max_instances[0][4])
-                image_data["area"].append(max_instances[0][1].area)
+                    proj_cons = 0
+                    for (
+                        other_folder_name,
+                        other_instances,
+                        other_index,
+                    ) in max_instances:
+                        if curr_folder_name != other_folder_name:
+                            pair_score = _instances_consensus(
+                                annot_type,
+                                instances,
+                                index,
+                                other_instances,
+                                [other_index],
+                            )[0]
+                            proj_cons += 1.0 if pair_score <= 0 else pair_score
+                    score = proj_cons / (folders_count - 1)
+                image_data["creatorEmail"].append(instances["emails"][index])
+                image_data["attributes"].append(instances["attributes"][index])
+                image_data["area"].append(instances["geometries"][index].area)
                 image_data["imageName"].append(image_name)
                 image_data["instanceId"].append(instance_id)
-                image_data["className"].append(max_instances[0][2])
-                image_data["folderName"].append(max_instances[0][0])
-                image_data["score"].append(0)
-            else:
-                for curr_match_data in max_instances:
-                    proj_cons = 0
-                    for other_match_data in max_instances:
-                        if curr_match_data[0] != other_match_data[0]:
-                            score = instance_consensus(
-                                curr_match_data[1], other_match_data[1]
-                            )
-                            proj_cons += 1.0 if score <= 0 else score
-                    image_data["creatorEmail"].append(curr_match_data[3])
-                    image_data["attributes"].append(curr_match_data[4])
-                    image_data["area"].append(curr_match_data[1].area)
-                    image_data["imageName"].append(image_name)
-                    image_data["instanceId"].append(instance_id)
-                    image_data["className"].append(curr_match_data[2])
-                    image_data["folderName"].append(curr_match_data[0])
-                    image_data["score"].append(proj_cons / (len(all_projects) - 1))
+                image_data["className"].append(instances["classes"][index])
+                image_data["folderName"].append(curr_folder_name)
+                image_data["score"].append(score)
             instance_id += 1
 
     return image_data
 
 
+def _images_consensus(images, annot_type, folders_count) -> List[Dict[str, list]]:
+    return [
+        _image_consensus(image_name, image_df, annot_type, folders_count)
+        for image_name, image_df in images
+    ]
+
+
+def image_consensus(df, image_name, annot_type):
+    """Helper function that computes consensus score for instances of a single image:
+
+    :param df: Annotation data of all images
+    :type df: pandas.DataFrame
+    :param image_name: The image name for which the consensus score will be computed
+    :type image_name: str
+    :param annot_type: Type of annotation instances to consider. Available candidates are: ["bbox", "polygon", "point"]
+    :type dataset_format: str
+
+    """
+    return _image_consensus(
+        image_name,
+        df[df["imageName"] == image_name],
+        annot_type,
+        len(set(df["folderName"])),
+    )
+
+
+def images_consensus(df, annot_type, processing_workers: int = None) -> pd.DataFrame:
+    """Computes consensus scores for instances of all images of the annotation data.
+
+    :param df: Annotation data of all images
+    :type df: pandas.DataFrame
+    :param annot_type: Type of annotation instances to consider. Available candidates are: ["bbox", "polygon", "point"]
+    :type annot_type: str
+    :param processing_workers: number of processes matching the instances of the images.
+                               The images are matched in the current process if not specified.
+    :type processing_workers: int
+
+    :return: DataFrame with the consensus scores of the instances
+    :rtype: pandas.DataFrame
+    """
+    _import_shapely()
+    folders_count = len(set(df["folderName"]))
+    images = list(df.groupby("imageName", sort=False))
+    if processing_workers and len(images) > 1:
+        chunk_size = max(len(images) // (processing_workers * 4), 1)
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=processing_workers
+        ) as executor:
+            chunks_data = executor.map(
+                functools.partial(
+                    _images_consensus,
+                    annot_type=annot_type,
+                    folders_count=folders_count,
+                ),
+                [
+                    images[i : i + chunk_size]
+                    for i in range(0, len(images), chunk_size)
+                ],  # noqa: E203
+            )
+            images_data = [
+                image_data for chunk_data in chunks_data for image_data in chunk_data
+            ]
+    else:
+        images_data = _images_consensus(images, annot_type, folders_count)
+    consensus_data = {column_name: [] for column_name in CONSENSUS_COLUMNS}
+    for image_data in images_data:
+        for column_name, values in image_data.items():
+            consensus_data[column_name].extend(values)
+    return pd.DataFrame(consensus_data, columns=CONSENSUS_COLUMNS)
+
+
 def consensus_plot(consensus_df, *_, **__):
     plot_data = consensus_df.copy()
 
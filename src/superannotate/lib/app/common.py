@@ -7,7 +7,6 @@ from pathlib import Path
 
 import numpy as np
 from PIL import Image
-from tqdm import tqdm
 
 logger = logging.getLogger()
 
@@ -156,18 +155,6 @@ def write_to_json(output_path, json_data):
 MAX_IMAGE_SIZE = 100 * 1024 * 1024  # 100 MB limit
 
 
-def tqdm_converter(total_num, images_converted, images_not_converted, finish_event):
-    with tqdm(total=total_num) as pbar:
-        while True:
-            finished = finish_event.wait(5)
-            if not finished:
-                sum_all = len(images_converted) + len(images_not_converted)
-                pbar.update(sum_all - pbar.n)
-            else:
-                pbar.update(total_num - pbar.n)
-                break
-
-
 def get_annotation_json_name(image_name, project_type):
     if project_type == "Vector":
         return image_name + "___objects.json"
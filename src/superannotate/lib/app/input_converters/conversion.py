@@ -144,6 +144,7 @@ def export_annotation(
     dataset_name,
     project_type="Vector",
     task="object_detection",
+    processing_workers=None,
 ):
 
     if project_type in [
@@ -186,6 +187,8 @@ def export_annotation(
                  'instance_segmentation' 'Pixel' project_type converts instance masks and 'Vector' project_type generates bounding boxes and polygons from instance masks. Masks should be in the input folder if it is 'Pixel' project_type.
                  'object_detection' converts objects from/to available annotation format
     :type task: str
+    :param processing_workers: number of processes converting the images.
+    :type processing_workers: int
 
     """
 
@@ -218,6 +221,7 @@ def export_annotation(
         dataset_name=dataset_name,
         project_type=project_type,
         task=task,
+        processing_workers=processing_workers,
     )
 
     _passes_converter_sanity(args, "export")
@@ -235,6 +239,7 @@ def import_annotation(
     task="object_detection",
     images_root="",
     images_extensions=None,
+    processing_workers=None,
 ):
     """Converts other annotation formats to SuperAnnotate annotation format. Currently available (project_type, task) combinations for converter
     presented below:
@@ -363,6 +368,8 @@ def import_annotation(
     :type images_root: str
     :param image_extensions: List of image files xtensions in the images_root folder
     :type image_extensions: list
+    :param processing_workers: number of processes converting the images.
+    :type processing_workers: int
 
     """
 
@@ -402,6 +409,7 @@ def import_annotation(
         task=task,
         images_root=images_root,
         images_extensions=images_extensions,
+        processing_workers=processing_workers,
     )
 
     _passes_converter_sanity(args, "import")
@@ -410,13 +418,15 @@ def import_annotation(
 
 
 @Trackable
-def convert_project_type(input_dir, output_dir):
+def convert_project_type(input_dir, output_dir, processing_workers=None):
     """ Converts SuperAnnotate 'Vector' project type to 'Pixel' or reverse.
 
     :param input_dir: Path to the dataset folder that you want to convert.
     :type input_dir: Pathlike(str or Path)
     :param output_dir: Path to the folder where you want to have converted files.
     :type output_dir: Pathlike(str or Path)
+    :param processing_workers: number of processes converting the images.
+    :type processing_workers: int
 
     """
     params_info = [
@@ -434,7 +444,7 @@ def convert_project_type(input_dir, output_dir):
 
     input_dir, output_dir = _change_type(input_dir, output_dir)
 
-    sa_convert_project_type(input_dir, output_dir)
+    sa_convert_project_type(input_dir, output_dir, processing_workers)
 
 
 @Trackable
@@ -149,6 +149,7 @@ class baseStrategy:
         self.output_dir = args.output_dir
         self.task = args.task
         self.direction = args.direction
+        self.processing_workers = args.processing_workers
         self.conversion_algorithm = CONVERSION_ALGORITHMS[self.direction][
             args.dataset_format
         ][self.project_type][self.task]
@@ -14,19 +14,16 @@ def decode(coco_dict):
 
 
 def _masktoRLE(bitmask):
+    """
+    Column-major run lengths of the mask starting with the zeros run, as pycocotools rleEncode.
+    """
     shape = bitmask.shape
-    bitmask = bitmask.T.flatten()
-    N = len(bitmask)
-    diff_index = np.where(np.array(bitmask[: N - 1]) - np.array(bitmask[1:]))[0]
-    diff = np.array(diff_index[1:]) - np.array(diff_index[:-1])
-
-    counts = np.zeros(len(diff) + 3, dtype=np.int32)
-    counts[1] = diff_index[0] + 1
-    counts[2:-1] = diff
-    counts[-1] = len(bitmask) - diff_index[-1] - 1
-
-    if bitmask[0] == 0:
-        counts = counts[1:]
+    bitmask = np.asarray(bitmask).ravel(order="F") != 0
+    changes = np.flatnonzero(bitmask[1:] != bitmask[:-1]) + 1
+    boundaries = np.concatenate(([0], changes, [len(bitmask)]))
+    counts = np.diff(boundaries)
+    if len(bitmask) and bitmask[0]:
+        counts = np.concatenate(([0], counts))
 
     return {"counts": counts, "size": list(shape)}
 
@@ -39,61 +36,45 @@ def _maskfrRLE(rle):
 
 
 def _toString(rle_counts):
-    rle_string = ""
-    for i, count in enumerate(rle_counts):
-        if i > 2:
-            count -= rle_counts[i - 2]
-
-        more = True
-        while more:
-            if count > 0:
-                count_binary = bin(count)
-                if len(count_binary[2:]) % 5 != 0:
-                    count_binary = (
-                        "0b" + "0" * (5 - len(count_binary[2:]) % 5) + count_binary[2:]
-                    )
-            else:
-                count_binary = bin(((1 << 35) - 1) & count)
-
-            count = count >> 5
-            last_bits = count_binary[-5:]
-
-            value = int(last_bits, 2)
-            if last_bits[0] == "1":
-                more = count != -1
-            else:
-                more = count != 0
-
-            if more:
-                char = (value | 0x20) + 48
-            else:
-                char = value + 48
-
-            rle_string += chr(char)
-
-    return rle_string
+    """
+    Compresses the counts to the pycocotools RLE string: the counts after the third one
+    are stored as the difference to the count two positions before, and every value is
+    written as 5 bit groups from the lowest one, each in a char of 48 + group | 0x20 if more groups follow.
+    """
+    values = np.array(rle_counts, dtype=np.int64)
+    values[3:] -= np.array(rle_counts[1:-2], dtype=np.int64)
+    chars, written = [], []
+    more = np.ones(len(values), dtype=bool)
+    while more.any():
+        written.append(more)
+        group = values & 0x1F
+        values = values >> 5
+        more = more & np.where(group & 0x10, values != -1, values != 0)
+        chars.append(np.where(more, group | 0x20, group) + 48)
+    if not chars:
+        return ""
+    chars = np.array(chars, dtype=np.uint8).T[np.array(written).T]
+
+    return chars.tobytes().decode("ascii")
 
 
 def _frString(rle_string):
-    counts = []
-    i = 0
-    while i < len(rle_string):
-        more = True
-        k = 0
-        count = 0
-        while more:
-            value = ord(rle_string[i]) - 48
-            count |= (value & 0x1F) << 5 * k
-            more = value & 0x20
-            i += 1
-            k += 1
-            if not more and (value & 0x10):
-                count |= -1 << 5 * k
-
-        if len(counts) > 2:
-            count += counts[len(counts) - 2]
-
-        counts.append(count)
+    """
+    Decompresses the pycocotools RLE string to the counts, the inverse of _toString.
+    """
+    chars = np.frombuffer(rle_string.encode("ascii"), dtype=np.uint8).astype(np.int64)
+    if not len(chars):
+        return np.zeros(0, dtype=np.int64)
+    chars -= 48
+    ends = np.flatnonzero((chars & 0x20) == 0)
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    group_index = np.arange(len(chars)) - np.repeat(starts, ends - starts + 1)
+    counts = np.add.reduceat((chars & 0x1F) << (5 * group_index), starts)
+    negative = (chars[ends] & 0x10) != 0
+    counts[negative] |= -1 << (5 * (group_index[ends[negative]] + 1))
+    # the counts after the third one are the differences to the count two positions before
+    counts[1::2] = np.cumsum(counts[1::2])
+    counts[2::2] = np.cumsum(counts[2::2])
 
     return counts
 
@@ -103,13 +84,12 @@ def _area(bitmask):
 
 
 def _toBbox(bitmask):
-    y, x = np.where(bitmask)
-    if x.tolist() == [] and y.tolist() == []:
+    columns = np.flatnonzero(np.any(bitmask, axis=0))
+    if not len(columns):
         return [0, 0, 0, 0]
-    xmin = int(min(x))
-    xmax = int(max(x))
-    ymin = int(min(y))
-    ymax = int(max(y))
+    rows = np.flatnonzero(np.any(bitmask, axis=1))
+    xmin, xmax = int(columns[0]), int(columns[-1])
+    ymin, ymax = int(rows[0]), int(rows[-1])
 
     return [xmin, ymin, xmax - xmin + 1, ymax - ymin + 1]
 
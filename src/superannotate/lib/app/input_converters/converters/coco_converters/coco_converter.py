@@ -13,10 +13,18 @@ from PIL import Image
 from ....common import id2rgb
 from ....common import write_to_json
 from ..baseStrategy import baseStrategy
+from ..runner import ConversionRunner
+from .coco_stream import iter_coco_json
 
 logger = logging.getLogger()
 
 
+def _load_sa_json(strategy, fpath):
+    with open(fpath) as fp:
+        json_data = json.load(fp)
+    return strategy._parse_json_into_common_format(json_data, fpath)
+
+
 class CocoBaseStrategy(baseStrategy):
     project_type_to_json_ending = {
         "pixel": "___pixel.json",
@@ -273,8 +281,11 @@ class CocoBaseStrategy(baseStrategy):
         return image_info
 
     def _create_sa_classes(self, json_path):
-        json_data = json.load(open(json_path))
-        classes_list = json_data["categories"]
+        classes_list = [
+            category
+            for key, category, _ in iter_coco_json(json_path)
+            if key == "categories"
+        ]
 
         classes = []
         for data in classes_list:
@@ -294,21 +305,25 @@ class CocoBaseStrategy(baseStrategy):
         sa_classes = self._create_sa_classes(json_data)
         (self.output_dir / "classes").mkdir(parents=True, exist_ok=True)
         write_to_json(self.output_dir / "classes" / "classes.json", sa_classes)
-        self.conversion_algorithm(json_data, self.output_dir)
-
-    def make_anno_json_generator(self):
-        json_data = None
+        self.conversion_algorithm(
+            json_data, self.output_dir, processing_workers=self.processing_workers
+        )
 
+    def get_annotation_paths(self):
         if self.project_type == "Pixel":
             jsons = list(Path(self.export_root).glob("*pixel.json"))
         elif self.project_type == "Vector":
             jsons = list(Path(self.export_root).glob("*objects.json"))
 
         self.set_num_total_images(len(jsons))
-        print()
-        for fpath in jsons:
-            with open(fpath) as fp:
-                json_data = json.load(fp)
-                json_data = self._parse_json_into_common_format(json_data, fpath)
+        return jsons
+
+    def load_annotation_json(self, fpath):
+        return _load_sa_json(self, fpath)
 
-            yield json_data
+    def make_anno_json_generator(self):
+        jsons = self.get_annotation_paths()
+        tasks = ((self, fpath) for fpath in jsons)
+        yield from ConversionRunner(self.processing_workers).run(
+            _load_sa_json, tasks, len(jsons)
+        )
@@ -1,19 +1,44 @@
 """
 """
 import logging
-import threading
 from pathlib import Path
 
 from PIL import Image
 
 from ....common import id2rgb
-from ....common import tqdm_converter
 from ....common import write_to_json
+from ..runner import ConversionRunner
 from .coco_converter import CocoBaseStrategy
+from .coco_stream import CocoWriter
 
 logger = logging.getLogger()
 
 
+def _make_id_generator(first_id):
+    cur_id = first_id - 1
+    while True:
+        cur_id += 1
+        yield cur_id
+
+
+def _panoptic_image_to_coco(strategy, fpath, image_id, first_segment_id):
+    json_ = strategy.load_annotation_json(fpath)
+    res = strategy._sa_to_coco_single(
+        image_id, json_, _make_id_generator(first_segment_id)
+    )
+    panoptic_mask = json_["metadata"]["panoptic_mask"]
+    Image.fromarray(id2rgb(res[2])).save(panoptic_mask)
+    return res[0], res[1]
+
+
+def _image_to_coco(strategy, fpath, image_id):
+    json_ = strategy.load_annotation_json(fpath)
+    id_generator = _make_id_generator(1)
+    image_info, annotations = strategy._sa_to_coco_single(image_id, json_, id_generator)
+    # the annotation ids are made unique across the images by the caller
+    return image_info, annotations, next(id_generator) - 1
+
+
 class CocoPanopticConverterStrategy(CocoBaseStrategy):
     def __init__(self, args):
         super().__init__(args)
@@ -34,46 +59,35 @@ class CocoPanopticConverterStrategy(CocoBaseStrategy):
             self.export_root / "classes_mapper.json"
         )
 
-        images = []
-        annotations = []
-        id_generator = self._make_id_generator()
         annot_id_generator = self._make_id_generator()
 
-        jsons = self.make_anno_json_generator()
-        images_converted = []
-        images_not_converted = []
-        total_num = self.get_num_total_images()
-        finish_event = threading.Event()
-        tqdm_thread = threading.Thread(
-            target=tqdm_converter,
-            args=(total_num, images_converted, images_not_converted, finish_event),
-            daemon=True,
-        )
-        logger.info("Converting to COCO JSON format")
-        tqdm_thread.start()
-        for json_ in jsons:
-            idx = next(annot_id_generator)
-            res = self._sa_to_coco_single(idx, json_, id_generator)
-
-            panoptic_mask = json_["metadata"]["panoptic_mask"]
-
-            Image.fromarray(id2rgb(res[2])).save(panoptic_mask)
+        # the segment ids are unique across the images,
+        # the first segment id of every image is counted before converting them,
+        # the JSONs are loaded again by the tasks to not hold all of them in memory
+        tasks = []
+        first_segment_id = 1
+        for fpath in self.get_annotation_paths():
+            json_ = self.load_annotation_json(fpath)
+            tasks.append((self, fpath, next(annot_id_generator), first_segment_id))
+            first_segment_id += sum(
+                "parts" in instance for instance in json_["instances"]
+            )
 
-            annotation = {
-                "image_id": res[0]["id"],
-                "file_name": Path(panoptic_mask).name,
-                "segments_info": res[1],
-            }
-            annotations.append(annotation)
-
-            images.append(res[0])
-            images_converted.append(json_)
-
-        out_json["annotations"] = annotations
-        out_json["images"] = images
-        write_to_json(self.output_dir / f"{self.dataset_name}.json", out_json)
-        finish_event.set()
-        tqdm_thread.join()
+        logger.info("Converting to COCO JSON format")
+        with CocoWriter(
+            self.output_dir / f"{self.dataset_name}.json", out_json
+        ) as writer:
+            for image_info, segments_info in ConversionRunner(
+                self.processing_workers
+            ).run(_panoptic_image_to_coco, tasks, len(tasks)):
+                panoptic_mask = self.export_root / (image_info["file_name"] + ".png")
+                annotation = {
+                    "image_id": image_info["id"],
+                    "file_name": Path(panoptic_mask).name,
+                    "segments_info": segments_info,
+                }
+                writer.add_annotation(annotation)
+                writer.add_image(image_info)
 
 
 class CocoObjectDetectionStrategy(CocoBaseStrategy):
@@ -123,43 +137,25 @@ class CocoObjectDetectionStrategy(CocoBaseStrategy):
             self.export_root / "classes_mapper.json"
         )
 
-        images = []
-        annotations = []
-        id_generator = self._make_id_generator()
         annot_id_generator = self._make_id_generator()
-        jsons = self.make_anno_json_generator()
+        jsons = self.get_annotation_paths()
 
-        images_converted = []
-        images_not_converted = []
-        finish_event = threading.Event()
-        total_num = self.get_num_total_images()
-        tqdm_thread = threading.Thread(
-            target=tqdm_converter,
-            args=(total_num, images_converted, images_not_converted, finish_event),
-            daemon=True,
-        )
         logger.info("Converting to COCO JSON format")
-        tqdm_thread.start()
-        for json_ in jsons:
-            idx = next(annot_id_generator)
-            try:
-                images_converted.append(json_)
-                res = self._sa_to_coco_single(idx, json_, id_generator)
-            except Exception as e:
-                images_not_converted.append(json_)
-                raise
-
-            images.append(res[0])
-            if len(res[1]) < 1:
-                self.increase_converted_count()
-            for ann in res[1]:
-                annotations.append(ann)
-        out_json["annotations"] = annotations
-        out_json["images"] = images
-
-        write_to_json(self.output_dir / f"{self.dataset_name}.json", out_json)
-        finish_event.set()
-        tqdm_thread.join()
+        tasks = ((self, fpath, next(annot_id_generator)) for fpath in jsons)
+        last_annotation_id = 0
+        with CocoWriter(
+            self.output_dir / f"{self.dataset_name}.json", out_json
+        ) as writer:
+            for image_info, image_annotations, ids_count in ConversionRunner(
+                self.processing_workers
+            ).run(_image_to_coco, tasks, len(jsons)):
+                writer.add_image(image_info)
+                if len(image_annotations) < 1:
+                    self.increase_converted_count()
+                for ann in image_annotations:
+                    ann["id"] += last_annotation_id
+                    writer.add_annotation(ann)
+                last_annotation_id += ids_count
 
 
 class CocoKeypointDetectionStrategy(CocoBaseStrategy):
@@ -170,18 +166,17 @@ class CocoKeypointDetectionStrategy(CocoBaseStrategy):
         out_json = self._create_skeleton()
         jsons = self.make_anno_json_generator()
 
-        total_num = self.get_num_total_images()
         id_generator = self._make_id_generator()
         id_generator_anno = self._make_id_generator()
         id_generator_img = self._make_id_generator()
 
+        logger.info("Converting to COCO JSON format")
         res = self.conversion_algorithm(
             jsons,
             id_generator,
             id_generator_anno,
             id_generator_img,
             self._make_image_info,
-            total_num,
         )
 
         out_json["categories"] = res[0]
@@ -0,0 +1,294 @@
+"""
+Incremental reading and writing of COCO JSONs
+"""
+import json
+import os
+import re
+import shutil
+import sqlite3
+import tempfile
+from typing import Iterator
+from typing import List
+from typing import Tuple
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _JSONStream:
+    """
+    Decodes the values of a JSON file one by one, keeping only the undecoded part of a chunk in memory.
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, file):
+        self._file = file
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+
+    def _read(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._file.read(self.CHUNK_SIZE)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            self._position = _WHITESPACE.match(self._buffer, self._position).end()
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read():
+                raise ValueError("Unexpected end of the JSON file")
+
+    def expect(self, *characters) -> str:
+        character = self.peek()
+        if character not in characters:
+            raise ValueError(
+                f"Expected one of {characters} at {self._position}, got {character}"
+            )
+        self._position += 1
+        return character
+
+    def decode(self) -> Tuple[object, str]:
+        """
+        Returns the next value and its JSON text.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+                # a value ending with the buffer can be a cut number
+                if end < len(self._buffer) or self._eof:
+                    text = self._buffer[self._position : end]
+                    self._position = end
+                    return value, text
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._read()
+
+
+def _iter_coco_json(path) -> Iterator[Tuple[str, object, str, bool]]:
+    with open(path) as file:
+        stream = _JSONStream(file)
+        stream.expect("{")
+        if stream.peek() == "}":
+            return
+        while True:
+            key, _ = stream.decode()
+            stream.expect(":")
+            if stream.peek() == "[":
+                stream.expect("[")
+                if stream.peek() == "]":
+                    stream.expect("]")
+                else:
+                    while True:
+                        yield (key, *stream.decode(), True)
+                        if stream.expect(",", "]") == "]":
+                            break
+            else:
+                yield (key, *stream.decode(), False)
+            if stream.expect(",", "}") == "}":
+                return
+
+
+def iter_coco_json(path) -> Iterator[Tuple[str, object, bool]]:
+    """
+    Yields (key, value, False) for the top level values of a COCO JSON
+    and (key, item, True) for every item of its top level arrays, in the file order.
+    """
+    for key, value, _, is_item in _iter_coco_json(path):
+        yield key, value, is_item
+
+
+class CocoIndex:
+    """
+    Indexes the images and annotations of a COCO JSON by image id in a temporary SQLite database,
+    reading the file once, so only the annotations of one image are held in memory.
+
+    :param path: COCO JSON path
+    """
+
+    BATCH_SIZE = 10000
+
+    def __init__(self, path):
+        self.categories = []
+        self._temp_dir = tempfile.mkdtemp()
+        self._connection = sqlite3.connect(os.path.join(self._temp_dir, "index.db"))
+        self._connection.execute("PRAGMA journal_mode=OFF")
+        self._connection.execute("PRAGMA synchronous=OFF")
+        self._connection.execute("CREATE TABLE images (image_id TEXT, data TEXT)")
+        self._connection.execute(
+            "CREATE TABLE annotations (image_id TEXT, annotation_id, data TEXT)"
+        )
+        try:
+            self._build(path)
+        except BaseException:
+            self.close()
+            raise
+
+    def _build(self, path):
+        rows = {"images": [], "annotations": []}
+
+        def flush(key):
+            if key == "images":
+                query = "INSERT INTO images VALUES (?, ?)"
+            else:
+                query = "INSERT INTO annotations VALUES (?, ?, ?)"
+            self._connection.executemany(query, rows[key])
+            rows[key].clear()
+
+        with self._connection:
+            # the items are stored as their text in the file, without encoding them again
+            for key, value, text, is_item in _iter_coco_json(path):
+                if key == "categories":
+                    if is_item:
+                        self.categories.append(value)
+                elif key == "images" and is_item:
+                    rows[key].append((str(value["id"]), text))
+                elif key == "annotations" and is_item:
+                    rows[key].append((str(value["image_id"]), value.get("id"), text))
+                else:
+                    continue
+                if len(rows.get(key, ())) >= self.BATCH_SIZE:
+                    flush(key)
+            flush("images")
+            flush("annotations")
+            self._connection.execute(
+                "CREATE INDEX annotations_image_id ON annotations (image_id)"
+            )
+
+    def _count(self, table: str) -> int:
+        return self._connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    @property
+    def images_count(self) -> int:
+        return self._count("images")
+
+    @property
+    def annotations_count(self) -> int:
+        return self._count("annotations")
+
+    def get_annotations(self, image_id) -> List[dict]:
+        rows = self._connection.execute(
+            "SELECT data FROM annotations WHERE image_id = ? ORDER BY rowid",
+            (str(image_id),),
+        )
+        return [json.loads(data) for data, in rows]
+
+    def get_repeated_annotation_ids(self) -> dict:
+        """
+        Returns annotation id to count map of the ids shared by several annotations.
+        """
+        rows = self._connection.execute(
+            "SELECT annotation_id, COUNT(*) FROM annotations "
+            "WHERE annotation_id IS NOT NULL "
+            "GROUP BY annotation_id HAVING COUNT(*) > 1"
+        )
+        return dict(rows)
+
+    def iter_images(self) -> Iterator[Tuple[dict, List[dict]]]:
+        """
+        Yields the images in the file order with their annotations.
+        """
+        # a separate cursor, so the annotations can be queried while iterating
+        cursor = self._connection.cursor()
+        for (data,) in cursor.execute("SELECT data FROM images ORDER BY rowid"):
+            image = json.loads(data)
+            yield image, self.get_annotations(image["id"])
+
+    def close(self):
+        self._connection.close()
+        shutil.rmtree(self._temp_dir, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _indent(text: str, spaces: int) -> str:
+    return text.replace("\n", "\n" + " " * spaces)
+
+
+class CocoWriter:
+    """
+    Writes a COCO JSON with the items of the images and annotations arrays added one by one,
+    the annotations are kept in a temporary file until the images array is written.
+    The output is the same as of json.dump(out_json, indent=2).
+
+    :param path: COCO JSON path
+    :param out_json: the top level values in the output order, the images and annotations values are ignored
+    """
+
+    def __init__(self, path, out_json: dict):
+        self._out_json = out_json
+        self._keys = list(out_json.keys())
+        self._counts = {"images": 0, "annotations": 0}
+        self._file = open(path, "w")
+        self._annotations_file = tempfile.TemporaryFile("w+")
+        self._written_keys = 0
+        self._write_values_until("images")
+        self._write_key("images")
+
+    def _write_key(self, key):
+        self._file.write("{\n" if self._written_keys == 0 else ",\n")
+        self._file.write(f"  {json.dumps(key)}: ")
+        self._written_keys += 1
+
+    def _write_values_until(self, last_key: str = None):
+        while self._written_keys < len(self._keys):
+            key = self._keys[self._written_keys]
+            if key == last_key:
+                return
+            self._write_key(key)
+            if key == "annotations":
+                if self._counts[key]:
+                    self._annotations_file.seek(0)
+                    shutil.copyfileobj(self._annotations_file, self._file)
+                self._end_array(key)
+            else:
+                self._file.write(_indent(json.dumps(self._out_json[key], indent=2), 2))
+
+    def _end_array(self, key):
+        self._file.write("\n  ]" if self._counts[key] else "[]")
+
+    def _write_item(self, file, key, item):
+        file.write("[\n    " if self._counts[key] == 0 else ",\n    ")
+        file.write(_indent(json.dumps(item, indent=2), 4))
+        self._counts[key] += 1
+
+    def add_image(self, image: dict):
+        self._write_item(self._file, "images", image)
+
+    def add_annotation(self, annotation: dict):
+        self._write_item(self._annotations_file, "annotations", annotation)
+
+    def close(self, complete: bool = True):
+        """
+        Writes the values after the images and closes the file.
+
+        :param complete: write the rest of the JSON, the file is left as is if False
+        """
+        try:
+            if complete:
+                self._end_array("images")
+                self._write_values_until()
+                self._file.write("\n}")
+        finally:
+            self._file.close()
+            self._annotations_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close(complete=exc_type is None)
@@ -1,20 +1,19 @@
 """
 COCO to SA conversion methods
 """
-import json
 import logging
-import threading
 from pathlib import Path
 
 import cv2
 import numpy as np
 
-from ....common import tqdm_converter
 from ....common import write_to_json
+from ..runner import ConversionRunner
 from ..sa_json_helper import _create_sa_json
 from ..sa_json_helper import _create_vector_instance
 from .coco_api import _maskfrRLE
 from .coco_api import decode
+from .coco_stream import CocoIndex
 
 logger = logging.getLogger()
 
@@ -37,64 +36,42 @@ def annot_to_polygon(annot):
     return segments
 
 
-def save_sa_jsons(coco_json, img_id_to_annot, output_dir):
-    images_converted = []
-    finish_event = threading.Event()
-    tqdm_thread = threading.Thread(
-        target=tqdm_converter,
-        args=(len(coco_json["images"]), images_converted, [], finish_event),
-        daemon=True,
-    )
-    logger.info("Writting to disk")
-    tqdm_thread.start()
-    for img in coco_json["images"]:
-        if "file_name" in img:
-            image_path = Path(img["file_name"]).name
-        else:
-            image_path = img["coco_url"].split("/")[-1]
-
-        if str(img["id"]) not in img_id_to_annot:
-            sa_instances = []
-        else:
-            sa_instances = img_id_to_annot[str(img["id"])]
-        file_name = "%s___objects.json" % image_path
-
-        sa_metadata = {
-            "name": image_path,
-            "width": img["width"],
-            "height": img["height"],
-        }
-        json_template = _create_sa_json(sa_instances, sa_metadata)
-        write_to_json(output_dir / file_name, json_template)
-    finish_event.set()
-    tqdm_thread.join()
-
-
-def coco_instance_segmentation_to_sa_vector(coco_path, output_dir):
-    coco_json = json.load(open(coco_path))
-    cat_id_to_cat = {}
-    for cat in coco_json["categories"]:
-        cat_id_to_cat[cat["id"]] = cat
-
-    instance_groups = {}
-    for annot in coco_json["annotations"]:
-        if "id" in annot:
-            if annot["id"] in instance_groups:
-                instance_groups[annot["id"]] += 1
-            else:
-                instance_groups[annot["id"]] = 1
-
-    image_id_to_annotations = {}
-    annotations_processed = []
-    finish_event = threading.Event()
-    tqdm_thread = threading.Thread(
-        target=tqdm_converter,
-        args=(len(coco_json["annotations"]), annotations_processed, [], finish_event),
-        daemon=True,
-    )
+def _save_sa_json(img, sa_instances, output_dir):
+    if "file_name" in img:
+        image_path = Path(img["file_name"]).name
+    else:
+        image_path = img["coco_url"].split("/")[-1]
+    file_name = "%s___objects.json" % image_path
+
+    sa_metadata = {
+        "name": image_path,
+        "width": img["width"],
+        "height": img["height"],
+    }
+    json_template = _create_sa_json(sa_instances, sa_metadata)
+    write_to_json(output_dir / file_name, json_template)
+
+
+def save_sa_jsons(coco_index, image_to_sa, context, output_dir, processing_workers):
+    """
+    Converts the annotations of every image with the image_to_sa function
+    and writes the SuperAnnotate JSONs.
+    """
     logger.info("Converting to SuperAnnotate JSON format")
-    tqdm_thread.start()
-    for annot in coco_json["annotations"]:
+    tasks = (
+        (img, annotations, context, output_dir)
+        for img, annotations in coco_index.iter_images()
+    )
+    for _ in ConversionRunner(processing_workers).run(
+        image_to_sa, tasks, coco_index.images_count
+    ):
+        pass
+
+
+def _image_to_sa_instance_segmentation(img, annotations, context, output_dir):
+    cat_id_to_cat, instance_groups = context
+    sa_instances = []
+    for annot in annotations:
         if isinstance(annot["segmentation"], dict):
             annot["segmentation"] = annot_to_polygon(annot["segmentation"])
 
@@ -111,36 +88,33 @@ def coco_instance_segmentation_to_sa_vector(coco_path, output_dir):
             sa_obj = _create_vector_instance("polygon", polygon, {}, [], cat["name"])
             if groupid != 0:
                 sa_obj["groupId"] = groupid
+            sa_instances.append(sa_obj)
+    _save_sa_json(img, sa_instances, output_dir)
+
+
+def coco_instance_segmentation_to_sa_vector(
+    coco_path, output_dir, processing_workers=None
+):
+    with CocoIndex(coco_path) as coco_index:
+        cat_id_to_cat = {}
+        for cat in coco_index.categories:
+            cat_id_to_cat[cat["id"]] = cat
+
+        # only the grouped instances ids are sent to the tasks
+        instance_groups = coco_index.get_repeated_annotation_ids()
+
+        save_sa_jsons(
+            coco_index,
+            _image_to_sa_instance_segmentation,
+            (cat_id_to_cat, instance_groups),
+            output_dir,
+            processing_workers,
+        )
 
-            if str(annot["image_id"]) not in image_id_to_annotations:
-                image_id_to_annotations[str(annot["image_id"])] = [sa_obj]
-            else:
-                image_id_to_annotations[str(annot["image_id"])].append(sa_obj)
-        annotations_processed.append(annot)
-    finish_event.set()
-    tqdm_thread.join()
-    save_sa_jsons(coco_json, image_id_to_annotations, output_dir)
-
-
-def coco_object_detection_to_sa_vector(coco_path, output_dir):
-    coco_json = json.load(open(coco_path))
-    cat_id_to_cat = {}
-    for cat in coco_json["categories"]:
-        cat_id_to_cat[cat["id"]] = cat
-
-    image_id_to_annotations = {}
-    annotations_processed = []
-    finish_event = threading.Event()
-    tqdm_thread = threading.Thread(
-        target=tqdm_converter,
-        args=(len(coco_json["annotations"]), annotations_processed, [], finish_event),
-        daemon=True,
-    )
-    logger.info("Converting to SuperAnnotate JSON format")
-    tqdm_thread.start()
-    for annot in coco_json["annotations"]:
-        if isinstance(annot["segmentation"], dict):
-            annot["segmentation"] = annot_to_polygon(annot["segmentation"])
+
+def _image_to_sa_object_detection(img, annotations, cat_id_to_cat, output_dir):
+    sa_instances = []
+    for annot in annotations:
         cat = cat_id_to_cat[annot["category_id"]]
 
         points = (
@@ -151,40 +125,28 @@ def coco_object_detection_to_sa_vector(coco_path, output_dir):
         )
 
         sa_obj = _create_vector_instance("bbox", points, {}, [], cat["name"])
+        sa_instances.append(sa_obj)
+    _save_sa_json(img, sa_instances, output_dir)
+
+
+def coco_object_detection_to_sa_vector(coco_path, output_dir, processing_workers=None):
+    with CocoIndex(coco_path) as coco_index:
+        cat_id_to_cat = {}
+        for cat in coco_index.categories:
+            cat_id_to_cat[cat["id"]] = cat
+
+        save_sa_jsons(
+            coco_index,
+            _image_to_sa_object_detection,
+            cat_id_to_cat,
+            output_dir,
+            processing_workers,
+        )
 
-        if str(annot["image_id"]) not in image_id_to_annotations:
-            image_id_to_annotations[str(annot["image_id"])] = [sa_obj]
-        else:
-            image_id_to_annotations[str(annot["image_id"])].append(sa_obj)
-        annotations_processed.append(annot)
-    finish_event.set()
-    tqdm_thread.join()
-    save_sa_jsons(coco_json, image_id_to_annotations, output_dir)
-
-
-def coco_keypoint_detection_to_sa_vector(coco_path, output_dir):
-    coco_json = json.load(open(coco_path))
-
-    cat_id_to_cat = {}
-    for cat in coco_json["categories"]:
-        cat_id_to_cat[cat["id"]] = {
-            "name": cat["name"],
-            "keypoints": cat["keypoints"],
-            "skeleton": cat["skeleton"],
-            "supercategory": cat["supercategory"],
-        }
-
-    image_id_to_annotations = {}
-    annotations_processed = []
-    finish_event = threading.Event()
-    tqdm_thread = threading.Thread(
-        target=tqdm_converter,
-        args=(len(coco_json["annotations"]), annotations_processed, [], finish_event),
-        daemon=True,
-    )
-    logger.info("Converting to SuperAnnotate JSON format")
-    tqdm_thread.start()
-    for annot in coco_json["annotations"]:
+
+def _image_to_sa_keypoint_detection(img, annotations, cat_id_to_cat, output_dir):
+    sa_instances = []
+    for annot in annotations:
         if annot["num_keypoints"] > 0:
             sa_points = [
                 item
@@ -242,11 +204,27 @@ def coco_keypoint_detection_to_sa_vector(coco_path, output_dir):
                     connections,
                     template_name=cat_id_to_cat[annot["category_id"]]["name"],
                 )
-                if str(annot["image_id"]) not in image_id_to_annotations:
-                    image_id_to_annotations[str(annot["image_id"])] = [sa_obj]
-                else:
-                    image_id_to_annotations[str(annot["image_id"])].append(sa_obj)
-        annotations_processed.append(annot)
-    finish_event.set()
-    tqdm_thread.join()
-    save_sa_jsons(coco_json, image_id_to_annotations, output_dir)
+                sa_instances.append(sa_obj)
+    _save_sa_json(img, sa_instances, output_dir)
+
+
+def coco_keypoint_detection_to_sa_vector(
+    coco_path, output_dir, processing_workers=None
+):
+    with CocoIndex(coco_path) as coco_index:
+        cat_id_to_cat = {}
+        for cat in coco_index.categories:
+            cat_id_to_cat[cat["id"]] = {
+                "name": cat["name"],
+                "keypoints": cat["keypoints"],
+                "skeleton": cat["skeleton"],
+                "supercategory": cat["supercategory"],
+            }
+
+        save_sa_jsons(
+            coco_index,
+            _image_to_sa_keypoint_detection,
+            cat_id_to_cat,
+            output_dir,
+            processing_workers,
+        )
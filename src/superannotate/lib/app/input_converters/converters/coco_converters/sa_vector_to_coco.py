@@ -2,9 +2,7 @@
 SA to COCO conversion methods
 """
 import logging
-import threading
 
-from ....common import tqdm_converter
 from .coco_api import _area
 from .coco_api import _merge
 from .coco_api import _polytoMask
@@ -95,7 +93,7 @@ def sa_vector_to_coco_instance_segmentation(
 
 
 def sa_vector_to_coco_keypoint_detection(
-    jsons, id_generator, id_generator_anno, id_generator_img, make_image_info, total_num
+    jsons, id_generator, id_generator_anno, id_generator_img, make_image_info
 ):
     def __make_skeleton(template):
         res = [
@@ -145,16 +143,6 @@ def sa_vector_to_coco_keypoint_detection(
     annotations = []
     images = []
 
-    images_converted = []
-    images_not_converted = []
-    finish_event = threading.Event()
-    tqdm_thread = threading.Thread(
-        target=tqdm_converter,
-        args=(total_num, images_converted, images_not_converted, finish_event),
-        daemon=True,
-    )
-    logger.info("Converting to COCO JSON format")
-    tqdm_thread.start()
     for json_ in jsons:
         json_data = json_["instances"]
         for instance in json_data:
@@ -221,7 +209,4 @@ def sa_vector_to_coco_keypoint_detection(
                     instance, id_generator_anno, cat_id, image_info["id"]
                 )
                 annotations.append(annotation)
-        images_converted.append(json_data)
-    finish_event.set()
-    tqdm_thread.join()
     return (categories, annotations, images)
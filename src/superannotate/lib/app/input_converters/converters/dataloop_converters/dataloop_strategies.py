@@ -12,7 +12,10 @@ class DataLoopStrategy(baseStrategy):
 
     def to_sa_format(self):
         classes = self.conversion_algorithm(
-            self.export_root, self.task, self.output_dir
+            self.export_root,
+            self.task,
+            self.output_dir,
+            processing_workers=self.processing_workers,
         )
         sa_classes = self._create_sa_classes(classes)
         (self.output_dir / "classes").mkdir(exist_ok=True)
@@ -12,7 +12,9 @@ class GoogleCloudStrategy(baseStrategy):
 
     def to_sa_format(self):
         path = Path(self.export_root).joinpath(self.dataset_name + ".csv")
-        classes = self.conversion_algorithm(path, self.output_dir)
+        classes = self.conversion_algorithm(
+            path, self.output_dir, processing_workers=self.processing_workers
+        )
         sa_classes = self._create_classes(classes)
         (self.output_dir / "classes").mkdir(exist_ok=True)
         write_to_json(self.output_dir / "classes" / "classes.json", sa_classes)
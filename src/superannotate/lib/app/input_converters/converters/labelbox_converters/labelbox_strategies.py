@@ -11,10 +11,18 @@ class LabelBoxStrategy(baseStrategy):
     def to_sa_format(self):
         json_data = json.load(open(self.export_root / (self.dataset_name + ".json")))
         if self.project_type == "Vector":
-            classes = self.conversion_algorithm(json_data, self.output_dir, self.task)
+            classes = self.conversion_algorithm(
+                json_data,
+                self.output_dir,
+                self.task,
+                processing_workers=self.processing_workers,
+            )
         elif self.project_type == "Pixel":
             classes = self.conversion_algorithm(
-                json_data, self.output_dir, self.export_root
+                json_data,
+                self.output_dir,
+                self.export_root,
+                processing_workers=self.processing_workers,
             )
         sa_classes = self._create_classes(classes)
         (self.output_dir / "classes").mkdir(exist_ok=True)
@@ -0,0 +1,106 @@
+"""
+Runner of the per image tasks of the converters
+"""
+import math
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
+from itertools import islice
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+
+from tqdm import tqdm
+
+
+def _run_chunk(function, chunk):
+    return [function(*task) for task in chunk]
+
+
+class ConversionRunner:
+    """
+    Runs the per image tasks of a conversion, in the calling process or in a process pool,
+    and shows the conversion progress.
+
+    :param processing_workers: number of processes, the tasks are run in the calling process if not set
+    :param ordered: yield the results in the order of the tasks, in the completion order otherwise
+    :param chunk_size: maximum number of tasks sent to a process at once
+    """
+
+    def __init__(
+        self,
+        processing_workers: Optional[int] = None,
+        ordered: bool = True,
+        chunk_size: int = 16,
+    ):
+        self.processing_workers = processing_workers
+        self.ordered = ordered
+        self.chunk_size = chunk_size
+
+    def run(
+        self, function: Callable, tasks: Iterable[tuple], total: int = None
+    ) -> Iterator:
+        """
+        Yields the results of the function called with the arguments of every task.
+        The function and the arguments have to be picklable if the tasks are run in processes.
+        """
+        with tqdm(total=total) as progress_bar:
+            if not self.processing_workers or self.processing_workers < 2:
+                for task in tasks:
+                    result = function(*task)
+                    progress_bar.update(1)
+                    yield result
+                return
+            yield from self._run_in_processes(function, tasks, total, progress_bar)
+
+    def _get_chunk_size(self, total: Optional[int]) -> int:
+        if not total:
+            return self.chunk_size
+        # a few chunks per process to balance the load
+        return max(
+            1, min(self.chunk_size, math.ceil(total / (self.processing_workers * 4)))
+        )
+
+    def _run_in_processes(self, function, tasks, total, progress_bar):
+        chunk_size = self._get_chunk_size(total)
+        tasks = iter(tasks)
+        # tasks are submitted in a bounded window, so the results of a big dataset are not held in memory
+        max_pending = self.processing_workers * 2
+        with ProcessPoolExecutor(self.processing_workers) as executor:
+
+            def submit():
+                chunk = list(islice(tasks, chunk_size))
+                if not chunk:
+                    return None
+                return executor.submit(_run_chunk, function, chunk)
+
+            if self.ordered:
+                pending = deque()
+                while True:
+                    while len(pending) < max_pending:
+                        future = submit()
+                        if not future:
+                            break
+                        pending.append(future)
+                    if not pending:
+                        break
+                    results = pending.popleft().result()
+                    progress_bar.update(len(results))
+                    yield from results
+            else:
+                pending = set()
+                while True:
+                    while len(pending) < max_pending:
+                        future = submit()
+                        if not future:
+                            break
+                        pending.add(future)
+                    if not pending:
+                        break
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        results = future.result()
+                        progress_bar.update(len(results))
+                        yield from results
@@ -14,10 +14,17 @@ class SageMakerStrategy(baseStrategy):
             == "sagemaker_object_detection_to_sa_vector"
         ):
             classes = self.conversion_algorithm(
-                self.export_root, self.dataset_name, self.output_dir
+                self.export_root,
+                self.dataset_name,
+                self.output_dir,
+                processing_workers=self.processing_workers,
             )
         else:
-            classes = self.conversion_algorithm(self.export_root, self.output_dir)
+            classes = self.conversion_algorithm(
+                self.export_root,
+                self.output_dir,
+                processing_workers=self.processing_workers,
+            )
         sa_classes = self._create_classes(classes)
         (self.output_dir / "classes").mkdir(exist_ok=True)
         write_to_json(self.output_dir / "classes" / "classes.json", sa_classes)
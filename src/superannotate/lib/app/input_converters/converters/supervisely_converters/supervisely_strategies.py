@@ -25,18 +25,29 @@ class SuperviselyStrategy(baseStrategy):
         ):
             meta_json = json.load(open(self.export_root / "meta.json"))
             sa_jsons = self.conversion_algorithm(
-                json_files, classes_id_map, meta_json, self.output_dir
+                json_files,
+                classes_id_map,
+                meta_json,
+                self.output_dir,
+                processing_workers=self.processing_workers,
             )
         elif (
             self.conversion_algorithm.__name__
             == "supervisely_instance_segmentation_to_sa_pixel"
         ):
             sa_jsons = self.conversion_algorithm(
-                json_files, classes_id_map, self.output_dir
+                json_files,
+                classes_id_map,
+                self.output_dir,
+                processing_workers=self.processing_workers,
             )
         else:
             sa_jsons = self.conversion_algorithm(
-                json_files, classes_id_map, self.task, self.output_dir
+                json_files,
+                classes_id_map,
+                self.task,
+                self.output_dir,
+                processing_workers=self.processing_workers,
             )
         (self.output_dir / "classes").mkdir(exist_ok=True)
         write_to_json(self.output_dir / "classes" / "classes.json", sa_classes)
@@ -10,7 +10,12 @@ class VGGStrategy(baseStrategy):
 
     def to_sa_format(self):
         json_data = self.export_root / (self.dataset_name + ".json")
-        classes = self.conversion_algorithm(json_data, self.task, self.output_dir)
+        classes = self.conversion_algorithm(
+            json_data,
+            self.task,
+            self.output_dir,
+            processing_workers=self.processing_workers,
+        )
         sa_classes = self._create_classes(classes)
         (self.output_dir / "classes").mkdir(exist_ok=True)
         write_to_json(self.output_dir / "classes" / "classes.json", sa_classes)
@@ -3,12 +3,11 @@ VGG to SA conversion method.
 """
 import json
 import logging
-import threading
 
 import cv2
 
-from ....common import tqdm_converter
 from ....common import write_to_json
+from ..runner import ConversionRunner
 from ..sa_json_helper import _create_sa_json
 from ..sa_json_helper import _create_vector_instance
 from .vgg_helper import _create_attribute_list
@@ -16,7 +15,78 @@ from .vgg_helper import _create_attribute_list
 logger = logging.getLogger()
 
 
-def vgg_to_sa(json_data, task, output_dir):
+def _image_to_sa_vector(img, instances_attributes, instance_types, output_dir):
+    try:
+        H, W, _ = cv2.imread(str(output_dir / img["filename"])).shape
+    except Exception:
+        logger.warning(
+            "Can't open %s image. 'height' and 'width' for SA JSON metadata will set to zero",
+            img["filename"],
+        )
+        H = 0
+        W = 0
+
+    file_name = "%s___objects.json" % img["filename"]
+    sa_metadata = {"name": img["filename"], "width": W, "height": H}
+    sa_instances = []
+    for instance, attributes in zip(img["regions"], instances_attributes):
+        class_name = instance["region_attributes"]["type"]
+        if instance["shape_attributes"]["name"] in instance_types:
+            if (
+                instance["shape_attributes"]["name"] == "polygon"
+                or instance["shape_attributes"]["name"] == "polyline"
+            ):
+                points = []
+                for x, y in zip(
+                    instance["shape_attributes"]["all_points_x"],
+                    instance["shape_attributes"]["all_points_y"],
+                ):
+                    points.append(x)
+                    points.append(y)
+                instance_type = instance["shape_attributes"]["name"]
+            elif instance["shape_attributes"]["name"] == "rect":
+                points = (
+                    instance["shape_attributes"]["x"],
+                    instance["shape_attributes"]["y"],
+                    instance["shape_attributes"]["x"]
+                    + instance["shape_attributes"]["width"],
+                    instance["shape_attributes"]["y"]
+                    + instance["shape_attributes"]["height"],
+                )
+                instance_type = "bbox"
+            elif instance["shape_attributes"]["name"] == "ellipse":
+                points = (
+                    instance["shape_attributes"]["cx"],
+                    instance["shape_attributes"]["cy"],
+                    instance["shape_attributes"]["rx"],
+                    instance["shape_attributes"]["ry"],
+                    instance["shape_attributes"]["theta"],
+                )
+                instance_type = "ellipse"
+            elif instance["shape_attributes"]["name"] == "circle":
+                points = (
+                    instance["shape_attributes"]["cx"],
+                    instance["shape_attributes"]["cy"],
+                    instance["shape_attributes"]["r"],
+                    instance["shape_attributes"]["r"],
+                    0,
+                )
+                instance_type = "ellipse"
+            elif instance["shape_attributes"]["name"] == "point":
+                points = (
+                    instance["shape_attributes"]["cx"],
+                    instance["shape_attributes"]["cy"],
+                )
+                instance_type = "point"
+            sa_obj = _create_vector_instance(
+                instance_type, points, {}, attributes, class_name
+            )
+            sa_instances.append(sa_obj)
+    sa_json = _create_sa_json(sa_instances, sa_metadata)
+    write_to_json(output_dir / file_name, sa_json)
+
+
+def vgg_to_sa(json_data, task, output_dir, processing_workers=None):
     images = json.load(open(json_data))
     if task == "object_detection":
         instance_types = ["rect"]
@@ -25,39 +95,13 @@ def vgg_to_sa(json_data, task, output_dir):
     elif task == "vector_annotation":
         instance_types = ["rect", "polygon", "polyline", "point", "ellipse", "circle"]
 
-    images_converted = []
-    images_not_converted = []
-    finish_event = threading.Event()
-    tqdm_thread = threading.Thread(
-        target=tqdm_converter,
-        args=(
-            len(images.items()),
-            images_converted,
-            images_not_converted,
-            finish_event,
-        ),
-        daemon=True,
-    )
-    logger.info("Converting to SuperAnnotate JSON format")
-    tqdm_thread.start()
-
+    # the attribute groups are collected in the image order,
+    # the attributes of an instance depend on the groups of the previous instances
     class_id_map = {}
+    images_attributes = []
     for _, img in images.items():
-        try:
-            H, W, _ = cv2.imread(str(output_dir / img["filename"])).shape
-        except Exception:
-            logger.warning(
-                "Can't open %s image. 'height' and 'width' for SA JSON metadata will set to zero",
-                img["filename"],
-            )
-            H = 0
-            W = 0
-
-        file_name = "%s___objects.json" % img["filename"]
-        sa_metadata = {"name": img["filename"], "width": W, "height": H}
-        sa_instances = []
-        instances = img["regions"]
-        for instance in instances:
+        instances_attributes = []
+        for instance in img["regions"]:
             if "type" not in instance["region_attributes"].keys():
                 raise KeyError(
                     "'VGG' JSON should contain 'type' key which will \
@@ -70,64 +114,20 @@ def vgg_to_sa(json_data, task, output_dir):
             if class_name not in class_id_map.keys():
                 class_id_map[class_name] = {"attribute_groups": {}}
 
-            attributes = _create_attribute_list(
-                instance["region_attributes"], class_name, class_id_map
+            instances_attributes.append(
+                _create_attribute_list(
+                    instance["region_attributes"], class_name, class_id_map
+                )
             )
+        images_attributes.append(instances_attributes)
 
-            if instance["shape_attributes"]["name"] in instance_types:
-                if (
-                    instance["shape_attributes"]["name"] == "polygon"
-                    or instance["shape_attributes"]["name"] == "polyline"
-                ):
-                    points = []
-                    for x, y in zip(
-                        instance["shape_attributes"]["all_points_x"],
-                        instance["shape_attributes"]["all_points_y"],
-                    ):
-                        points.append(x)
-                        points.append(y)
-                    instance_type = instance["shape_attributes"]["name"]
-                elif instance["shape_attributes"]["name"] == "rect":
-                    points = (
-                        instance["shape_attributes"]["x"],
-                        instance["shape_attributes"]["y"],
-                        instance["shape_attributes"]["x"]
-                        + instance["shape_attributes"]["width"],
-                        instance["shape_attributes"]["y"]
-                        + instance["shape_attributes"]["height"],
-                    )
-                    instance_type = "bbox"
-                elif instance["shape_attributes"]["name"] == "ellipse":
-                    points = (
-                        instance["shape_attributes"]["cx"],
-                        instance["shape_attributes"]["cy"],
-                        instance["shape_attributes"]["rx"],
-                        instance["shape_attributes"]["ry"],
-                        instance["shape_attributes"]["theta"],
-                    )
-                    instance_type = "ellipse"
-                elif instance["shape_attributes"]["name"] == "circle":
-                    points = (
-                        instance["shape_attributes"]["cx"],
-                        instance["shape_attributes"]["cy"],
-                        instance["shape_attributes"]["r"],
-                        instance["shape_attributes"]["r"],
-                        0,
-                    )
-                    instance_type = "ellipse"
-                elif instance["shape_attributes"]["name"] == "point":
-                    points = (
-                        instance["shape_attributes"]["cx"],
-                        instance["shape_attributes"]["cy"],
-                    )
-                    instance_type = "point"
-                sa_obj = _create_vector_instance(
-                    instance_type, points, {}, attributes, class_name
-                )
-                sa_instances.append(sa_obj)
-        images_converted.append(img["filename"])
-        sa_json = _create_sa_json(sa_instances, sa_metadata)
-        write_to_json(output_dir / file_name, sa_json)
-    finish_event.set()
-    tqdm_thread.join()
+    logger.info("Converting to SuperAnnotate JSON format")
+    tasks = (
+        (img, instances_attributes, instance_types, output_dir)
+        for img, instances_attributes in zip(images.values(), images_attributes)
+    )
+    for _ in ConversionRunner(processing_workers).run(
+        _image_to_sa_vector, tasks, len(images)
+    ):
+        pass
     return class_id_map
@@ -2,13 +2,12 @@
 VOC to SA conversion method
 """
 import logging
-import threading
 
 import cv2
 import numpy as np
 
-from ....common import tqdm_converter
 from ....common import write_to_json
+from ..runner import ConversionRunner
 from ..sa_json_helper import _create_sa_json
 from ..sa_json_helper import _create_vector_instance
 from .voc_helper import _get_image_shape_from_xml
@@ -79,7 +78,35 @@ def _generate_instances(polygon_instances, voc_instances):
     return instances
 
 
-def voc_instance_segmentation_to_sa_vector(voc_root, output_dir):
+def _instance_segmentation_to_sa_vector(
+    filename, object_masks_dir, annotation_dir, output_dir
+):
+    polygon_instances = _generate_polygons(object_masks_dir / filename.name)
+    voc_instances = _get_voc_instances_from_xml(annotation_dir / filename.name)
+
+    maped_instances = _generate_instances(polygon_instances, voc_instances)
+    sa_instances = []
+    for instance in maped_instances:
+        sa_obj = _create_vector_instance(
+            "polygon",
+            instance["polygon"],
+            {},
+            instance["classAttributes"],
+            instance["className"],
+        )
+        sa_instances.append(sa_obj)
+
+    file_name = "%s.jpg___objects.json" % filename.stem
+    height, width = _get_image_shape_from_xml(annotation_dir / filename.name)
+    sa_metadata = {"name": filename.stem, "height": height, "width": width}
+    sa_json = _create_sa_json(sa_instances, sa_metadata)
+    write_to_json(output_dir / file_name, sa_json)
+    return [class_ for class_, _ in voc_instances]
+
+
+def voc_instance_segmentation_to_sa_vector(
+    voc_root, output_dir, processing_workers=None
+):
     classes = []
     object_masks_dir = voc_root / "SegmentationObject"
     annotation_dir = voc_root / "Annotations"
@@ -89,84 +116,49 @@ def voc_instance_segmentation_to_sa_vector(voc_root, output_dir):
             "You need to have both 'Annotations' and 'SegmentationObject' directories to be able to convert."
         )
 
-    images_converted = []
-    images_not_converted = []
-    finish_event = threading.Event()
-    tqdm_thread = threading.Thread(
-        target=tqdm_converter,
-        args=(len(file_list), images_converted, images_not_converted, finish_event),
-        daemon=True,
-    )
     logger.info("Converting to SuperAnnotate JSON format")
-    tqdm_thread.start()
-    for filename in file_list:
-        polygon_instances = _generate_polygons(object_masks_dir / filename.name)
-        voc_instances = _get_voc_instances_from_xml(annotation_dir / filename.name)
-        for class_, _ in voc_instances:
-            classes.append(class_)
-
-        maped_instances = _generate_instances(polygon_instances, voc_instances)
-        sa_instances = []
-        for instance in maped_instances:
-            sa_obj = _create_vector_instance(
-                "polygon",
-                instance["polygon"],
-                {},
-                instance["classAttributes"],
-                instance["className"],
-            )
-            sa_instances.append(sa_obj)
+    tasks = (
+        (filename, object_masks_dir, annotation_dir, output_dir)
+        for filename in file_list
+    )
+    for image_classes in ConversionRunner(processing_workers).run(
+        _instance_segmentation_to_sa_vector, tasks, len(file_list)
+    ):
+        classes.extend(image_classes)
+    return classes
 
-        images_converted.append(filename)
-        file_name = "%s.jpg___objects.json" % filename.stem
-        height, width = _get_image_shape_from_xml(annotation_dir / filename.name)
-        sa_metadata = {"name": filename.stem, "height": height, "width": width}
-        sa_json = _create_sa_json(sa_instances, sa_metadata)
-        write_to_json(output_dir / file_name, sa_json)
 
-    finish_event.set()
-    tqdm_thread.join()
-    return classes
+def _object_detection_to_sa_vector(filename, annotation_dir, output_dir):
+    voc_instances = _get_voc_instances_from_xml(annotation_dir / filename.name)
+    sa_instances = []
+    for class_, bbox in voc_instances:
+        class_name = list(class_.keys())[0]
+
+        points = (bbox[0], bbox[1], bbox[2], bbox[3])
+        sa_obj = _create_vector_instance(
+            "bbox", points, {}, class_[class_name], class_name
+        )
+        sa_instances.append(sa_obj)
+
+    file_name = "%s.jpg___objects.json" % filename.stem
+    height, width = _get_image_shape_from_xml(annotation_dir / filename.name)
+    sa_metadata = {"name": filename.stem, "height": height, "width": width}
+    sa_json = _create_sa_json(sa_instances, sa_metadata)
+    write_to_json(output_dir / file_name, sa_json)
+    return [class_ for class_, _ in voc_instances]
 
 
-def voc_object_detection_to_sa_vector(voc_root, output_dir):
+def voc_object_detection_to_sa_vector(voc_root, output_dir, processing_workers=None):
     classes = []
     annotation_dir = voc_root / "Annotations"
     file_list = list(annotation_dir.glob("*"))
     if not file_list:
         logger.warning("'Annotations' directory is empty")
 
-    images_converted = []
-    images_not_converted = []
-    finish_event = threading.Event()
-    tqdm_thread = threading.Thread(
-        target=tqdm_converter,
-        args=(len(file_list), images_converted, images_not_converted, finish_event),
-        daemon=True,
-    )
     logger.info("Converting to SuperAnnotate JSON format")
-    tqdm_thread.start()
-
-    for filename in file_list:
-        voc_instances = _get_voc_instances_from_xml(annotation_dir / filename.name)
-        sa_instances = []
-        for class_, bbox in voc_instances:
-            class_name = list(class_.keys())[0]
-            classes.append(class_)
-
-            points = (bbox[0], bbox[1], bbox[2], bbox[3])
-            sa_obj = _create_vector_instance(
-                "bbox", points, {}, class_[class_name], class_name
-            )
-            sa_instances.append(sa_obj)
-
-        images_converted.append(filename)
-        file_name = "%s.jpg___objects.json" % filename.stem
-        height, width = _get_image_shape_from_xml(annotation_dir / filename.name)
-        sa_metadata = {"name": filename.stem, "height": height, "width": width}
-        sa_json = _create_sa_json(sa_instances, sa_metadata)
-        write_to_json(output_dir / file_name, sa_json)
-
-    finish_event.set()
-    tqdm_thread.join()
+    tasks = ((filename, annotation_dir, output_dir) for filename in file_list)
+    for image_classes in ConversionRunner(processing_workers).run(
+        _object_detection_to_sa_vector, tasks, len(file_list)
+    ):
+        classes.extend(image_classes)
     return classes
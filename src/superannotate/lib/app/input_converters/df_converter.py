@@ -1,12 +1,26 @@
+import concurrent.futures
+import itertools
 import json
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 from superannotate.lib.app.mixp.decorators import Trackable
 
 
+def _column_values(df, column):
+    if column not in df:
+        return itertools.repeat(None, len(df))
+    return df[column].tolist()
+
+
+def _write_json(path, data):
+    with open(path, "w") as file:
+        file.write(json.dumps(data, indent=4))
+
+
 @Trackable
-def df_to_annotations(df, output_dir):
+def df_to_annotations(df, output_dir, writing_workers=None):
     """Converts and saves pandas DataFrame annotation info (see aggregate_annotations_as_df)
     in output_dir.
     The DataFrame should have columns: "imageName", "className", "attributeGroupName",
@@ -19,118 +33,195 @@ def df_to_annotations(df, output_dir):
     :type df: pandas.DataFrame
     :param output_dir: output dir for annotations and classes.json
     :type output_dir: str or Pathlike
+    :param writing_workers: number of threads writing the annotation files
+    :type writing_workers: int
 
     """
     output_dir = Path(output_dir)
 
     project_suffix = "objects.json"
-    images = df["imageName"].dropna().unique()
-    for image in images:
-        image_status = None
-        image_pinned = None
-        image_height = None
-        image_width = None
-        image_df = df[df["imageName"] == image]
-        image_annotation = {"instances": [], "metadata": {}, "tags": [], "comments": []}
-        instances = image_df["instanceId"].dropna().unique()
-        for instance in instances:
-            instance_df = image_df[image_df["instanceId"] == instance]
-            annotation_type = instance_df.iloc[0]["type"]
-            annotation_meta = instance_df.iloc[0]["meta"]
-
-            instance_annotation = {
-                "className": instance_df.iloc[0]["className"],
-                "type": annotation_type,
-                "attributes": [],
-                "probability": instance_df.iloc[0]["probability"],
-                "error": instance_df.iloc[0]["error"],
+    images_annotations = {}
+    images_metadata = {}
+    # instance annotations by image name and instance id, built from the first row of every instance
+    images_instances = {}
+    rows = zip(
+        df["imageName"].notna().tolist(),
+        df["instanceId"].notna().tolist(),
+        df["attributeGroupName"].notna().tolist(),
+        *(
+            _column_values(df, column)
+            for column in (
+                "imageName",
+                "instanceId",
+                "type",
+                "meta",
+                "className",
+                "probability",
+                "error",
+                "pointLabels",
+                "locked",
+                "visible",
+                "trackingId",
+                "groupId",
+                "attributeGroupName",
+                "attributeName",
+                "imageWidth",
+                "imageHeight",
+                "imagePinned",
+                "imageStatus",
+                "commentResolved",
+                "tag",
+            )
+        ),
+    )
+    for (
+        has_image,
+        has_instance,
+        has_attribute,
+        image,
+        instance_id,
+        annotation_type,
+        annotation_meta,
+        class_name,
+        probability,
+        error,
+        point_labels,
+        locked,
+        visible,
+        tracking_id,
+        group_id,
+        attribute_group_name,
+        attribute_name,
+        image_width,
+        image_height,
+        image_pinned,
+        image_status,
+        comment_resolved,
+        tag,
+    ) in rows:
+        if not has_image:
+            continue
+        image_annotation = images_annotations.get(image)
+        if image_annotation is None:
+            image_annotation = {
+                "instances": [],
+                "metadata": {},
+                "tags": [],
+                "comments": [],
             }
-            point_labels = instance_df.iloc[0]["pointLabels"]
-            if point_labels is None:
-                point_labels = []
-            instance_annotation["pointLabels"] = point_labels
-            instance_annotation["locked"] = bool(instance_df.iloc[0]["locked"])
-            instance_annotation["visible"] = bool(instance_df.iloc[0]["visible"])
-            instance_annotation["trackingId"] = instance_df.iloc[0]["trackingId"]
-            instance_annotation["groupId"] = int(instance_df.iloc[0]["groupId"])
-            instance_annotation.update(annotation_meta)
-            for _, row in instance_df.iterrows():
-                if row["attributeGroupName"] is not None:
-                    instance_annotation["attributes"].append(
-                        {
-                            "groupName": row["attributeGroupName"],
-                            "name": row["attributeName"],
-                        }
-                    )
-            image_annotation["instances"].append(instance_annotation)
-            image_width = image_width or instance_df.iloc[0]["imageWidth"]
-            image_height = image_height or instance_df.iloc[0]["imageHeight"]
-            image_pinned = image_pinned or instance_df.iloc[0]["imagePinned"]
-            image_status = image_status or instance_df.iloc[0]["imageStatus"]
-
-        comments = image_df[image_df["type"] == "comment"]
-        for _, comment in comments.iterrows():
+            images_annotations[image] = image_annotation
+            images_metadata[image] = [None, None, None, None]
+            images_instances[image] = {}
+        if has_instance:
+            instance_annotation = images_instances[image].get(instance_id)
+            if instance_annotation is None:
+                instance_annotation = {
+                    "className": class_name,
+                    "type": annotation_type,
+                    "attributes": [],
+                    "probability": probability,
+                    "error": error,
+                    "pointLabels": point_labels if point_labels is not None else [],
+                    "locked": bool(locked),
+                    "visible": bool(visible),
+                    "trackingId": tracking_id,
+                    "groupId": int(group_id),
+                }
+                instance_annotation.update(annotation_meta)
+                images_instances[image][instance_id] = instance_annotation
+                image_annotation["instances"].append(instance_annotation)
+                metadata = images_metadata[image]
+                for i, value in enumerate(
+                    (image_width, image_height, image_pinned, image_status)
+                ):
+                    metadata[i] = metadata[i] or value
+            if has_attribute:
+                instance_annotation["attributes"].append(
+                    {"groupName": attribute_group_name, "name": attribute_name}
+                )
+        if annotation_type == "comment":
             comment_json = {}
-            comment_json.update(comment["meta"])
+            comment_json.update(annotation_meta)
             comment_json["correspondence"] = comment_json["comments"]
             del comment_json["comments"]
-            comment_json["resolved"] = comment["commentResolved"]
+            comment_json["resolved"] = comment_resolved
             image_annotation["comments"].append(comment_json)
+        elif annotation_type == "tag":
+            image_annotation["tags"].append(tag)
 
-        tags = image_df[image_df["type"] == "tag"]
-        for _, tag in tags.iterrows():
-            image_annotation["tags"].append(tag["tag"])
-
+    for image, image_annotation in images_annotations.items():
+        image_width, image_height, image_pinned, image_status = images_metadata[image]
         image_annotation["metadata"] = {
             "width": int(image_width),
             "height": int(image_height),
             "status": image_status,
             "pinned": bool(image_pinned),
         }
-        json.dump(
-            image_annotation,
-            open(output_dir / f"{image}___{project_suffix}", "w"),
-            indent=4,
-        )
-
-    annotation_classes = []
-    for _, row in df.iterrows():
-        if row["className"] is None:
-            continue
-        for annotation_class in annotation_classes:
-            if annotation_class["name"] == row["className"]:
-                break
-        else:
-            annotation_classes.append(
-                {
-                    "name": row["className"],
-                    "color": row["classColor"],
-                    "attribute_groups": [],
-                }
+    with concurrent.futures.ThreadPoolExecutor(max_workers=writing_workers) as executor:
+        for future in [
+            executor.submit(
+                _write_json,
+                output_dir / f"{image}___{project_suffix}",
+                image_annotation,
             )
-            annotation_class = annotation_classes[-1]
-        if row["attributeGroupName"] is None or row["attributeName"] is None:
+            for image, image_annotation in images_annotations.items()
+        ]:
+            future.result()
+
+    annotation_classes = {}
+    # the rows of the same class and attribute add nothing to classes.json
+    classes_df = df[
+        ["className", "classColor", "attributeGroupName", "attributeName"]
+    ].drop_duplicates()
+    classes_df = classes_df[classes_df["className"].notna()]
+    for class_name, class_color, attribute_group_name, attribute_name in zip(
+        *(classes_df[column].tolist() for column in classes_df.columns)
+    ):
+        annotation_class = annotation_classes.get(class_name)
+        if annotation_class is None:
+            annotation_class = annotation_classes[class_name] = {
+                "name": class_name,
+                "color": class_color,
+                "attribute_groups": {},
+            }
+        if pd.isna(attribute_group_name) or pd.isna(attribute_name):
             continue
+        attribute_group = annotation_class["attribute_groups"].setdefault(
+            attribute_group_name, {"name": attribute_group_name, "attributes": {}}
+        )
+        attribute_group["attributes"].setdefault(
+            attribute_name, {"name": attribute_name}
+        )
+    for annotation_class in annotation_classes.values():
+        annotation_class["attribute_groups"] = list(
+            annotation_class["attribute_groups"].values()
+        )
         for attribute_group in annotation_class["attribute_groups"]:
-            if attribute_group["name"] == row["attributeGroupName"]:
-                break
-        else:
-            annotation_class["attribute_groups"].append(
-                {"name": row["attributeGroupName"], "attributes": []}
-            )
-            attribute_group = annotation_class["attribute_groups"][-1]
-        for attribute in attribute_group["attributes"]:
-            if attribute["name"] == row["attributeName"]:
-                break
-        else:
-            attribute_group["attributes"].append({"name": row["attributeName"]})
+            attribute_group["attributes"] = list(attribute_group["attributes"].values())
 
     Path(output_dir / "classes").mkdir(exist_ok=True)
-    json.dump(
-        annotation_classes, open(output_dir / "classes" / "classes.json", "w"), indent=4
+    _write_json(
+        output_dir / "classes" / "classes.json", list(annotation_classes.values())
     )
 
 
+def _get_rule_mask(df, rule):
+    mask = np.ones(len(df), dtype=bool)
+    if "className" in rule:
+        mask &= (df["className"] == rule["className"]).values
+    if "attributes" in rule:
+        for attribute in rule["attributes"]:
+            mask &= (
+                (df["attributeGroupName"] == attribute["groupName"])
+                & (df["attributeName"] == attribute["name"])
+            ).values
+    if "type" in rule:
+        mask &= (df["type"] == rule["type"]).values
+    if "error" in rule:
+        mask &= (df["error"] == rule["error"]).values
+    return mask
+
+
 @Trackable
 def filter_annotation_instances(annotations_df, include=None, exclude=None):
     """Filter annotation instances from project annotations pandas DataFrame.
@@ -152,49 +243,25 @@ def filter_annotation_instances(annotations_df, include=None, exclude=None):
     :rtype: pandas.DataFrame
 
     """
-    df = annotations_df.drop(["meta", "pointLabels"], axis=1)
+    positions = np.arange(len(annotations_df))
 
     if include is not None:
-        included_dfs = []
-        for include_rule in include:
-            df_new = df.copy()
-            if "className" in include_rule:
-                df_new = df_new[df_new["className"] == include_rule["className"]]
-            if "attributes" in include_rule:
-                for attribute in include_rule["attributes"]:
-                    df_new = df_new[
-                        (df_new["attributeGroupName"] == attribute["groupName"])
-                        & (df_new["attributeName"] == attribute["name"])
-                    ]
-            if "type" in include_rule:
-                df_new = df_new[df_new["type"] == include_rule["type"]]
-            if "error" in include_rule:
-                df_new = df_new[df_new["error"] == include_rule["error"]]
-            included_dfs.append(df_new)
-
-        df = pd.concat(included_dfs)
+        positions = np.concatenate(
+            [
+                np.flatnonzero(_get_rule_mask(annotations_df, include_rule))
+                for include_rule in include
+            ]
+            or [positions[:0]]
+        )
 
     if exclude is not None:
+        excluded = np.zeros(len(annotations_df), dtype=bool)
         for exclude_rule in exclude:
-            df_new = df.copy()
-            # with pd.option_context('display.max_rows', None):
-            #     print("#", df_new["className"])
-            if "className" in exclude_rule:
-                df_new = df_new[df_new["className"] == exclude_rule["className"]]
-            if "attributes" in exclude_rule:
-                for attribute in exclude_rule["attributes"]:
-                    df_new = df_new[
-                        (df_new["attributeGroup"] == attribute["groupName"])
-                        & (df_new["attributeName"] == attribute["name"])
-                    ]
-            if "type" in exclude_rule:
-                df_new = df_new[df_new["type"] == exclude_rule["type"]]
-            if "error" in exclude_rule:
-                df_new = df_new[df_new["error"] == exclude_rule["error"]]
-
-            df = df.drop(df_new.index)
-
-    result = annotations_df.loc[df.index]
+            excluded |= _get_rule_mask(annotations_df, exclude_rule)
+        excluded_index = annotations_df.index[positions[excluded[positions]]]
+        positions = positions[~annotations_df.index[positions].isin(excluded_index)]
+
+    result = annotations_df.loc[annotations_df.index[positions]]
     return result
 
 
@@ -13,6 +13,7 @@ from lib.core import DEPRICATED_DOCUMENT_VIDEO_MESSAGE
 from ..common import blue_color_generator
 from ..common import hex_to_rgb
 from ..common import write_to_json
+from .converters.runner import ConversionRunner
 
 logger = logging.getLogger()
 
@@ -21,154 +22,207 @@ def copy_file(src_path, dst_path):
     shutil.copy(src_path, dst_path)
 
 
-def from_pixel_to_vector(json_paths, output_dir):
-    img_names = []
-    for json_path in json_paths:
-        file_name = str(json_path.name).replace("___pixel.json", "___objects.json")
-
-        mask_name = str(json_path).replace("___pixel.json", "___save.png")
-        img = cv2.imread(mask_name)
-        H, W, _ = img.shape
-
-        sa_json = json.load(open(json_path))
-        instances = sa_json["instances"]
-        idx = 0
-        sa_instances = []
-        for instance in instances:
-            if "parts" not in instance.keys():
-                if "type" in instance.keys() and instance["type"] == "meta":
-                    sa_instances.append(instance)
-                continue
-
-            parts = instance["parts"]
-
-            polygons = []
-            for part in parts:
-                color = list(hex_to_rgb(part["color"]))
-                mask = np.zeros((H, W), dtype=np.uint8)
-                mask[np.all((img == color[::-1]), axis=2)] = 255
-                contours, _ = cv2.findContours(
-                    mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
-                )
-                part_polygons = []
-                for contour in contours:
-                    segment = contour.flatten().tolist()
-                    if len(segment) > 6:
-                        part_polygons.append(segment)
-                polygons.append(part_polygons)
-
-            for part_polygons in polygons:
-                if len(part_polygons) > 1:
-                    idx += 1
-                    group_id = idx
-                else:
-                    group_id = 0
-
-                for polygon in part_polygons:
-                    temp = instance.copy()
-                    del temp["parts"]
-                    temp["pointLabels"] = {}
-                    temp["groupId"] = group_id
-                    temp["type"] = "polygon"
-                    temp["points"] = polygon
-                    sa_instances.append(temp.copy())
-                    temp["type"] = "bbox"
-                    temp["points"] = {
-                        "x1": min(polygon[::2]),
-                        "x2": max(polygon[::2]),
-                        "y1": min(polygon[1::2]),
-                        "y2": max(polygon[1::2]),
-                    }
-                    sa_instances.append(temp.copy())
-
-        sa_json["instances"] = sa_instances
-        write_to_json(output_dir / file_name, sa_json)
-        img_names.append(file_name.replace("___objects.json", ""))
-    return img_names
-
-
-def from_vector_to_pixel(json_paths, output_dir):
-    img_names = []
-    for json_path in json_paths:
-        file_name = str(json_path.name).replace("___objects.json", "___pixel.json")
-
-        img_name = str(json_path).replace("___objects.json", "")
-        img = cv2.imread(img_name)
-        H, W, _ = img.shape
-
-        sa_json = json.load(open(json_path))
-        instances = sa_json["instances"]
-        mask = np.zeros((H, W, 4))
-
-        sa_instances = []
-        blue_colors = blue_color_generator(len(instances))
-        instances_group = {}
-        for idx, instance in enumerate(instances):
-            if instance["type"] == "polygon":
-                if instance["groupId"] in instances_group.keys():
-                    instances_group[instance["groupId"]].append(instance)
-                else:
-                    instances_group[instance["groupId"]] = [instance]
-            elif instance["type"] == "meta":
+def _color_regions(img):
+    """
+    Returns the bounds (top, bottom, left, right) of every non black color of the BGR mask,
+    the colors are packed to the 0xRRGGBB integers.
+    """
+    H, W, _ = img.shape
+    packed = (
+        (img[:, :, 2].astype(np.uint32) << 16)
+        | (img[:, :, 1].astype(np.uint32) << 8)
+        | img[:, :, 0]
+    ).ravel()
+    positions = np.flatnonzero(packed)
+    colors = packed[positions]
+    # the stable sort keeps the positions of a color in the raster order
+    order = np.argsort(colors, kind="stable")
+    colors = colors[order]
+    positions = positions[order]
+    starts = np.flatnonzero(np.diff(colors, prepend=np.uint32(0)))
+    ends = np.append(starts[1:], len(colors))
+    columns = positions % W
+    regions = {}
+    for start, end in zip(starts, ends):
+        regions[int(colors[start])] = (
+            int(positions[start] // W),
+            int(positions[end - 1] // W),
+            int(columns[start:end].min()),
+            int(columns[start:end].max()),
+        )
+    return packed.reshape((H, W)), regions
+
+
+def _color_polygons(packed, regions, color):
+    H, W = packed.shape
+    if color == 0:
+        # the black color isn't indexed, its region is the whole mask
+        regions = {0: (0, H - 1, 0, W - 1)}
+    if color not in regions:
+        return []
+    top, bottom, left, right = regions[color]
+    # the region is extended by a pixel, so the contours are found as in the whole mask
+    top, left = max(top - 1, 0), max(left - 1, 0)
+    bottom, right = min(bottom + 2, H), min(right + 2, W)
+    mask = np.zeros((bottom - top, right - left), dtype=np.uint8)
+    mask[packed[top:bottom, left:right] == color] = 255
+    contours, _ = cv2.findContours(
+        mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE, offset=(left, top)
+    )
+    polygons = []
+    for contour in contours:
+        segment = contour.flatten().tolist()
+        if len(segment) > 6:
+            polygons.append(segment)
+    return polygons
+
+
+def _pixel_to_vector(json_path, output_dir):
+    file_name = str(json_path.name).replace("___pixel.json", "___objects.json")
+
+    mask_name = str(json_path).replace("___pixel.json", "___save.png")
+    img = cv2.imread(mask_name)
+    packed, regions = _color_regions(img)
+
+    sa_json = json.load(open(json_path))
+    instances = sa_json["instances"]
+    idx = 0
+    sa_instances = []
+    color_polygons = {}
+    for instance in instances:
+        if "parts" not in instance.keys():
+            if "type" in instance.keys() and instance["type"] == "meta":
                 sa_instances.append(instance)
+            continue
+
+        parts = instance["parts"]
+
+        polygons = []
+        for part in parts:
+            r, g, b = hex_to_rgb(part["color"])
+            color = (r << 16) | (g << 8) | b
+            if color not in color_polygons:
+                color_polygons[color] = _color_polygons(packed, regions, color)
+            polygons.append(color_polygons[color])
+
+        for part_polygons in polygons:
+            if len(part_polygons) > 1:
+                idx += 1
+                group_id = idx
+            else:
+                group_id = 0
+
+            for polygon in part_polygons:
+                temp = instance.copy()
+                del temp["parts"]
+                temp["pointLabels"] = {}
+                temp["groupId"] = group_id
+                temp["type"] = "polygon"
+                temp["points"] = polygon
+                sa_instances.append(temp.copy())
+                temp["type"] = "bbox"
+                temp["points"] = {
+                    "x1": min(polygon[::2]),
+                    "x2": max(polygon[::2]),
+                    "y1": min(polygon[1::2]),
+                    "y2": max(polygon[1::2]),
+                }
+                sa_instances.append(temp.copy())
+
+    sa_json["instances"] = sa_instances
+    write_to_json(output_dir / file_name, sa_json)
+    return file_name.replace("___objects.json", "")
+
+
+def from_pixel_to_vector(json_paths, output_dir, processing_workers=None):
+    return list(
+        ConversionRunner(processing_workers).run(
+            _pixel_to_vector,
+            ((json_path, output_dir) for json_path in json_paths),
+            total=len(json_paths),
+        )
+    )
+
+
+def _fill_polygon(mask, instance, hex_color):
+    pts = np.array(
+        [
+            instance["points"][2 * i : 2 * (i + 1)]
+            for i in range(len(instance["points"]) // 2)
+        ],
+        dtype=np.int32,
+    )
+    cv2.fillPoly(mask, [pts], list(hex_to_rgb(hex_color))[::-1] + [255])
+
 
-        idx = 0
-        for key, instances in instances_group.items():
-            if key == 0:
-                for instance in instances:
-                    pts = np.array(
-                        [
-                            instance["points"][2 * i : 2 * (i + 1)]
-                            for i in range(len(instance["points"]) // 2)
-                        ],
-                        dtype=np.int32,
-                    )
-                    bitmask = np.zeros((H, W))
-                    cv2.fillPoly(bitmask, [pts], 1)
-                    mask[bitmask == 1] = list(hex_to_rgb(blue_colors[idx]))[::-1] + [
-                        255
-                    ]
-                    del instance["type"]
-                    del instance["points"]
-                    del instance["pointLabels"]
-                    del instance["groupId"]
-                    instance["parts"] = [{"color": blue_colors[idx]}]
-                    sa_instances.append(instance.copy())
-                    idx += 1
+def _vector_to_pixel(json_path, output_dir):
+    file_name = str(json_path.name).replace("___objects.json", "___pixel.json")
+
+    img_name = str(json_path).replace("___objects.json", "")
+    img = cv2.imread(img_name)
+    H, W, _ = img.shape
+
+    sa_json = json.load(open(json_path))
+    instances = sa_json["instances"]
+    # the polygons are filled in the mask directly, the later ones over the earlier ones
+    mask = np.zeros((H, W, 4), dtype=np.uint8)
+
+    sa_instances = []
+    blue_colors = blue_color_generator(len(instances))
+    instances_group = {}
+    for idx, instance in enumerate(instances):
+        if instance["type"] == "polygon":
+            if instance["groupId"] in instances_group.keys():
+                instances_group[instance["groupId"]].append(instance)
             else:
-                parts = []
-                for instance in instances:
-                    pts = np.array(
-                        [
-                            instance["points"][2 * i : 2 * (i + 1)]
-                            for i in range(len(instance["points"]) // 2)
-                        ],
-                        dtype=np.int32,
-                    )
-                    bitmask = np.zeros((H, W))
-                    cv2.fillPoly(bitmask, [pts], 1)
-                    mask[bitmask == 1] = list(hex_to_rgb(blue_colors[idx]))[::-1] + [
-                        255
-                    ]
-                    parts.append({"color": blue_colors[idx]})
-                    idx += 1
+                instances_group[instance["groupId"]] = [instance]
+        elif instance["type"] == "meta":
+            sa_instances.append(instance)
+
+    idx = 0
+    for key, instances in instances_group.items():
+        if key == 0:
+            for instance in instances:
+                _fill_polygon(mask, instance, blue_colors[idx])
                 del instance["type"]
                 del instance["points"]
                 del instance["pointLabels"]
                 del instance["groupId"]
-                instance["parts"] = parts
+                instance["parts"] = [{"color": blue_colors[idx]}]
                 sa_instances.append(instance.copy())
-
-        mask_name = file_name.replace("___pixel.json", "___save.png")
-        cv2.imwrite(str(output_dir.joinpath(mask_name)), mask)
-
-        sa_json["instances"] = sa_instances
-        write_to_json(output_dir / file_name, sa_json)
-        img_names.append(file_name.replace("___pixel.json", ""))
-    return img_names
+                idx += 1
+        else:
+            parts = []
+            for instance in instances:
+                _fill_polygon(mask, instance, blue_colors[idx])
+                parts.append({"color": blue_colors[idx]})
+                idx += 1
+            del instance["type"]
+            del instance["points"]
+            del instance["pointLabels"]
+            del instance["groupId"]
+            instance["parts"] = parts
+            sa_instances.append(instance.copy())
+
+    mask_name = file_name.replace("___pixel.json", "___save.png")
+    cv2.imwrite(str(output_dir.joinpath(mask_name)), mask)
+
+    sa_json["instances"] = sa_instances
+    write_to_json(output_dir / file_name, sa_json)
+    return file_name.replace("___pixel.json", "")
+
+
+def from_vector_to_pixel(json_paths, output_dir, processing_workers=None):
+    return list(
+        ConversionRunner(processing_workers).run(
+            _vector_to_pixel,
+            ((json_path, output_dir) for json_path in json_paths),
+            total=len(json_paths),
+        )
+    )
 
 
-def sa_convert_project_type(input_dir, output_dir):
+def sa_convert_project_type(input_dir, output_dir, processing_workers=None):
     json_paths = list(input_dir.glob("*.json"))
 
     output_dir.joinpath("classes").mkdir(parents=True)
@@ -178,9 +232,9 @@ def sa_convert_project_type(input_dir, output_dir):
     )
 
     if "___pixel.json" in json_paths[0].name:
-        img_names = from_pixel_to_vector(json_paths, output_dir)
+        img_names = from_pixel_to_vector(json_paths, output_dir, processing_workers)
     elif "___objects.json" in json_paths[0].name:
-        img_names = from_vector_to_pixel(json_paths, output_dir)
+        img_names = from_vector_to_pixel(json_paths, output_dir, processing_workers)
     elif ".json" in json_paths[0].name:
         raise AppException(DEPRICATED_DOCUMENT_VIDEO_MESSAGE)
     else:
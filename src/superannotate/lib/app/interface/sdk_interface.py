@@ -41,7 +41,6 @@ from lib.app.serializers import TeamSerializer
 from lib.core import LIMITED_FUNCTIONS
 from lib.core.enums import ImageQuality
 from lib.core.exceptions import AppException
-from lib.core.plugin import VideoPlugin
 from lib.core.types import AttributeGroup
 from lib.core.types import ClassesJson
 from lib.core.types import MLModel
@@ -1306,6 +1305,10 @@ def upload_images_from_folder_to_project(
     ] = constances.DEFAULT_FILE_EXCLUDE_PATTERNS,
     recursive_subfolders: Optional[StrictBool] = False,
     image_quality_in_editor: Optional[str] = None,
+    upload_workers: Optional[int] = None,
+    processing_workers: Optional[int] = None,
+    journal_path: Optional[Union[str, Path]] = None,
+    content_index_path: Optional[Union[str, Path]] = None,
 ):
     """Uploads all images with given extensions from folder_path to the project.
     Sets status of all the uploaded images to set_status if it is not None.
@@ -1332,6 +1335,18 @@ def upload_images_from_folder_to_project(
     :param image_quality_in_editor: image quality be seen in SuperAnnotate web annotation editor.
            Can be either "compressed" or "original".  If None then the default value in project settings will be used.
     :type image_quality_in_editor: str
+    :param upload_workers: number of threads uploading the images to the storage
+    :type upload_workers: int
+    :param processing_workers: number of processes generating the thumbnail, low resolution and huge images.
+           If None the images are processed in the threads of the processing stage.
+    :type processing_workers: int
+    :param journal_path: path of the file to keep the upload state of every image in.
+           If the upload is interrupted, running it again with the same journal skips the uploaded images,
+           they are included in the returned uploaded images.
+    :type journal_path: Path-like (str or Path)
+    :param content_index_path: path of the file to keep the content hashes of the uploaded images in.
+           Images with the same content as an already uploaded one are attached without processing and uploading.
+    :type content_index_path: Path-like (str or Path)
 
     :return: uploaded, could-not-upload, existing-images filepaths
     :rtype: tuple (3 members) of list of strs
@@ -1376,19 +1391,31 @@ def upload_images_from_folder_to_project(
         exclude_file_patterns=exclude_file_patterns,
         recursive_sub_folders=recursive_subfolders,
         image_quality_in_editor=image_quality_in_editor,
+        upload_workers=upload_workers,
+        processing_workers=processing_workers,
+        journal_path=journal_path,
+        content_index_path=content_index_path,
     )
     images_to_upload, duplicates = use_case.images_to_upload
+    images_to_attach = use_case.images_to_attach
     if len(duplicates):
         logger.warning(
             "%s already existing images found that won't be uploaded.", len(duplicates)
         )
+    if images_to_attach:
+        logger.info(
+            "Attaching %s images uploaded by the previous run.", len(images_to_attach)
+        )
     logger.info(
         "Uploading %s images to project %s.", len(images_to_upload), project_folder_name
     )
-    if not images_to_upload:
-        return [], [], duplicates
+    if not images_to_upload and not images_to_attach:
+        return use_case.journaled_images, [], duplicates
     if use_case.is_valid():
-        with tqdm(total=len(images_to_upload), desc="Uploading images") as progress_bar:
+        with tqdm(
+            total=len(images_to_upload) + len(images_to_attach),
+            desc="Uploading images",
+        ) as progress_bar:
             for _ in use_case.execute():
                 progress_bar.update(1)
         return use_case.data
@@ -1481,6 +1508,48 @@ def download_image_annotations(
     return res.data
 
 
+@Trackable
+@validate_arguments
+def download_image_annotations_bulk(
+    project: Union[NotEmptyStr, dict],
+    image_names: List[NotEmptyStr],
+    local_dir_path: Union[str, Path],
+    download_workers: Optional[int] = None,
+):
+    """Downloads annotations of the images (JSONs and masks if pixel type project)
+    to local_dir_path. The images are looked up and the class and template
+    information is requested once for all the images.
+
+    :param project: project name or folder path (e.g., "project1/folder1")
+    :type project: str
+    :param image_names: image names
+    :type image_names: list of str
+    :param local_dir_path: local directory path to download to
+    :type local_dir_path: Path-like (str or Path)
+    :param download_workers: number of threads downloading the annotations
+    :type download_workers: int
+
+    :return: paths of downloaded annotations of every image, (None, None) if the image or its annotations aren't found
+    :rtype: list of tuples
+    """
+    project_name, folder_name = extract_project_folder(project)
+    use_case = controller.download_image_annotations_bulk(
+        project_name=project_name,
+        folder_name=folder_name,
+        image_names=image_names,
+        destination=local_dir_path,
+        download_workers=download_workers,
+    )
+    if use_case.is_valid():
+        with tqdm(
+            total=len(use_case.images_to_download), desc="Downloading annotations"
+        ) as progress_bar:
+            for _ in use_case.execute():
+                progress_bar.update(1)
+        return use_case.data
+    raise AppException(use_case.response.errors)
+
+
 @Trackable
 @validate_arguments
 def download_image_preannotations(
@@ -1640,6 +1709,7 @@ def upload_videos_from_folder_to_project(
     end_time: Optional[float] = None,
     annotation_status: Optional[AnnotationStatuses] = "NotStarted",
     image_quality_in_editor: Optional[ImageQualityChoices] = None,
+    video_workers: Optional[int] = None,
 ):
     """Uploads image frames from all videos with given extensions from folder_path to the project.
     Sets status of all the uploaded images to set_status if it is not None.
@@ -1666,6 +1736,9 @@ def upload_videos_from_folder_to_project(
     :param image_quality_in_editor: image quality be seen in SuperAnnotate web annotation editor.
            Can be either "compressed" or "original".  If None then the default value in project settings will be used.
     :type image_quality_in_editor: str
+    :param video_workers: number of processes decoding the videos in parallel.
+           If None the videos are decoded one after another.
+    :type video_workers: int
 
     :return: uploaded and not-uploaded video frame images' filenames
     :rtype: tuple of list of strs
@@ -1704,78 +1777,45 @@ def upload_videos_from_folder_to_project(
     logger.info(
         f"Uploading all videos with extensions {extensions} from {str(folder_path)} to project {project_name}. Excluded file patterns are: {exclude_file_patterns}."
     )
-    uploaded_paths = []
-    for path in filtered_paths:
-        progress_bar = None
-        with tempfile.TemporaryDirectory() as temp_path:
-            frame_names = VideoPlugin.get_extractable_frames(
-                path, start_time, end_time, target_fps
-            )
-            duplicate_images = (
-                controller.get_duplicate_images(
-                    project_name=project_name,
-                    folder_name=folder_name,
-                    images=frame_names,
-                )
-                .execute()
-                .data
-            )
-            duplicate_images = [image.name for image in duplicate_images]
-            frames_generator = controller.extract_video_frames(
-                project_name=project_name,
-                folder_name=folder_name,
-                video_path=path,
-                extract_path=temp_path,
-                target_fps=target_fps,
-                start_time=start_time,
-                end_time=end_time,
-                annotation_status=annotation_status,
-                image_quality_in_editor=image_quality_in_editor,
-            )
-            total_frames_count = len(frame_names)
-            logger.info(f"Video frame count is {total_frames_count}.")
-            logger.info(
-                f"Extracted {total_frames_count} frames from video. Now uploading to platform.",
-            )
-            logger.info(
-                f"Uploading {total_frames_count} images to project {str(project_folder_name)}."
-            )
-            if len(duplicate_images):
-                logger.warning(
-                    f"{len(duplicate_images)} already existing images found that won't be uploaded."
-                )
-            if set(duplicate_images) == set(frame_names):
-                continue
-
-            for _ in frames_generator:
-                use_case = controller.upload_images_from_folder_to_project(
-                    project_name=project_name,
-                    folder_name=folder_name,
-                    folder_path=temp_path,
-                    annotation_status=annotation_status,
-                    image_quality_in_editor=image_quality_in_editor,
+    use_case = controller.upload_video_frames(
+        project_name=project_name,
+        folder_name=folder_name,
+        video_paths=filtered_paths,
+        target_fps=target_fps,
+        start_time=start_time,
+        end_time=end_time,
+        annotation_status=annotation_status,
+        image_quality_in_editor=image_quality_in_editor,
+        video_workers=video_workers,
+    )
+    for path, frame_names in use_case.video_frame_names.items():
+        logger.info(f"Video {path} frame count is {len(frame_names)}.")
+    total_frames_count = len(use_case.frame_names)
+    logger.info(
+        f"Uploading {total_frames_count} images to project {str(project_folder_name)}."
+    )
+    images_to_upload, duplicates = use_case.images_to_upload
+    if len(duplicates):
+        logger.warning(
+            f"{len(duplicates)} already existing images found that won't be uploaded."
+        )
+    if not len(images_to_upload):
+        return []
+    if use_case.is_valid():
+        videos_count = len(use_case.video_frame_names)
+        with tqdm(total=len(images_to_upload), desc="Uploading images") as progress_bar:
+            for _ in use_case.execute():
+                progress_bar.update()
+                progress_bar.set_postfix_str(
+                    f"{sum(map(bool, use_case.video_progress.values()))}/{videos_count} videos"
                 )
-
-                images_to_upload, duplicates = use_case.images_to_upload
-                if not len(images_to_upload):
-                    continue
-                if not progress_bar:
-                    progress_bar = tqdm(
-                        total=total_frames_count, desc="Uploading images"
-                    )
-                if use_case.is_valid():
-                    for _ in use_case.execute():
-                        progress_bar.update()
-                    uploaded, failed_images, _ = use_case.response.data
-                    uploaded_paths.extend(uploaded)
-                    if failed_images:
-                        logger.warning(f"Failed {len(failed_images)}.")
-                    files = os.listdir(temp_path)
-                    image_paths = [f"{temp_path}/{f}" for f in files]
-                    for path in image_paths:
-                        os.remove(path)
-                else:
-                    raise AppException(use_case.response.errors)
+        uploaded_paths, failed_images, _ = use_case.response.data
+        for path, count in use_case.video_progress.items():
+            logger.info(f"Uploaded {count} frames of video {path}.")
+        if failed_images:
+            logger.warning(f"Failed {len(failed_images)}.")
+    else:
+        raise AppException(use_case.response.errors)
 
     return uploaded_paths
 
@@ -1826,73 +1866,36 @@ def upload_video_to_project(
         raise AppException(LIMITED_FUNCTIONS[project["project"].project_type])
     project_folder_name = project_name + (f"/{folder_name}" if folder_name else "")
 
-    uploaded_paths = []
-    path = video_path
-    progress_bar = None
-    with tempfile.TemporaryDirectory() as temp_path:
-        frame_names = VideoPlugin.get_extractable_frames(
-            video_path, start_time, end_time, target_fps
-        )
-        duplicate_images = (
-            controller.get_duplicate_images(
-                project_name=project_name, folder_name=folder_name, images=frame_names,
-            )
-            .execute()
-            .data
-        )
-        duplicate_images = [image.name for image in duplicate_images]
-        frames_generator = controller.extract_video_frames(
-            project_name=project_name,
-            folder_name=folder_name,
-            video_path=path,
-            extract_path=temp_path,
-            target_fps=target_fps,
-            start_time=start_time,
-            end_time=end_time,
-            annotation_status=annotation_status,
-            image_quality_in_editor=image_quality_in_editor,
-        )
-        total_frames_count = len(frame_names)
-        logger.info(
-            f"Extracted {total_frames_count} frames from video. Now uploading to platform.",
-        )
-        logger.info(
-            f"Uploading {total_frames_count} images to project {str(project_folder_name)}."
+    use_case = controller.upload_video_frames(
+        project_name=project_name,
+        folder_name=folder_name,
+        video_paths=[video_path],
+        target_fps=target_fps,
+        start_time=start_time,
+        end_time=end_time,
+        annotation_status=annotation_status,
+        image_quality_in_editor=image_quality_in_editor,
+    )
+    total_frames_count = len(use_case.frame_names)
+    logger.info(
+        f"Uploading {total_frames_count} images to project {str(project_folder_name)}."
+    )
+    images_to_upload, duplicates = use_case.images_to_upload
+    if len(duplicates):
+        logger.warning(
+            f"{len(duplicates)} already existing images found that won't be uploaded."
         )
-        if len(duplicate_images):
-            logger.warning(
-                f"{len(duplicate_images)} already existing images found that won't be uploaded."
-            )
-        if set(duplicate_images) == set(frame_names):
-            return []
-
-        for _ in frames_generator:
-            use_case = controller.upload_images_from_folder_to_project(
-                project_name=project_name,
-                folder_name=folder_name,
-                folder_path=temp_path,
-                annotation_status=annotation_status,
-                image_quality_in_editor=image_quality_in_editor,
-            )
-
-            images_to_upload, duplicates = use_case.images_to_upload
-            if not len(images_to_upload):
-                continue
-            if not progress_bar:
-                progress_bar = tqdm(total=total_frames_count, desc="Uploading images")
-            if use_case.is_valid():
-                for _ in use_case.execute():
-                    progress_bar.update()
-                uploaded, failed_images, _ = use_case.response.data
-                uploaded_paths.extend(uploaded)
-                if failed_images:
-                    logger.warning(f"Failed {len(failed_images)}.")
-                files = os.listdir(temp_path)
-                image_paths = [f"{temp_path}/{f}" for f in files]
-                for path in image_paths:
-                    os.remove(path)
-            else:
-                raise AppException(use_case.response.errors)
+    if not len(images_to_upload):
+        return []
+    if use_case.is_valid():
+        with tqdm(total=len(images_to_upload), desc="Uploading images") as progress_bar:
+            for _ in use_case.execute():
+                progress_bar.update()
+        uploaded_paths, failed_images, _ = use_case.response.data
+        if failed_images:
+            logger.warning(f"Failed {len(failed_images)}.")
+    else:
+        raise AppException(use_case.response.errors)
 
     return uploaded_paths
 
@@ -2239,6 +2242,44 @@ def create_fuse_image(
     return response.data
 
 
+@Trackable
+@validate_arguments
+def create_fuse_images(
+    export_root: Union[NotEmptyStr, Path],
+    project_type: NotEmptyStr,
+    output_overlay: Optional[StrictBool] = False,
+    processing_workers: Optional[int] = None,
+):
+    """Creates fuse images for all annotated images of a local export
+
+    :param export_root: path to the export folder with the images, their annotation JSONs and classes/classes.json
+    :type export_root: Path-like (str or Path)
+    :param project_type: project type, "Vector" or "Pixel"
+    :type project_type: str
+    :param output_overlay: enables the overlay image creation
+    :type output_overlay: bool
+    :param processing_workers: number of processes creating the images, the images are processed sequentially if not set
+    :type processing_workers: int
+
+    :return: list of the created image paths per image, None for the images which couldn't be processed
+    :rtype: list
+    """
+    use_case = controller.create_fuse_images(
+        project_type=project_type,
+        export_root=str(export_root),
+        generate_overlay=output_overlay,
+        processing_workers=processing_workers,
+    )
+    if use_case.is_valid():
+        with tqdm(
+            total=len(use_case.image_paths), desc="Creating fuse images"
+        ) as progress_bar:
+            for _ in use_case.execute():
+                progress_bar.update(1)
+        return use_case.data
+    raise AppException(use_case.response.errors)
+
+
 @Trackable
 @validate_arguments
 def download_image(
@@ -2288,6 +2329,58 @@ def download_image(
     return response.data
 
 
+@Trackable
+@validate_arguments
+def download_images(
+    project: Union[NotEmptyStr, dict],
+    image_names: Optional[List[NotEmptyStr]] = None,
+    local_dir_path: Optional[Union[str, Path]] = "./",
+    variant: Optional[str] = "original",
+    include_annotations: Optional[StrictBool] = False,
+    download_workers: Optional[int] = None,
+):
+    """Downloads the images (and annotations if include_annotations) to local_dir_path.
+    The images already in local_dir_path with the same size are not downloaded again.
+
+    :param project: project name or folder path (e.g., "project1/folder1")
+    :type project: str
+    :param image_names: image names, all the images of the folder are downloaded if None
+    :type image_names: list of str
+    :param local_dir_path: where to download the images
+    :type local_dir_path: Path-like (str or Path)
+    :param variant: which resolution to download, can be 'original' or 'lores'
+     (low resolution used in web editor)
+    :type variant: str
+    :param include_annotations: enables annotation download with the images
+    :type include_annotations: bool
+    :param download_workers: number of threads downloading the images
+    :type download_workers: int
+
+    :return: paths of downloaded image and annotations if included of every image,
+     (None, None) if the image couldn't be downloaded
+    :rtype: list of tuples
+    """
+    project_name, folder_name = extract_project_folder(project)
+    use_case = controller.download_images(
+        project_name=project_name,
+        folder_name=folder_name,
+        image_names=image_names,
+        destination=str(local_dir_path),
+        image_variant=variant,
+        include_annotations=include_annotations,
+        download_workers=download_workers,
+    )
+    if use_case.is_valid():
+        with tqdm(
+            total=len(use_case.images_to_download),
+            desc="Downloading images",
+        ) as progress_bar:
+            for _ in use_case.execute():
+                progress_bar.update(1)
+        return use_case.data
+    raise AppException(use_case.response.errors)
+
+
 @Trackable
 @validate_arguments
 def attach_image_urls_to_project(
@@ -2426,6 +2519,8 @@ def upload_annotations_from_folder_to_project(
     folder_path: Union[str, Path],
     from_s3_bucket=None,
     recursive_subfolders: Optional[StrictBool] = False,
+    async_upload: Optional[StrictBool] = False,
+    journal_path: Optional[Union[str, Path]] = None,
 ):
     """Finds and uploads all JSON files in the folder_path as annotations to the project.
 
@@ -2446,6 +2541,13 @@ def upload_annotations_from_folder_to_project(
     :type from_s3_bucket: str
     :param recursive_subfolders: enable recursive subfolder parsing
     :type recursive_subfolders: bool
+    :param async_upload: upload the annotations with asyncio, keeping many more uploads in flight.
+                         Requires the aiohttp package
+    :type async_upload: bool
+    :param journal_path: path of the file to keep the upload state of every annotation in.
+           If the upload is interrupted, running it again with the same journal skips the uploaded annotations,
+           they are included in the returned uploaded annotations.
+    :type journal_path: Path-like (str or Path)
 
     :return: paths to annotations uploaded, could-not-upload, missing-images
     :rtype: tuple of list of strs
@@ -2476,6 +2578,8 @@ def upload_annotations_from_folder_to_project(
         folder_name=folder_name,
         annotation_paths=annotation_paths,  # noqa: E203
         client_s3_bucket=from_s3_bucket,
+        async_upload=async_upload,
+        journal_path=journal_path,
     )
     if response.errors:
         raise AppException(response.errors)
@@ -2489,6 +2593,8 @@ def upload_preannotations_from_folder_to_project(
     folder_path: Union[str, Path],
     from_s3_bucket=None,
     recursive_subfolders: Optional[StrictBool] = False,
+    async_upload: Optional[StrictBool] = False,
+    journal_path: Optional[Union[str, Path]] = None,
 ):
     """Finds and uploads all JSON files in the folder_path as pre-annotations to the project.
 
@@ -2509,6 +2615,13 @@ def upload_preannotations_from_folder_to_project(
     :type from_s3_bucket: str
     :param recursive_subfolders: enable recursive subfolder parsing
     :type recursive_subfolders: bool
+    :param async_upload: upload the annotations with asyncio, keeping many more uploads in flight.
+                         Requires the aiohttp package
+    :type async_upload: bool
+    :param journal_path: path of the file to keep the upload state of every annotation in.
+           If the upload is interrupted, running it again with the same journal skips the uploaded annotations,
+           they are included in the returned uploaded annotations.
+    :type journal_path: Path-like (str or Path)
 
     :return: paths to pre-annotations uploaded and could-not-upload
     :rtype: tuple of list of strs
@@ -2543,6 +2656,8 @@ def upload_preannotations_from_folder_to_project(
         annotation_paths=annotation_paths,  # noqa: E203
         client_s3_bucket=from_s3_bucket,
         is_pre_annotations=True,
+        async_upload=async_upload,
+        journal_path=journal_path,
     )
     if response.errors:
         raise AppException(response.errors)
@@ -2781,6 +2896,7 @@ def benchmark(
     image_list=None,
     annot_type: Optional[AnnotationType] = "bbox",
     show_plots=False,
+    processing_workers: Optional[int] = None,
 ):
     """Computes benchmark score for each instance of given images that are present both gt_project_name project and projects in folder_names list:
 
@@ -2798,6 +2914,9 @@ def benchmark(
     :type annot_type: str
     :param show_plots: If True, show plots based on results of consensus computation. Default: False
     :type show_plots: bool
+    :param processing_workers: number of processes matching the instances of the images.
+                               The images are matched in the current process if not specified.
+    :type processing_workers: int
 
     :return: Pandas DateFrame with columns (creatorEmail, QA, imageName, instanceId, className, area, attribute, folderName, score)
     :rtype: pandas DataFrame
@@ -2823,6 +2942,7 @@ def benchmark(
                 image_list=image_list,
                 annot_type=annot_type,
                 show_plots=show_plots,
+                processing_workers=processing_workers,
             )
 
     else:
@@ -2834,6 +2954,7 @@ def benchmark(
             image_list=image_list,
             annot_type=annot_type,
             show_plots=show_plots,
+            processing_workers=processing_workers,
         )
         if response.errors:
             raise AppException(response.errors)
@@ -2849,6 +2970,7 @@ def consensus(
     image_list: Optional[List[NotEmptyStr]] = None,
     annot_type: Optional[AnnotationType] = "bbox",
     show_plots: Optional[StrictBool] = False,
+    processing_workers: Optional[int] = None,
 ):
     """Computes consensus score for each instance of given images that are present in at least 2 of the given projects:
 
@@ -2864,6 +2986,9 @@ def consensus(
     :type annot_type: str
     :param show_plots: If True, show plots based on results of consensus computation. Default: False
     :type show_plots: bool
+    :param processing_workers: number of processes matching the instances of the images.
+                               The images are matched in the current process if not specified.
+    :type processing_workers: int
 
     :return: Pandas DateFrame with columns (creatorEmail, QA, imageName, instanceId, className, area, attribute, folderName, score)
     :rtype: pandas DataFrame
@@ -2879,6 +3004,7 @@ def consensus(
                 image_list=image_list,
                 annot_type=annot_type,
                 show_plots=show_plots,
+                processing_workers=processing_workers,
             )
 
     else:
@@ -2889,6 +3015,7 @@ def consensus(
             image_list=image_list,
             annot_type=annot_type,
             show_plots=show_plots,
+            processing_workers=processing_workers,
         )
         if response.errors:
             raise AppException(response.errors)
@@ -3506,6 +3633,10 @@ def aggregate_annotations_as_df(
     include_tags: Optional[StrictBool] = False,
     verbose: Optional[StrictBool] = True,
     folder_names: Optional[List[NotEmptyStr]] = None,
+    processing_workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    categorical: Optional[StrictBool] = False,
+    cache_dir: Optional[Union[NotEmptyStr, Path]] = None,
 ):
     """Aggregate annotations as pandas dataframe from project root.
 
@@ -3523,6 +3654,18 @@ def aggregate_annotations_as_df(
     :param folder_names: Aggregate the specified folders from project_root.
                                 If None aggregate all folders in the project_root.
     :type folder_names: (list of str)
+    :param processing_workers: number of processes parsing the annotation files.
+           If None the files are parsed in the current process.
+    :type processing_workers: int
+    :param chunk_size: if set, an iterator of DataFrames each built from chunk_size annotation files
+           is returned instead of a single DataFrame, for the exports which don't fit in the memory.
+    :type chunk_size: int
+    :param categorical: stores the low cardinality columns such as "className" and "type" as categoricals
+    :type categorical: bool
+    :param cache_dir: directory to cache the aggregated rows of the annotation files in a Parquet file.
+           The next aggregations of the same export parse only the new and changed files.
+           Requires pyarrow package, ignored if chunk_size is set.
+    :type cache_dir: Pathlike (str or Path)
 
     :return: DataFrame on annotations with columns:
                                         "imageName", "instanceId",
@@ -3532,7 +3675,7 @@ def aggregate_annotations_as_df(
                                         "groupId", "imageWidth", "imageHeight", "imageStatus", "imagePinned",
                                         "createdAt", "creatorRole", "creationType", "creatorEmail", "updatedAt",
                                         "updatorRole", "updatorEmail", "tag", "folderName"
-    :rtype: pandas DataFrame
+    :rtype: pandas DataFrame or iterator of pandas DataFrames
     """
     from superannotate.lib.app.analytics.common import aggregate_annotations_as_df
 
@@ -3543,6 +3686,10 @@ def aggregate_annotations_as_df(
         include_tags,
         verbose,
         folder_names,
+        processing_workers,
+        chunk_size,
+        categorical,
+        cache_dir,
     )
 
 
@@ -265,6 +265,22 @@ def download_image_annotations(*args, **kwargs):
     }
 
 
+def download_image_annotations_bulk(*args, **kwargs):
+    project = kwargs.get("project", None)
+    if not project:
+        project = args[0]
+    image_names = kwargs.get("image_names", None)
+    if not image_names:
+        image_names = args[1]
+    return {
+        "event_name": "download_image_annotations_bulk",
+        "properties": {
+            "project_name": get_project_name(project),
+            "Image Count": len(image_names),
+        },
+    }
+
+
 def download_image_preannotations(*args, **kwargs):
     project = kwargs.get("project", None)
     if not project:
@@ -604,6 +620,25 @@ def download_image(*args, **kwargs):
     }
 
 
+def download_images(*args, **kwargs):
+    project = kwargs.get("project", None)
+    if not project:
+        project = args[0]
+    image_names = kwargs.get("image_names", None)
+    if not image_names:
+        image_names = args[1:2] and args[1]
+    return {
+        "event_name": "download_images",
+        "properties": {
+            "project_name": get_project_name(project),
+            "Image Count": len(image_names) if image_names else None,
+            "Download Annotations": bool(
+                args[4:5] or ("include_annotations" in kwargs)
+            ),
+        },
+    }
+
+
 def copy_image(*args, **kwargs):
     project = kwargs.get("source_project", None)
     if not project:
@@ -1164,6 +1199,19 @@ def create_fuse_image(*args, **kwargs):
     }
 
 
+def create_fuse_images(*args, **kwargs):
+    project_type = kwargs.get("project_type", None)
+    if not project_type:
+        project_type = args[1]
+    return {
+        "event_name": "create_fuse_images",
+        "properties": {
+            "Project Type": project_type,
+            "Overlay": bool(args[2:3] or kwargs.get("output_overlay")),
+        },
+    }
+
+
 def set_image_annotation_status(*args, **kwargs):
     project = kwargs.get("project", None)
     if not project:
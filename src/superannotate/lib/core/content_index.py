@@ -0,0 +1,58 @@
+import hashlib
+import json
+import sqlite3
+import threading
+from typing import Optional
+
+
+def content_hash(data: bytes) -> str:
+    """
+    xxhash of the data if the xxhash package is installed, blake2b otherwise.
+    """
+    try:
+        import xxhash
+
+        return "xxh3:" + xxhash.xxh3_128_hexdigest(data)
+    except ImportError:
+        return "blake2b:" + hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class ContentIndex:
+    """
+    Maps the content hashes of the uploaded images to their S3 keys,
+    so an image with the same content can be attached without processing and uploading it again.
+
+    :param path: database file path, created if it doesn't exist
+    :param scope: images uploaded to different buckets are not shared
+    """
+
+    def __init__(self, path: str, scope: str):
+        self._scope = scope
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS contents ("
+                "scope TEXT NOT NULL, hash TEXT NOT NULL, data TEXT NOT NULL, "
+                "PRIMARY KEY (scope, hash))"
+            )
+
+    def get(self, hash_: str) -> Optional[dict]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data FROM contents WHERE scope = ? AND hash = ?",
+                (self._scope, hash_),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def add(self, hash_: str, data: dict):
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO contents (scope, hash, data) VALUES (?, ?, ?)",
+                (self._scope, hash_, json.dumps(data)),
+            )
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
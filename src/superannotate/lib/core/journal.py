@@ -0,0 +1,74 @@
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+from typing import Tuple
+
+
+class UploadJournal:
+    """
+    Keeps the upload state of every file in an SQLite database,
+    so an interrupted upload can be resumed from where it stopped.
+
+    :param path: database file path, created if it doesn't exist
+    :param scope: separates the uploads to different project folders in the same database
+    """
+
+    PROCESSED = "processed"
+    UPLOADED = "uploaded"
+    ATTACHED = "attached"
+
+    def __init__(self, path: str, scope: str):
+        self._scope = scope
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                "scope TEXT NOT NULL, name TEXT NOT NULL, state TEXT NOT NULL, "
+                "data TEXT, updated_at REAL NOT NULL, PRIMARY KEY (scope, name))"
+            )
+
+    def get_states(self) -> Dict[str, Tuple[str, Optional[dict]]]:
+        """
+        Returns file name to state and state data map of the scope.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT name, state, data FROM files WHERE scope = ?", (self._scope,)
+            ).fetchall()
+        return {
+            name: (state, json.loads(data) if data else None)
+            for name, state, data in rows
+        }
+
+    def set_state(self, name: str, state: str, data: dict = None):
+        self.set_states([(name, data)], state)
+
+    def set_states(self, items: Iterable[Tuple[str, Optional[dict]]], state: str):
+        now = time.time()
+        rows = [
+            (self._scope, name, state, json.dumps(data) if data else None, now)
+            for name, data in items
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO files (scope, name, state, data, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM files WHERE scope = ?", (self._scope,)
+            )
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,181 @@
+import queue
+import threading
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+
+class PipelineItem:
+    """
+    Carries a single source item through the pipeline stages.
+    """
+
+    __slots__ = ("source", "value", "error", "stage")
+
+    def __init__(self, source: Any):
+        self.source = source
+        self.value = source
+        self.error: Optional[Exception] = None
+        self.stage: Optional[str] = None
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None
+
+
+class PipelineStage:
+    """
+    One step of a pipeline.
+
+    :param func: callable applied to the previous stage output,
+                 if batch_size is set it receives a list of values and must return a list
+                 of the same length
+    :param workers: number of threads running the stage
+    :param queue_size: max number of items waiting in front of the stage
+    :param batch_size: group values before calling func
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        workers: int = 1,
+        queue_size: int = 0,
+        batch_size: int = None,
+        name: str = None,
+    ):
+        self.func = func
+        self.workers = max(workers, 1)
+        self.queue_size = queue_size if queue_size else self.workers * 2
+        self.batch_size = batch_size
+        self.name = name if name else getattr(func, "__name__", "stage")
+
+
+class Pipeline:
+    """
+    Bounded producer/consumer pipeline.
+    Every stage has its own threads and input queue, so the amount of items held in memory
+    is limited by the queue sizes and not by the number of the source items.
+    Failed items are not passed to the next stages, they are yielded with the error set.
+    An error raised by the source iterable is raised by run after the items read before it are yielded.
+    """
+
+    _END = object()
+    POLL_INTERVAL = 0.1
+
+    def __init__(self, stages: List[PipelineStage]):
+        self._stages = stages
+        self._stop_event = threading.Event()
+        self._output = None
+        self._source_error: Optional[Exception] = None
+
+    def _put(self, target: queue.Queue, item) -> bool:
+        while not self._stop_event.is_set():
+            try:
+                target.put(item, timeout=self.POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, source: queue.Queue):
+        while not self._stop_event.is_set():
+            try:
+                return source.get(timeout=self.POLL_INTERVAL)
+            except queue.Empty:
+                continue
+        return self._END
+
+    def _feed(self, items: Iterable, target: queue.Queue, workers: int):
+        try:
+            for item in items:
+                if not self._put(target, PipelineItem(item)):
+                    return
+        except Exception as e:
+            self._source_error = e
+        finally:
+            for _ in range(workers):
+                self._put(target, self._END)
+
+    def _process(self, stage: PipelineStage, items: List[PipelineItem], output):
+        try:
+            if stage.batch_size:
+                values = stage.func([item.value for item in items])
+            else:
+                values = [stage.func(items[0].value)]
+            for item, value in zip(items, values):
+                item.value = value
+        except Exception as e:
+            for item in items:
+                item.error = e
+                item.stage = stage.name
+        for item in items:
+            target = output if not item.failed else self._output
+            if not self._put(target, item):
+                return
+
+    def _work(self, stage: PipelineStage, source, output, counter: List[int], lock):
+        batch = []
+        try:
+            while True:
+                item = self._get(source)
+                if item is self._END:
+                    break
+                batch.append(item)
+                if len(batch) >= (stage.batch_size or 1):
+                    self._process(stage, batch, output)
+                    batch = []
+            if batch:
+                self._process(stage, batch, output)
+        finally:
+            with lock:
+                counter[0] -= 1
+                last_worker = not counter[0]
+            if last_worker:
+                workers = (
+                    self._stages[self._stages.index(stage) + 1].workers
+                    if output is not self._output
+                    else 1
+                )
+                for _ in range(workers):
+                    self._put(output, self._END)
+
+    def run(self, items: Iterable) -> Iterator[PipelineItem]:
+        self._stop_event.clear()
+        self._source_error = None
+        queues = [queue.Queue(maxsize=stage.queue_size) for stage in self._stages]
+        self._output = queue.Queue(maxsize=self._stages[-1].queue_size)
+        threads = [
+            threading.Thread(
+                target=self._feed,
+                args=(items, queues[0], self._stages[0].workers),
+                daemon=True,
+            )
+        ]
+        for idx, stage in enumerate(self._stages):
+            output = queues[idx + 1] if idx + 1 < len(queues) else self._output
+            counter, lock = [stage.workers], threading.Lock()
+            for _ in range(stage.workers):
+                threads.append(
+                    threading.Thread(
+                        target=self._work,
+                        args=(stage, queues[idx], output, counter, lock),
+                        daemon=True,
+                    )
+                )
+        for thread in threads:
+            thread.start()
+        try:
+            while True:
+                item = self._get(self._output)
+                if item is self._END:
+                    break
+                yield item
+            if self._source_error:
+                raise self._source_error
+        finally:
+            self._stop_event.set()
+            for thread in threads:
+                thread.join()
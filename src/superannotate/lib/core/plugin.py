@@ -1,12 +1,16 @@
 import io
 import logging
+import math
 from pathlib import Path
+from typing import Iterator
 from typing import List
+from typing import Optional
 from typing import Tuple
 from typing import Union
 
 import cv2
 import ffmpeg
+import numpy as np
 from lib.core.exceptions import ImageProcessingException
 from PIL import Image
 from PIL import ImageDraw
@@ -16,13 +20,29 @@ logger = logging.getLogger()
 
 
 class ImagePlugin:
+    THUMB_SIZE = (128, 96)
+    HUGE_WIDTH = 600
+    DRAW_MARGIN = 2
+
     def __init__(self, image_bytes: io.BytesIO, max_resolution: int = 4096):
         self._image_bytes = image_bytes
         self._image_bytes.seek(0)
         self._max_resolution = max_resolution
-        self._image = Image.open(self._image_bytes).convert("RGBA")
+        self._source = Image.open(self._image_bytes)
+        self._size = self._source.size
+        self._rgba_image = None
         self._draw = None
 
+    @property
+    def _image(self):
+        if self._rgba_image is None:
+            self._rgba_image = self._source.convert("RGBA")
+        return self._rgba_image
+
+    @_image.setter
+    def _image(self, value):
+        self._rgba_image = value
+
     def save(self, *args, **kwargs):
         self._image.save(*args, **kwargs)
 
@@ -73,7 +93,82 @@ class ImagePlugin:
         return im
 
     def get_size(self) -> Tuple[float, float]:
-        return self._image.size
+        return self._size
+
+    def _validate_resolution(self):
+        width, height = self._size
+        resolution = width * height
+        if resolution > self._max_resolution:
+            raise ImageProcessingException(
+                f"Image resolution {resolution} too large. Max supported for resolution is {self._max_resolution}"
+            )
+
+    @property
+    def _is_opaque(self) -> bool:
+        return "A" not in self._source.getbands() and (
+            "transparency" not in self._source.info
+        )
+
+    @staticmethod
+    def _save_jpeg(image, **kwargs) -> io.BytesIO:
+        buffer = io.BytesIO()
+        image.save(buffer, "JPEG", **kwargs)
+        buffer.seek(0)
+        return buffer
+
+    def generate_derivatives(
+        self, quality: int = 60, subsampling: int = -1, low_resolution: bool = True
+    ) -> Tuple[io.BytesIO, io.BytesIO, Optional[io.BytesIO]]:
+        """
+        Generates thumbnail, huge and low resolution images decoding the image only once.
+        When the low resolution image isn't needed JPEGs are decoded in draft mode,
+        the huge image is downscaled from the decoded image and the thumbnail from the huge one.
+        Opaque images skip the RGBA conversion.
+
+        :return: thumbnail, huge and low resolution (None if not requested) image buffers
+        """
+        Image.MAX_IMAGE_PIXELS = None
+        self._validate_resolution()
+        width, height = self._size
+        huge_size = (self.HUGE_WIDTH, int(height * self.HUGE_WIDTH / width))
+        if not low_resolution and self._rgba_image is None:
+            self._source.draft("RGB", huge_size)
+
+        if self._rgba_image is not None or not self._is_opaque:
+            image = self._image
+        elif self._source.mode != "RGB":
+            image = self._source.convert("RGB")
+        else:
+            image = self._source
+            image.load()
+
+        huge = image.resize(huge_size, Image.ANTIALIAS, reducing_gap=3.0)
+        thumb = ImageOps.exif_transpose(
+            huge if huge_size[0] <= image.size[0] else image
+        )
+        thumb.thumbnail(self.THUMB_SIZE, Image.ANTIALIAS)
+        background = Image.new("RGB", self.THUMB_SIZE, "black")
+        background.paste(
+            thumb,
+            (
+                (self.THUMB_SIZE[0] - thumb.size[0]) // 2,
+                (self.THUMB_SIZE[1] - thumb.size[1]) // 2,
+            ),
+        )
+        thumb_buffer = self._save_jpeg(background)
+        huge_buffer = self._save_jpeg(huge.convert("RGB"))
+
+        low_resolution_buffer = None
+        if low_resolution:
+            if image.mode == "RGBA":
+                low_resolution_image = Image.new("RGB", image.size, (255, 255, 255))
+                low_resolution_image.paste(image, mask=image)
+            else:
+                low_resolution_image = image
+            low_resolution_buffer = self._save_jpeg(
+                low_resolution_image, quality=quality, subsampling=subsampling
+            )
+        return thumb_buffer, huge_buffer, low_resolution_buffer
 
     def generate_thumb(self):
         image = self._get_image()
@@ -117,70 +212,122 @@ class ImagePlugin:
         width, height = im.size
         return buffer, width, height
 
+    @staticmethod
+    def _flatten_points(points: List) -> List[float]:
+        if points and isinstance(points[0], (list, tuple)):
+            return [coordinate for point in points for coordinate in point]
+        return list(points)
+
+    @staticmethod
+    def _shift_points(points: List[float], left: int, top: int) -> List[float]:
+        return [
+            coordinate - (top if index % 2 else left)
+            for index, coordinate in enumerate(points)
+        ]
+
+    def _draw_layer(self, points: List[float], margin: int, draw_shape):
+        """
+        Draws the shape on a transparent layer covering only the bounds of its points and the margin,
+        and composites the layer over the image at its position,
+        so the cost of a shape is proportional to its size rather than to the image size.
+
+        :param points: flat list of the shape coordinates
+        :param margin: pixels added around the bounds of the points for the outline and the line width
+        :param draw_shape: function drawing the shape, called with ImageDraw of the layer and the layer position
+        """
+        width, height = self._image.size
+        xs, ys = points[0::2], points[1::2]
+        left = max(math.floor(min(xs)) - margin, 0)
+        top = max(math.floor(min(ys)) - margin, 0)
+        right = min(math.ceil(max(xs)) + margin + 1, width)
+        bottom = min(math.ceil(max(ys)) + margin + 1, height)
+        if right <= left or bottom <= top:
+            return
+        layer = Image.new("RGBA", (right - left, bottom - top))
+        draw_shape(ImageDraw.Draw(layer), left, top)
+        self._image.alpha_composite(layer, (left, top))
+
     def draw_bbox(self, x1, x2, y1, y2, fill_color, outline_color):
-        image = self.get_empty_image()
-        draw = ImageDraw.Draw(image)
-        draw.rectangle(((x1, y1), (x2, y2)), fill_color, outline_color)
-        self._image.convert("RGBA")
-        self._image = Image.alpha_composite(self._image, image)
+        self._draw_layer(
+            [x1, y1, x2, y2],
+            self.DRAW_MARGIN,
+            lambda draw, left, top: draw.rectangle(
+                ((x1 - left, y1 - top), (x2 - left, y2 - top)),
+                fill_color,
+                outline_color,
+            ),
+        )
 
     def draw_polygon(self, points: List, fill_color, outline_color):
-        image = self.get_empty_image()
-        draw = ImageDraw.Draw(image)
-        draw.polygon(points, fill_color, outline_color)
-        self._image.convert("RGBA")
-        self._image = Image.alpha_composite(self._image, image)
+        points = self._flatten_points(points)
+        self._draw_layer(
+            points,
+            self.DRAW_MARGIN,
+            lambda draw, left, top: draw.polygon(
+                self._shift_points(points, left, top), fill_color, outline_color
+            ),
+        )
 
     def draw_polyline(self, points: List, fill_color, width=2):
-        image = self.get_empty_image()
-        draw = ImageDraw.Draw(image)
-        draw.line(points, fill_color, width=width)
-        self._image.convert("RGBA")
-        self._image = Image.alpha_composite(self._image, image)
+        points = self._flatten_points(points)
+        self._draw_layer(
+            points,
+            self.DRAW_MARGIN + width,
+            lambda draw, left, top: draw.line(
+                self._shift_points(points, left, top), fill_color, width=width
+            ),
+        )
 
     def draw_point(self, x, y, fill_color, outline_color, size=2):
-        image = self.get_empty_image()
-        draw = ImageDraw.Draw(image)
-        draw.ellipse(
-            (x - size, y - size, x + size, y + size), fill_color, outline_color
-        )
-        self._image.convert("RGBA")
-        self._image = Image.alpha_composite(self._image, image)
+        self.draw_ellipse(x, y, size, size, fill_color, outline_color)
 
     def draw_ellipse(self, cx, cy, rx, ry, fill_color, outline_color, fixed=False):
-        image = self.get_empty_image()
-        draw = ImageDraw.Draw(image)
         if fixed:
-            draw.ellipse((cx, cy, rx, ry), fill=fill_color, outline=outline_color)
+            bounds = [cx, cy, rx, ry]
         else:
-            draw.ellipse(
-                (cx - rx, cy - ry, cx + rx, cy + ry),
+            bounds = [cx - rx, cy - ry, cx + rx, cy + ry]
+        self._draw_layer(
+            bounds,
+            self.DRAW_MARGIN,
+            lambda draw, left, top: draw.ellipse(
+                self._shift_points(bounds, left, top),
                 fill=fill_color,
                 outline=outline_color,
-            )
-        self._image.convert("RGBA")
-        self._image = Image.alpha_composite(self._image, image)
+            ),
+        )
 
     def draw_line(self, x, y, fill_color, width=1):
-        image = self.get_empty_image()
-        draw = ImageDraw.Draw(image)
-        draw.line((x, y), fill=fill_color, width=width)
-        self._image.convert("RGBA")
-        self._image = Image.alpha_composite(self._image, image)
+        points = self._flatten_points([x, y])
+        self._draw_layer(
+            points,
+            self.DRAW_MARGIN + width,
+            lambda draw, left, top: draw.line(
+                self._shift_points(points, left, top), fill=fill_color, width=width
+            ),
+        )
 
 
 class VideoPlugin:
     @staticmethod
     def get_frames_count(video_path: str):
+        """
+        Reads the frame count from the container metadata,
+        the frames are counted only if neither OpenCV nor ffprobe report it.
+        """
         video = cv2.VideoCapture(str(video_path), cv2.CAP_FFMPEG)
+        count = int(video.get(cv2.CAP_PROP_FRAME_COUNT))
+        if count > 0:
+            return count
+        try:
+            meta_dict = ffmpeg.probe(str(video_path), select_streams="v:0")
+            count = int(meta_dict["streams"][0]["nb_frames"])
+            if count > 0:
+                return count
+        except Exception:  # noqa
+            pass
         count = 0
-        flag = True
-        while flag:
-            flag, _ = video.read()
-            if flag:
-                count += 1
-            else:
-                break
+        while video.grab():
+            count += 1
         return count
 
     @staticmethod
@@ -216,6 +363,22 @@ class VideoPlugin:
                 )
             return
 
+    @staticmethod
+    def _get_ratio(fps: float, target_fps: float) -> float:
+        if not target_fps or target_fps > fps:
+            target_fps = fps
+        return fps / target_fps
+
+    @staticmethod
+    def _selected_frame_numbers(ratio: float) -> Iterator[int]:
+        """
+        Yields the 1-based numbers of the frames kept at the target fps.
+        """
+        frame_no_with_change = 1.0
+        while True:
+            yield round(frame_no_with_change)
+            frame_no_with_change += ratio
+
     @staticmethod
     def frames_generator(
         video_path: str, start_time, end_time, target_fps: float, log=True
@@ -226,49 +389,87 @@ class VideoPlugin:
                 f"Couldn't open video file {str(video_path)}."
             )
         fps = video.get(cv2.CAP_PROP_FPS)
-        if not target_fps:
-            target_fps = fps
-        if target_fps > fps:
-            target_fps = fps
-        ratio = fps / target_fps
+        ratio = VideoPlugin._get_ratio(fps, target_fps)
         rotate_code = VideoPlugin.get_video_rotate_code(video_path, log)
         frame_no = 0
-        frame_no_with_change = 1.0
-        while True:
-            success, frame = video.read()
-            if not success:
-                break
-            frame_no += 1
-            if round(frame_no_with_change) != frame_no:
+        if start_time and fps:
+            # seek to the frame before the start time, the seek may be inaccurate by a few frames
+            video.set(cv2.CAP_PROP_POS_FRAMES, max(int(start_time * fps) - 1, 0))
+            frame_no = int(video.get(cv2.CAP_PROP_POS_FRAMES))
+        for selected_frame_no in VideoPlugin._selected_frame_numbers(ratio):
+            if selected_frame_no <= frame_no:
                 continue
-            frame_no_with_change += ratio
+            # only the selected frames are decoded into images
+            while frame_no < selected_frame_no:
+                if not video.grab():
+                    return
+                frame_no += 1
             frame_time = video.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
             if end_time and frame_time > end_time:
                 break
             if frame_time < start_time:
                 continue
+            success, frame = video.retrieve()
+            if not success:
+                break
             if rotate_code:
                 frame = cv2.rotate(frame, rotate_code)
             yield frame
 
+    @staticmethod
+    def get_frame_names(video_path: str, count: int, zero_fill_count: int):
+        video_name = Path(video_path).stem
+        return [
+            f"{video_name}_{str(i).zfill(zero_fill_count)}.jpg"
+            for i in range(1, count + 1)
+        ]
+
     @staticmethod
     def get_extractable_frames(
         video_path: str, start_time, end_time, target_fps: float,
     ):
+        """
+        Computes the names of the frames to extract from the video metadata without decoding it.
+        """
         total = VideoPlugin.get_frames_count(video_path)
-        total_with_fps = sum(
-            1
-            for _ in VideoPlugin.frames_generator(
-                video_path, start_time, end_time, target_fps, log=False
-            )
+        fps = VideoPlugin.get_fps(video_path)
+        total_with_fps = 0
+        if fps:
+            for frame_no in VideoPlugin._selected_frame_numbers(
+                VideoPlugin._get_ratio(fps, target_fps)
+            ):
+                frame_time = (frame_no - 1) / fps
+                if frame_no > total or (end_time and frame_time > end_time):
+                    break
+                if frame_time >= start_time:
+                    total_with_fps += 1
+        return VideoPlugin.get_frame_names(
+            video_path, total_with_fps, len(str(total))
         )
-        zero_fill_count = len(str(total))
+
+    @staticmethod
+    def named_frames_generator(
+        video_path: str, start_time, end_time, target_fps: float, log=True
+    ) -> Iterator[Tuple[str, np.ndarray]]:
+        """
+        Yields the frames with the names they are uploaded with.
+        """
+        zero_fill_count = len(str(VideoPlugin.get_frames_count(video_path)))
         video_name = Path(video_path).stem
-        frame_names = []
-        for i in range(1, total_with_fps + 1):
-            frame_name = f"{video_name}_{str(i).zfill(zero_fill_count)}.jpg"
-            frame_names.append(frame_name)
-        return frame_names
+        for frame_no, frame in enumerate(
+            VideoPlugin.frames_generator(
+                video_path, start_time, end_time, target_fps, log
+            ),
+            1,
+        ):
+            yield f"{video_name}_{str(frame_no).zfill(zero_fill_count)}.jpg", frame
+
+    @staticmethod
+    def encode_frame(frame: np.ndarray) -> io.BytesIO:
+        success, buffer = cv2.imencode(".jpg", frame)
+        if not success:
+            raise ImageProcessingException("Couldn't encode the video frame.")
+        return io.BytesIO(buffer.tobytes())
 
     @staticmethod
     def extract_frames(
@@ -280,26 +481,13 @@ class VideoPlugin:
         target_fps: float,
         chunk_size: int = 100,
     ) -> List[str]:
-        total_num_of_frames = VideoPlugin.get_frames_count(video_path)
-        zero_fill_count = len(str(total_num_of_frames))
-        video_name = Path(video_path).stem
-        extracted_frame_no = 1
         extracted_frames_paths = []
-        for frame in VideoPlugin.frames_generator(
+        for frame_name, frame in VideoPlugin.named_frames_generator(
             video_path, start_time, end_time, target_fps
         ):
             if len(extracted_frames_paths) >= limit:
                 break
-            path = str(
-                Path(extract_path)
-                / (
-                    video_name
-                    + "_"
-                    + str(extracted_frame_no).zfill(zero_fill_count)
-                    + ".jpg"
-                )
-            )
-            extracted_frame_no += 1
+            path = str(Path(extract_path) / frame_name)
             cv2.imwrite(path, frame)
             extracted_frames_paths.append(path)
             if len(extracted_frames_paths) % chunk_size == 0:
@@ -4,10 +4,10 @@ from typing import Any
 from typing import List
 from typing import Optional
 
-import boto3
 from lib.core.conditions import Condition
 from lib.core.entities import BaseEntity
 from lib.core.entities import ProjectEntity
+from lib.core.s3 import S3ClientCache
 from lib.core.serviceproviders import SuerannotateServiceProvider
 
 
@@ -59,12 +59,10 @@ class BaseS3Repository(BaseManageableRepository):
     def __init__(
         self, access_key: str, secret_key: str, session_token: str, bucket: str,
     ):
-        self._session = boto3.Session(
-            aws_access_key_id=access_key,
-            aws_secret_access_key=secret_key,
-            aws_session_token=session_token,
+        self._client = S3ClientCache().get_client(
+            key=("s3", bucket, access_key),
+            access_key=access_key,
+            secret_key=secret_key,
+            session_token=session_token,
         )
-
-        self._resource = self._session.resource("s3")
         self._bucket = bucket
-        self.bucket = self._resource.Bucket(bucket)
@@ -0,0 +1,87 @@
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime
+from typing import Hashable
+from typing import Optional
+from typing import Union
+
+import boto3
+from botocore.config import Config
+from lib.core.serviceproviders import SingleInstanceMetaClass
+
+
+class S3ClientCache(metaclass=SingleInstanceMetaClass):
+    """
+    Keeps boto3 s3 clients built from the temporary upload credentials.
+    boto3 clients are thread-safe, so one client with a large connection pool is shared
+    by all the upload threads and use cases until its credentials expire.
+    """
+
+    MAX_POOL_CONNECTIONS = 32
+    # the shortest STS session duration, used when the expiration is not known
+    DEFAULT_EXPIRATION = 15 * 60
+    EXPIRATION_MARGIN = 60
+    CachedClient = namedtuple("CachedClient", ["client", "expires_at"])
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clients = {}
+
+    @staticmethod
+    def _expiration_timestamp(expiration: Union[str, int, float, datetime]) -> float:
+        if isinstance(expiration, datetime):
+            return expiration.timestamp()
+        if isinstance(expiration, str):
+            return datetime.fromisoformat(expiration.replace("Z", "+00:00")).timestamp()
+        # milliseconds are sent by the backend for js dates
+        return expiration / 1000 if expiration > 10 ** 11 else expiration
+
+    def _create_client(self, access_key, secret_key, session_token, region):
+        return boto3.client(
+            "s3",
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_key,
+            aws_session_token=session_token,
+            region_name=region,
+            config=Config(max_pool_connections=self.MAX_POOL_CONNECTIONS),
+        )
+
+    def get_client(
+        self,
+        key: Hashable,
+        access_key: str,
+        secret_key: str,
+        session_token: str,
+        region: Optional[str] = None,
+        expiration: Union[str, int, float, datetime] = None,
+    ):
+        """
+        Returns the cached client of the key if its credentials are still valid,
+        otherwise creates a new one from the given credentials.
+        """
+        now = time.time()
+        with self._lock:
+            cached = self._clients.get(key)
+            if cached and cached.expires_at - self.EXPIRATION_MARGIN > now:
+                return cached.client
+            if expiration:
+                expires_at = self._expiration_timestamp(expiration)
+            else:
+                expires_at = now + self.DEFAULT_EXPIRATION
+            client = self._create_client(access_key, secret_key, session_token, region)
+            self._clients = {
+                key: cached
+                for key, cached in self._clients.items()
+                if cached.expires_at > now
+            }
+            self._clients[key] = self.CachedClient(client, expires_at)
+            return client
+
+    def invalidate(self, key: Hashable):
+        with self._lock:
+            self._clients.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._clients.clear()
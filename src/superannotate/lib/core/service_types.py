@@ -30,6 +30,7 @@ class UploadAnnotationAuthData(BaseModel):
     region: str
     bucket: str
     images: Dict[int, dict]
+    expiration: Optional[Union[float, str]] = None
 
     class Config:
         extra = Extra.allow
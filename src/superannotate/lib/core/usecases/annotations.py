@@ -1,3 +1,4 @@
+import asyncio
 import concurrent.futures
 import io
 import json
@@ -5,6 +6,9 @@ import logging
 import os
 from collections import namedtuple
 from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
 
 import boto3
 import lib.core as constances
@@ -16,21 +20,45 @@ from lib.core.helpers import convert_to_video_editor_json
 from lib.core.helpers import fill_annotation_ids
 from lib.core.helpers import fill_document_tags
 from lib.core.helpers import map_annotation_classes_name
+from lib.core.journal import UploadJournal
 from lib.core.reporter import Reporter
+from lib.core.s3 import S3ClientCache
 from lib.core.service_types import UploadAnnotationAuthData
 from lib.core.serviceproviders import SuerannotateServiceProvider
 from lib.core.usecases.base import BaseReportableUseCae
-from lib.core.usecases.images import GetBulkImages
+from lib.core.usecases.images import GetBulkImagesMap
 from lib.core.usecases.images import ValidateAnnotationUseCase
 from lib.infrastructure.validators import BaseAnnotationValidator
 
 logger = logging.getLogger("root")
 
 
+def get_upload_s3_client(
+    project: ProjectEntity,
+    folder: FolderEntity,
+    upload_data: UploadAnnotationAuthData,
+    pre_annotation: bool = False,
+):
+    """
+    Returns the shared s3 client of the project folder annotations,
+    it is recreated only when the cached credentials expire.
+    """
+    return S3ClientCache().get_client(
+        key=("annotations", project.team_id, project.uuid, folder.uuid, pre_annotation),
+        access_key=upload_data.access_key,
+        secret_key=upload_data.secret_key,
+        session_token=upload_data.session_token,
+        region=upload_data.region,
+        expiration=upload_data.expiration,
+    )
+
+
 class UploadAnnotationsUseCase(BaseReportableUseCae):
     MAX_WORKERS = 10
     CHUNK_SIZE = 100
     AUTH_DATA_CHUNK_SIZE = 500
+    ASYNC_MAX_CONCURRENCY = 200
+    PRESIGNED_URL_EXPIRATION = 3600
     ImageInfo = namedtuple("ImageInfo", ["path", "name", "id"])
 
     def __init__(
@@ -45,6 +73,8 @@ class UploadAnnotationsUseCase(BaseReportableUseCae):
         validators: BaseAnnotationValidator,
         pre_annotation: bool = False,
         client_s3_bucket=None,
+        async_upload: bool = False,
+        journal_path: str = None,
     ):
         super().__init__(reporter)
         self._project = project
@@ -55,8 +85,12 @@ class UploadAnnotationsUseCase(BaseReportableUseCae):
         self._client_s3_bucket = client_s3_bucket
         self._pre_annotation = pre_annotation
         self._templates = templates
-        self._annotations_to_upload = []
+        self._async_upload = async_upload
+        self._journal_path = journal_path
+        self._journal = None
+        self._annotations_to_upload = None
         self._missing_annotations = []
+        self._journaled_annotations = []
         self._validators = validators
         self.missing_attribute_groups = set()
         self.missing_classes = set()
@@ -82,21 +116,44 @@ class UploadAnnotationsUseCase(BaseReportableUseCae):
             .replace(constances.ATTACHED_VIDEO_ANNOTATION_POSTFIX, ""),
         )
 
+    @property
+    def journal(self) -> Optional[UploadJournal]:
+        if self._journal_path and not self._journal:
+            self._journal = UploadJournal(
+                self._journal_path,
+                scope=(
+                    f"{'preannotations' if self._pre_annotation else 'annotations'}:"
+                    f"{self._project.team_id}:{self._project.uuid}:{self._folder.uuid}"
+                ),
+            )
+        return self._journal
+
     @property
     def annotations_to_upload(self):
-        if not self._annotations_to_upload:
-            annotation_paths = self._annotation_paths
-            images_detail = []
-            for annotation_path in annotation_paths:
-                images_detail.append(
-                    self.ImageInfo(
-                        id=None,
-                        path=annotation_path,
-                        name=self.extract_name(annotation_path),
-                    )
+        if self._annotations_to_upload is None:
+            images_detail = [
+                self.ImageInfo(
+                    id=None,
+                    path=annotation_path,
+                    name=self.extract_name(annotation_path),
                 )
-            images_data = (
-                GetBulkImages(
+                for annotation_path in self._annotation_paths
+            ]
+            if self.journal:
+                states = self.journal.get_states()
+                self._journaled_annotations = [
+                    detail.path for detail in images_detail if detail.name in states
+                ]
+                if self._journaled_annotations:
+                    logger.info(
+                        "Skipping %s annotations uploaded by a previous run with the journal.",
+                        len(self._journaled_annotations),
+                    )
+                images_detail = [
+                    detail for detail in images_detail if detail.name not in states
+                ]
+            existing_images = (
+                GetBulkImagesMap(
                     service=self._backend_service,
                     project_id=self._project.uuid,
                     team_id=self._project.team_id,
@@ -106,21 +163,17 @@ class UploadAnnotationsUseCase(BaseReportableUseCae):
                 .execute()
                 .data
             )
-            for image_data in images_data:
-                for idx, detail in enumerate(images_detail):
-                    if detail.name == image_data.name:
-                        images_detail[idx] = detail._replace(id=image_data.uuid)
-                        break
-
-            missing_annotations = list(
-                filter(lambda image_detail: image_detail.id is None, images_detail)
-            )
-            annotations_to_upload = list(
-                filter(lambda image_detail: image_detail.id is not None, images_detail)
-            )
+            annotations_to_upload = []
+            missing_annotations = []
+            for detail in images_detail:
+                image = existing_images.get(detail.name)
+                if image:
+                    annotations_to_upload.append(detail._replace(id=image.uuid))
+                else:
+                    missing_annotations.append(detail)
             if missing_annotations:
                 logger.warning(
-                    f"Couldn't find {len(missing_annotations)}/{len(annotations_to_upload + missing_annotations)} items on the platform that match the annotations you want to upload."
+                    f"Couldn't find {len(missing_annotations)}/{len(images_detail)} items on the platform that match the annotations you want to upload."
                 )
             self._missing_annotations = missing_annotations
             self._annotations_to_upload = annotations_to_upload
@@ -142,48 +195,55 @@ class UploadAnnotationsUseCase(BaseReportableUseCae):
         if response.ok:
             return response.data
 
+    def _get_upload_use_case(
+        self,
+        image_id: int,
+        image_name: str,
+        upload_data: UploadAnnotationAuthData,
+        path: str,
+        s3_client,
+    ) -> "UploadAnnotationUseCase":
+        return UploadAnnotationUseCase(
+            project=self._project,
+            folder=self._folder,
+            image=ImageEntity(uuid=image_id, name=image_name),
+            annotation_classes=self._annotation_classes,
+            backend_service_provider=self._backend_service,
+            reporter=self.reporter,
+            templates=self._templates,
+            annotation_upload_data=upload_data,
+            client_s3_bucket=self._client_s3_bucket,
+            annotation_path=path,
+            verbose=False,
+            s3_client=s3_client,
+            validators=self._validators,
+        )
+
     def _upload_annotation(
         self,
         image_id: int,
         image_name: str,
         upload_data: UploadAnnotationAuthData,
         path: str,
-        bucket,
+        s3_client,
     ):
         try:
-            response = UploadAnnotationUseCase(
-                project=self._project,
-                folder=self._folder,
-                image=ImageEntity(uuid=image_id, name=image_name),
-                annotation_classes=self._annotation_classes,
-                backend_service_provider=self._backend_service,
-                reporter=self.reporter,
-                templates=self._templates,
-                annotation_upload_data=upload_data,
-                client_s3_bucket=self._client_s3_bucket,
-                annotation_path=path,
-                verbose=False,
-                s3_bucket=bucket,
-                validators=self._validators,
+            response = self._get_upload_use_case(
+                image_id, image_name, upload_data, path, s3_client
             ).execute()
             if response.errors:
                 self.reporter.store_message("Invalid jsons", path)
                 return path, False
+            if self.journal:
+                self.journal.set_state(image_name, UploadJournal.UPLOADED)
             return path, True
         except Exception as _:
             return path, False
 
-    def get_bucket_to_upload(self, ids: List[int]):
-        upload_data = self.get_annotation_upload_data(ids)
-        if upload_data:
-            session = boto3.Session(
-                aws_access_key_id=upload_data.access_key,
-                aws_secret_access_key=upload_data.secret_key,
-                aws_session_token=upload_data.session_token,
-                region_name=upload_data.region,
-            )
-            resource = session.resource("s3")
-            return resource.Bucket(upload_data.bucket)
+    def get_s3_client(self, upload_data: UploadAnnotationAuthData):
+        return get_upload_s3_client(
+            self._project, self._folder, upload_data, self._pre_annotation
+        )
 
     def _log_report(self):
         for key, values in self.reporter.custom_messages.items():
@@ -196,58 +256,168 @@ class UploadAnnotationsUseCase(BaseReportableUseCae):
                 template = "Could not find attributes matching existing attributes on the platform: [{}]"
             logger.warning(template.format("', '".join(values)))
 
-    def execute(self):
-        uploaded_annotations = []
-        failed_annotations = []
-        if self.annotations_to_upload:
-            iterations_range = range(
-                0, len(self.annotations_to_upload), self.AUTH_DATA_CHUNK_SIZE
+    async def _upload_annotation_async(
+        self,
+        session,
+        executor: concurrent.futures.Executor,
+        image_id: int,
+        image_name: str,
+        upload_data: UploadAnnotationAuthData,
+        path: str,
+        s3_client,
+    ):
+        try:
+            use_case = self._get_upload_use_case(
+                image_id, image_name, upload_data, path, s3_client
             )
-            self.reporter.start_progress(
-                len(self.annotations_to_upload), description="Uploading Annotations"
+            files = await asyncio.get_event_loop().run_in_executor(
+                executor, use_case.get_upload_files
             )
-            for step in iterations_range:
-                annotations_to_upload = self.annotations_to_upload[
-                    step : step + self.AUTH_DATA_CHUNK_SIZE
-                ]  # noqa: E203
-                upload_data = self.get_annotation_upload_data(
-                    [int(image.id) for image in annotations_to_upload]
-                )
-                bucket = self.get_bucket_to_upload(
-                    [int(image.id) for image in annotations_to_upload]
+            if files is None:
+                self.reporter.store_message("Invalid jsons", path)
+                return path, False
+            for key, body in files:
+                url = s3_client.generate_presigned_url(
+                    "put_object",
+                    Params={"Bucket": upload_data.bucket, "Key": key},
+                    ExpiresIn=self.PRESIGNED_URL_EXPIRATION,
                 )
-                if bucket:
-                    image_id_name_map = {
-                        image.id: image for image in self.annotations_to_upload
-                    }
+                async with session.put(url, data=body) as response:
+                    response.raise_for_status()
+            if self.journal:
+                self.journal.set_state(image_name, UploadJournal.UPLOADED)
+            return path, True
+        except Exception as _:
+            return path, False
+        finally:
+            self.reporter.update_progress()
+
+    async def _upload_async(self, image_id_name_map: dict):
+        """
+        Uploads the annotations with presigned PUT requests.
+        Upload data of the next chunk is requested while the previous chunk uploads are
+        in flight, the only limit is ASYNC_MAX_CONCURRENCY uploads at once.
+        """
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError(
+                "To use the async annotation upload please install aiohttp package "
+                "with # pip install aiohttp"
+            )
+        loop = asyncio.get_event_loop()
+        semaphore = asyncio.Semaphore(self.ASYNC_MAX_CONCURRENCY)
+        tasks = []
+        connector = aiohttp.TCPConnector(limit=self.ASYNC_MAX_CONCURRENCY)
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.MAX_WORKERS
+        ) as executor:
+            async with aiohttp.ClientSession(connector=connector) as session:
+                for step in range(
+                    0, len(self.annotations_to_upload), self.AUTH_DATA_CHUNK_SIZE
+                ):
+                    annotations_to_upload = self.annotations_to_upload[
+                        step : step + self.AUTH_DATA_CHUNK_SIZE  # noqa: E203
+                    ]
+                    upload_data = await loop.run_in_executor(
+                        executor,
+                        self.get_annotation_upload_data,
+                        [int(image.id) for image in annotations_to_upload],
+                    )
+                    if not upload_data:
+                        continue
+                    s3_client = self.get_s3_client(upload_data)
                     # dummy progress
                     for _ in range(
                         len(annotations_to_upload) - len(upload_data.images)
                     ):
                         self.reporter.update_progress()
-                    with concurrent.futures.ThreadPoolExecutor(
-                        max_workers=self.MAX_WORKERS
-                    ) as executor:
-                        results = [
-                            executor.submit(
-                                self._upload_annotation,
+                    for image_id in upload_data.images:
+                        await semaphore.acquire()
+                        task = loop.create_task(
+                            self._upload_annotation_async(
+                                session,
+                                executor,
                                 image_id,
                                 image_id_name_map[image_id].name,
                                 upload_data,
                                 image_id_name_map[image_id].path,
-                                bucket,
+                                s3_client,
                             )
-                            for image_id, image_data in upload_data.images.items()
-                        ]
-                        for future in concurrent.futures.as_completed(results):
-                            annotation, uploaded = future.result()
-                            if uploaded:
-                                uploaded_annotations.append(annotation)
-                            else:
-                                failed_annotations.append(annotation)
-                            self.reporter.update_progress()
+                        )
+                        task.add_done_callback(lambda _: semaphore.release())
+                        tasks.append(task)
+                return await asyncio.gather(*tasks)
+
+    def _run_async(self, image_id_name_map: dict):
+        coroutine = self._upload_async(image_id_name_map)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        # e.g. jupyter notebooks already run an event loop in the main thread
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+
+    def _upload(self, image_id_name_map: dict):
+        for step in range(
+            0, len(self.annotations_to_upload), self.AUTH_DATA_CHUNK_SIZE
+        ):
+            annotations_to_upload = self.annotations_to_upload[
+                step : step + self.AUTH_DATA_CHUNK_SIZE
+            ]  # noqa: E203
+            upload_data = self.get_annotation_upload_data(
+                [int(image.id) for image in annotations_to_upload]
+            )
+            if upload_data:
+                s3_client = self.get_s3_client(upload_data)
+                # dummy progress
+                for _ in range(len(annotations_to_upload) - len(upload_data.images)):
+                    self.reporter.update_progress()
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.MAX_WORKERS
+                ) as executor:
+                    results = [
+                        executor.submit(
+                            self._upload_annotation,
+                            image_id,
+                            image_id_name_map[image_id].name,
+                            upload_data,
+                            image_id_name_map[image_id].path,
+                            s3_client,
+                        )
+                        for image_id, image_data in upload_data.images.items()
+                    ]
+                    for future in concurrent.futures.as_completed(results):
+                        yield future.result()
+                        self.reporter.update_progress()
+
+    def execute(self):
+        annotations_to_upload = self.annotations_to_upload
+        # the annotations uploaded by the previous runs with the journal are reported as uploaded
+        uploaded_annotations = list(self._journaled_annotations)
+        failed_annotations = []
+        if annotations_to_upload:
+            self.reporter.start_progress(
+                len(self.annotations_to_upload), description="Uploading Annotations"
+            )
+            image_id_name_map = {
+                image.id: image for image in self.annotations_to_upload
+            }
+            if self._async_upload:
+                results = self._run_async(image_id_name_map)
+            else:
+                results = self._upload(image_id_name_map)
+            for annotation, uploaded in results:
+                if uploaded:
+                    uploaded_annotations.append(annotation)
+                else:
+                    failed_annotations.append(annotation)
             self.reporter.finish_progress()
             self._log_report()
+        if self._journal:
+            self._journal.close()
+            self._journal = None
         self._response.data = (
             uploaded_annotations,
             failed_annotations,
@@ -269,7 +439,7 @@ class UploadAnnotationUseCase(BaseReportableUseCae):
         validators: BaseAnnotationValidator,
         annotation_upload_data: UploadAnnotationAuthData = None,
         annotations: dict = None,
-        s3_bucket=None,
+        s3_client=None,
         client_s3_bucket=None,
         mask=None,
         verbose: bool = True,
@@ -288,7 +458,7 @@ class UploadAnnotationUseCase(BaseReportableUseCae):
         self._templates = templates
         self._annotation_path = annotation_path
         self._annotation_upload_data = annotation_upload_data
-        self._s3_bucket = s3_bucket
+        self._s3_client = s3_client
         self._client_s3_bucket = client_s3_bucket
         self._pass_validation = pass_validation
         self._validators = validators
@@ -307,19 +477,14 @@ class UploadAnnotationUseCase(BaseReportableUseCae):
         return self._annotation_upload_data
 
     @property
-    def s3_bucket(self):
-        if not self._s3_bucket:
+    def s3_client(self):
+        if not self._s3_client:
             upload_data = self.annotation_upload_data
             if upload_data:
-                session = boto3.Session(
-                    aws_access_key_id=upload_data.access_key,
-                    aws_secret_access_key=upload_data.secret_key,
-                    aws_session_token=upload_data.session_token,
-                    region_name=upload_data.region,
+                self._s3_client = get_upload_s3_client(
+                    self._project, self._folder, upload_data
                 )
-                resource = session.resource("s3")
-                self._s3_bucket = resource.Bucket(upload_data.bucket)
-        return self._s3_bucket
+        return self._s3_client
 
     def get_s3_file(self, s3, path: str):
         file = io.BytesIO()
@@ -410,33 +575,45 @@ class UploadAnnotationUseCase(BaseReportableUseCae):
         )
         return use_case.execute().data
 
+    def get_upload_files(self) -> Optional[List[Tuple[str, Union[str, bytes]]]]:
+        """
+        Prepares the annotation files of the image for the upload.
+        Returns s3 key and body pairs, or None if the annotation json is not valid.
+        """
+        self.set_annotation_json()
+        if not self.is_valid_json(self._annotation_json):
+            return None
+        annotation_json = self.prepare_annotations(
+            project_type=self._project.project_type,
+            annotations=self._annotation_json,
+            annotation_classes=self._annotation_classes,
+            templates=self._templates,
+            reporter=self.reporter,
+        )
+        image_upload_data = self.annotation_upload_data.images[self._image.uuid]
+        files = [
+            (image_upload_data["annotation_json_path"], json.dumps(annotation_json))
+        ]
+        if (
+            self._project.project_type == constances.ProjectType.PIXEL.value
+            and self._mask
+        ):
+            files.append(
+                (
+                    image_upload_data["annotation_bluemap_path"],
+                    self._mask.read() if hasattr(self._mask, "read") else self._mask,
+                )
+            )
+        return files
+
     def execute(self):
         if self.is_valid():
-            self.set_annotation_json()
-            if self.is_valid_json(self._annotation_json):
-                bucket = self.s3_bucket
-                annotation_json = self.prepare_annotations(
-                    project_type=self._project.project_type,
-                    annotations=self._annotation_json,
-                    annotation_classes=self._annotation_classes,
-                    templates=self._templates,
-                    reporter=self.reporter,
-                )
-                bucket.put_object(
-                    Key=self.annotation_upload_data.images[self._image.uuid][
-                        "annotation_json_path"
-                    ],
-                    Body=json.dumps(annotation_json),
-                )
-                if (
-                    self._project.project_type == constances.ProjectType.PIXEL.value
-                    and self._mask
-                ):
-                    bucket.put_object(
-                        Key=self.annotation_upload_data.images[self._image.uuid][
-                            "annotation_bluemap_path"
-                        ],
-                        Body=self._mask,
+            files = self.get_upload_files()
+            if files is not None:
+                s3_client = self.s3_client
+                for key, body in files:
+                    s3_client.put_object(
+                        Bucket=self.annotation_upload_data.bucket, Key=key, Body=body
                     )
                 if self._verbose:
                     logger.info(
@@ -3,13 +3,18 @@ import copy
 import io
 import json
 import logging
+import multiprocessing
 import os.path
+import queue
 import random
+import threading
 import time
 import uuid
 from collections import defaultdict
 from collections import namedtuple
 from pathlib import Path
+from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
 
@@ -21,6 +26,8 @@ import requests
 from botocore.exceptions import ClientError
 from lib.core.conditions import Condition
 from lib.core.conditions import CONDITION_EQ as EQ
+from lib.core.content_index import content_hash
+from lib.core.content_index import ContentIndex
 from lib.core.entities import AnnotationClassEntity
 from lib.core.entities import FolderEntity
 from lib.core.entities import ImageEntity
@@ -33,6 +40,9 @@ from lib.core.enums import ProjectType
 from lib.core.exceptions import AppException
 from lib.core.exceptions import AppValidationException
 from lib.core.exceptions import ImageProcessingException
+from lib.core.journal import UploadJournal
+from lib.core.pipeline import Pipeline
+from lib.core.pipeline import PipelineStage
 from lib.core.plugin import ImagePlugin
 from lib.core.plugin import VideoPlugin
 from lib.core.repositories import BaseManageableRepository
@@ -44,10 +54,156 @@ from lib.core.usecases.base import BaseUseCase
 from lib.core.usecases.projects import GetAnnotationClassesUseCase
 from lib.core.validators import BaseAnnotationValidator
 from PIL import UnidentifiedImageError
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger("root")
 
 
+def _start_process_pool(
+    max_workers: int, initializer=None, initargs=()
+) -> concurrent.futures.ProcessPoolExecutor:
+    """
+    Creates the process pool and starts its processes at once, so they are forked
+    before the pipeline threads are started and not from one of them on the first submit.
+    """
+    pool = concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers, initializer=initializer, initargs=initargs
+    )
+    pool.submit(int).result()
+    return pool
+
+
+ImageDerivatives = namedtuple(
+    "ImageDerivatives",
+    ["thumb", "lores", "huge", "width", "height", "huge_width", "huge_height"],
+)
+
+
+def generate_image_derivatives(
+    image: io.BytesIO, image_name: str, max_resolution: int, quality: int
+) -> ImageDerivatives:
+    """
+    Generates thumbnail, low resolution and huge images.
+    Module level to be usable in a process pool, lores is None when the original image should be used.
+    """
+    image_processor = ImagePlugin(image, max_resolution)
+    origin_width, origin_height = image_processor.get_size()
+    is_jpeg = Path(image_name).suffix[1:].upper() in ("JPEG", "JPG")
+    (
+        thumb_image,
+        huge_image,
+        low_resolution_image,
+    ) = image_processor.generate_derivatives(
+        quality=quality,
+        subsampling=0 if quality == 100 else -1,
+        low_resolution=not (is_jpeg and quality == 100),
+    )
+    huge_width, huge_height = origin_width, origin_height
+    return ImageDerivatives(
+        thumb=thumb_image,
+        lores=low_resolution_image,
+        huge=huge_image,
+        width=origin_width,
+        height=origin_height,
+        huge_width=huge_width,
+        huge_height=huge_height,
+    )
+
+
+_video_frames_queue = None
+_video_stop_event = None
+
+
+def _init_video_worker(frames_queue, stop_event):
+    global _video_frames_queue, _video_stop_event
+    _video_frames_queue = frames_queue
+    _video_stop_event = stop_event
+
+
+def _put_video_frame(item, timeout: float = 0.1) -> bool:
+    while not _video_stop_event.is_set():
+        try:
+            _video_frames_queue.put(item, timeout=timeout)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def select_video_frames(
+    video_path: str,
+    frame_names: List[str],
+    estimated_count: int,
+    extra_frames: bool,
+    start_time,
+    end_time,
+    target_fps,
+    log=True,
+) -> Iterable:
+    """
+    Yields the (name, frame) of the given frames of the video, and with extra_frames
+    of the frames decoded past the estimated_count computed from the video metadata.
+    Logs the difference of the decoded frames count and the estimate.
+    """
+    frame_names = set(frame_names)
+    decoded_count = 0
+    for name, frame in VideoPlugin.named_frames_generator(
+        video_path, start_time, end_time, target_fps, log=log
+    ):
+        if not frame_names and not extra_frames:
+            return
+        decoded_count += 1
+        if name in frame_names:
+            frame_names.remove(name)
+            yield name, frame
+        elif extra_frames and decoded_count > estimated_count:
+            yield name, frame
+    if decoded_count != estimated_count:
+        logger.warning(
+            f"Decoded {decoded_count} frames of video {video_path}, "
+            f"its metadata estimated {estimated_count}."
+        )
+
+
+def extract_video_frames(
+    video_path: str,
+    frame_names: List[str],
+    estimated_count: int,
+    extra_frames: bool,
+    start_time,
+    end_time,
+    target_fps,
+) -> int:
+    """
+    Puts the selected frames of the video encoded to JPEG to the frames queue of the worker,
+    and the (video_path, None, error) marker when done, with the error message if it failed.
+    Module level to be usable in a process pool.
+    """
+    count = 0
+    error = None
+    try:
+        for name, frame in select_video_frames(
+            video_path,
+            frame_names,
+            estimated_count,
+            extra_frames,
+            start_time,
+            end_time,
+            target_fps,
+            log=False,
+        ):
+            data = VideoPlugin.encode_frame(frame).getvalue()
+            if not _put_video_frame((video_path, name, data)):
+                break
+            count += 1
+    except Exception as e:
+        error = str(e) or type(e).__name__
+        raise
+    finally:
+        _put_video_frame((video_path, None, error))
+    return count
+
+
 class GetImagesUseCase(BaseUseCase):
     def __init__(
         self,
@@ -168,6 +324,15 @@ class GetAllImagesUseCase(BaseUseCase):
 
 
 class GetBulkImages(BaseUseCase):
+    """
+    Resolves image names to image entities.
+    Names are split into server sized chunks which are requested in parallel,
+    the number of requests in flight is limited by MAX_WORKERS.
+    """
+
+    CHUNK_SIZE = 500
+    MAX_WORKERS = 4
+
     def __init__(
         self,
         service: SuerannotateServiceProvider,
@@ -182,21 +347,46 @@ class GetBulkImages(BaseUseCase):
         self._team_id = team_id
         self._folder_id = folder_id
         self._images = images
-        self._chunk_size = 500
+        self._chunk_size = self.CHUNK_SIZE
 
-    def execute(self):
+    def _get_chunk(self, images: List[str]) -> List[ImageEntity]:
+        response = self._service.get_bulk_images(
+            project_id=self._project_id,
+            team_id=self._team_id,
+            folder_id=self._folder_id,
+            images=images,
+        )
+        if "error" in response:
+            raise AppException(response["error"])
+        return [ImageEntity.from_dict(**image) for image in response]
+
+    def get_images(self) -> List[ImageEntity]:
+        chunks = [
+            self._images[i : i + self._chunk_size]  # noqa: E203
+            for i in range(0, len(self._images), self._chunk_size)
+        ]
+        if len(chunks) <= 1:
+            return self._get_chunk(chunks[0]) if chunks else []
         res = []
-        for i in range(0, len(self._images), self._chunk_size):
-            response = self._service.get_bulk_images(
-                project_id=self._project_id,
-                team_id=self._team_id,
-                folder_id=self._folder_id,
-                images=self._images[i : i + self._chunk_size],  # noqa: E203
-            )
-            if "error" in response:
-                raise AppException(response["error"])
-            res += [ImageEntity.from_dict(**image) for image in response]
-        self._response.data = res
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.MAX_WORKERS
+        ) as executor:
+            for images in executor.map(self._get_chunk, chunks):
+                res.extend(images)
+        return res
+
+    def execute(self):
+        self._response.data = self.get_images()
+        return self._response
+
+
+class GetBulkImagesMap(GetBulkImages):
+    """
+    Same as GetBulkImages, the response data is an image name to image entity map.
+    """
+
+    def execute(self):
+        self._response.data = {image.name: image for image in self.get_images()}
         return self._response
 
 
@@ -251,21 +441,24 @@ class AttachFileUrlsUseCase(BaseUseCase):
         return self._upload_state_code
 
     def execute(self):
-        response = self._backend_service.get_bulk_images(
-            project_id=self._project.uuid,
-            team_id=self._project.team_id,
-            folder_id=self._folder.uuid,
-            images=[image.name for image in self._attachments],
+        existing_images = (
+            GetBulkImagesMap(
+                service=self._backend_service,
+                project_id=self._project.uuid,
+                team_id=self._project.team_id,
+                folder_id=self._folder.uuid,
+                images=[image.name for image in self._attachments if image.name],
+            )
+            .execute()
+            .data
         )
-        if isinstance(response, dict) and "error" in response:
-            raise AppException(response["error"])
-        duplications = [image["name"] for image in response]
+        duplications = list(existing_images)
         meta = {}
         to_upload = []
         for image in self._attachments:
             if not image.name:
                 image.name = str(uuid.uuid4())
-            if image.name not in duplications:
+            if image.name not in existing_images:
                 to_upload.append({"name": image.name, "path": image.path})
                 meta[image.name] = {
                     "width": image.meta.width,
@@ -604,13 +797,17 @@ class ImagesBulkCopyUseCase(BaseUseCase):
 
     def execute(self):
         if self.is_valid():
-            images = self._backend_service.get_bulk_images(
-                project_id=self._project.uuid,
-                team_id=self._project.team_id,
-                folder_id=self._to_folder.uuid,
-                images=self._image_names,
+            duplications = list(
+                GetBulkImagesMap(
+                    service=self._backend_service,
+                    project_id=self._project.uuid,
+                    team_id=self._project.team_id,
+                    folder_id=self._to_folder.uuid,
+                    images=self._image_names,
+                )
+                .execute()
+                .data
             )
-            duplications = [image["name"] for image in images]
             images_to_copy = set(self._image_names) - set(duplications)
             skipped_images = duplications
             try:
@@ -785,6 +982,35 @@ class CreateFuseImageUseCase(BaseUseCase):
             )
         return tuple(int(value.lstrip("#")[i : i + 2], 16) for i in (0, 2, 4))
 
+    @staticmethod
+    def pack_colors(colors) -> np.ndarray:
+        """
+        Packs RGBA colors to uint32 values, the alpha of RGB colors is 255.
+        """
+        colors = np.asarray(colors, dtype=np.uint32)
+        alpha = colors[..., 3] if colors.shape[-1] > 3 else 255
+        return (
+            (colors[..., 0] << 24) | (colors[..., 1] << 16) | (colors[..., 2] << 8)
+        ) | alpha
+
+    @classmethod
+    def map_mask_colors(cls, mask: np.ndarray, color_map: dict) -> np.ndarray:
+        """
+        Maps the colors of the mask through the packed color to RGBA color lookup table,
+        the not mapped pixels are black.
+        """
+        height, width = mask.shape[:2]
+        result = np.full((height * width, 4), [0, 0, 0, 255], np.uint8)
+        if not color_map:
+            return result.reshape((height, width, 4))
+        keys = np.array(sorted(color_map), dtype=np.uint32)
+        values = np.array([color_map[key] for key in keys], dtype=np.uint8)
+        packed = cls.pack_colors(mask.reshape((height * width, mask.shape[2])))
+        indices = np.searchsorted(keys, packed).clip(max=len(keys) - 1)
+        matched = keys[indices] == packed
+        result[matched] = values[indices[matched]]
+        return result.reshape((height, width, 4))
+
     @property
     def annotations(self):
         if not self._annotations:
@@ -906,8 +1132,7 @@ class CreateFuseImageUseCase(BaseUseCase):
                         io.BytesIO(open(self.blue_mask_path, "rb").read())
                     ).content
                 )
-                weight, height = image.get_size()
-                empty_image_arr = np.full((height, weight, 4), [0, 0, 0, 255], np.uint8)
+                part_fill_colors = {}
                 for annotation in self.annotations["instances"]:
                     if (not annotation.get("className")) or (
                         not class_color_map.get(annotation["className"])
@@ -916,8 +1141,10 @@ class CreateFuseImageUseCase(BaseUseCase):
                     fill_color = *class_color_map[annotation["className"]], 255
                     for part in annotation["parts"]:
                         part_color = *self.generate_color(part["color"]), 255
-                        temp_mask = np.alltrue(annotation_mask == part_color, axis=2)
-                        empty_image_arr[temp_mask] = fill_color
+                        part_fill_colors[int(self.pack_colors(part_color))] = fill_color
+                empty_image_arr = self.map_mask_colors(
+                    annotation_mask, part_fill_colors
+                )
 
                 images = [
                     Image(
@@ -949,6 +1176,125 @@ class CreateFuseImageUseCase(BaseUseCase):
         return self._response
 
 
+class CreateFuseImagesUseCase(BaseInteractiveUseCase):
+    """
+    Creates the fuse (and overlay) images of all annotated images of an export,
+    the images are processed by a process pool if processing_workers is set.
+    """
+
+    def __init__(
+        self,
+        project_type: str,
+        export_root: str,
+        generate_overlay: bool = False,
+        processing_workers: int = None,
+    ):
+        super().__init__()
+        self._project_type = project_type
+        self._export_root = export_root
+        self._generate_overlay = generate_overlay
+        self._processing_workers = processing_workers
+        self._image_paths = None
+
+    @property
+    def classes_path(self) -> Path:
+        return Path(self._export_root) / "classes" / "classes.json"
+
+    @property
+    def is_pixel(self) -> bool:
+        return self._project_type.upper() == constances.ProjectType.PIXEL.name.upper()
+
+    def validate_project_type(self):
+        if self._project_type.upper() not in (
+            constances.ProjectType.VECTOR.name.upper(),
+            constances.ProjectType.PIXEL.name.upper(),
+        ):
+            raise AppValidationException(
+                "Fuse images can be created only for Vector and Pixel projects."
+            )
+
+    def validate_export_root(self):
+        if not self.classes_path.is_file():
+            raise AppValidationException(
+                f"There is no classes/classes.json in {self._export_root}."
+            )
+
+    def validate_processing_workers(self):
+        if self._processing_workers is not None and self._processing_workers < 1:
+            raise AppValidationException("processing_workers should be positive.")
+
+    @property
+    def image_paths(self) -> List[str]:
+        if self._image_paths is None:
+            suffix = "___pixel.json" if self.is_pixel else "___objects.json"
+            self._image_paths = []
+            for annotation_path in sorted(Path(self._export_root).rglob(f"*{suffix}")):
+                image_path = annotation_path.with_name(
+                    annotation_path.name[: -len(suffix)]
+                )
+                if image_path.is_file():
+                    self._image_paths.append(str(image_path))
+        return self._image_paths
+
+    @staticmethod
+    def create_fuse_image(
+        project_type: str, image_path: str, classes: list, generate_overlay: bool
+    ) -> Optional[List[str]]:
+        return (
+            CreateFuseImageUseCase(
+                project_type=project_type,
+                image_path=image_path,
+                classes=classes,
+                generate_overlay=generate_overlay,
+            )
+            .execute()
+            .data
+        )
+
+    def execute(self):
+        """
+        Yields after every processed image, the response data is the list of created
+        image paths per image, None for the images which couldn't be processed.
+        """
+        if self.is_valid():
+            with open(self.classes_path) as file:
+                classes = json.load(file)
+            args = [
+                (self._project_type, path, classes, self._generate_overlay)
+                for path in self.image_paths
+            ]
+            results = {}
+            if self._processing_workers:
+                with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self._processing_workers
+                ) as executor:
+                    futures = {
+                        executor.submit(self.create_fuse_image, *arg): arg[1]
+                        for arg in args
+                    }
+                    for future in concurrent.futures.as_completed(futures):
+                        try:
+                            results[futures[future]] = future.result()
+                        except Exception as e:
+                            logger.warning(
+                                "Couldn't create fuse image for %s: %s",
+                                futures[future],
+                                e,
+                            )
+                        yield
+            else:
+                for arg in args:
+                    try:
+                        results[arg[1]] = self.create_fuse_image(*arg)
+                    except Exception as e:
+                        logger.warning(
+                            "Couldn't create fuse image for %s: %s", arg[1], e
+                        )
+                    yield
+            self._response.data = [results.get(path) for path in self.image_paths]
+        return self._response
+
+
 class GetS3ImageUseCase(BaseUseCase):
     def __init__(
         self, s3_bucket, image_path: str,
@@ -1224,6 +1570,12 @@ class UploadImageToProject(BaseUseCase):
 
 class UploadImagesToProject(BaseInteractiveUseCase):
     MAX_WORKERS = 10
+    READ_WORKERS = 4
+    PROCESS_WORKERS = MAX_WORKERS
+    UPLOAD_WORKERS = MAX_WORKERS
+    ATTACH_WORKERS = 1
+    ATTACH_CHUNK_SIZE = 100
+    QUEUE_SIZE = 2 * MAX_WORKERS
 
     def __init__(
         self,
@@ -1239,6 +1591,10 @@ class UploadImagesToProject(BaseInteractiveUseCase):
         exclude_file_patterns: List[str] = constances.DEFAULT_FILE_EXCLUDE_PATTERNS,
         recursive_sub_folders: bool = False,
         image_quality_in_editor=None,
+        upload_workers: int = None,
+        processing_workers: int = None,
+        journal_path: str = None,
+        content_index_path: str = None,
     ):
         super().__init__()
 
@@ -1261,6 +1617,20 @@ class UploadImagesToProject(BaseInteractiveUseCase):
             )
         self._exclude_file_patterns = exclude_file_patterns
         self._annotation_status = annotation_status
+        self._attach_lock = threading.Lock()
+        self._attached = []
+        self._attach_duplications = []
+        self._upload_workers = upload_workers
+        self._processing_workers = processing_workers
+        self._process_pool = None
+        self._journal_path = journal_path
+        self._journal = None
+        self._images_to_attach = []
+        self._journaled_images = []
+        self._content_index_path = content_index_path
+        self._content_index = None
+        self._deduplication_lock = threading.Lock()
+        self._deduplication_report = {"images": 0, "bytes": 0, "cpu_time": 0.0}
 
     @property
     def extensions(self):
@@ -1282,7 +1652,7 @@ class UploadImagesToProject(BaseInteractiveUseCase):
         )
         if not response.ok:
             raise AppValidationException(response.error)
-        to_upload_count = len(self.images_to_upload[0])
+        to_upload_count = len(self.images_to_upload[0]) + len(self._images_to_attach)
         if to_upload_count > response.data.folder_limit.remaining_image_count:
             raise AppValidationException(constances.UPLOAD_FOLDER_LIMIT_ERROR_MESSAGE)
         elif to_upload_count > response.data.project_limit.remaining_image_count:
@@ -1344,10 +1714,55 @@ class UploadImagesToProject(BaseInteractiveUseCase):
             )
         return self._s3_repo_instance
 
-    def _upload_image(self, image_path: str):
-        ProcessedImage = namedtuple(
-            "ProcessedImage", ["uploaded", "path", "entity", "name"]
-        )
+    @property
+    def journal(self) -> Optional[UploadJournal]:
+        if self._journal_path and not self._journal:
+            self._journal = UploadJournal(
+                self._journal_path,
+                scope=f"images:{self._project.team_id}:{self._project.uuid}:{self._folder.uuid}",
+            )
+        return self._journal
+
+    def _close_journal(self):
+        if self._journal:
+            self._journal.close()
+            self._journal = None
+
+    def filter_journaled_paths(self, paths: List[str]) -> List[str]:
+        """
+        Skips the images which were uploaded by the previous runs with the same journal.
+        Images which were put to S3 but not attached are collected to be attached only.
+        """
+        states = self.journal.get_states()
+        self._images_to_attach = []
+        self._journaled_images = []
+        paths_to_upload = []
+        for path in paths:
+            name = Path(path).name
+            state, data = states.get(name, (None, None))
+            if state == UploadJournal.ATTACHED:
+                self._journaled_images.append(name)
+                continue
+            if state == UploadJournal.UPLOADED:
+                self._images_to_attach.append(
+                    ImageEntity(
+                        name=name,
+                        path=data["path"],
+                        meta=ImageInfoEntity(
+                            width=data["width"], height=data["height"]
+                        ),
+                    )
+                )
+            else:
+                paths_to_upload.append(path)
+        if self._journaled_images:
+            logger.info(
+                "Skipping %s images uploaded by a previous run with the journal.",
+                len(self._journaled_images),
+            )
+        return paths_to_upload
+
+    def _read_image(self, image_path: str):
         if self._from_s3_bucket:
             response = GetS3ImageUseCase(
                 s3_bucket=self._from_s3_bucket, image_path=image_path
@@ -1356,24 +1771,41 @@ class UploadImagesToProject(BaseInteractiveUseCase):
                 logger.warning(
                     f"Unable to upload image {image_path} \n{response.errors}"
                 )
-                return ProcessedImage(
-                    uploaded=False,
-                    path=image_path,
-                    entity=None,
-                    name=Path(image_path).name,
-                )
+                raise AppException(response.errors)
             image_bytes = response.data
         else:
-            try:
-                image_bytes = io.BytesIO(open(image_path, "rb").read())
-            except OSError:
-                return ProcessedImage(
-                    uploaded=False,
-                    path=image_path,
-                    entity=None,
-                    name=Path(image_path).name,
-                )
-        upload_response = UploadImageS3UseCase(
+            with open(image_path, "rb") as file:
+                image_bytes = io.BytesIO(file.read())
+        return image_path, image_bytes
+
+    @property
+    def deduplication_report(self) -> dict:
+        """
+        Number of images which were not processed and uploaded because an image with
+        the same content was uploaded before, and the uploaded bytes and processing time saved.
+        """
+        return self._deduplication_report
+
+    def _get_uploaded_content(self, image_path: str, content: dict) -> ImageEntity:
+        with self._deduplication_lock:
+            self._deduplication_report["images"] += 1
+            self._deduplication_report["bytes"] += content["bytes"]
+            self._deduplication_report["cpu_time"] += content["cpu_time"]
+        return ImageEntity(
+            name=Path(image_path).name,
+            path=content["path"],
+            meta=ImageInfoEntity(width=content["width"], height=content["height"]),
+        )
+
+    def _process_image(self, data):
+        image_path, image_bytes = data
+        hash_ = None
+        if self._content_index:
+            hash_ = content_hash(image_bytes.getbuffer())
+            content = self._content_index.get(hash_)
+            if content:
+                return self._get_uploaded_content(image_path, content)
+        use_case = UploadImageS3UseCase(
             project=self._project,
             project_settings=self._settings,
             image_path=image_path,
@@ -1381,20 +1813,110 @@ class UploadImagesToProject(BaseInteractiveUseCase):
             s3_repo=self.s3_repository,
             upload_path=self.auth_data["filePath"],
             image_quality_in_editor=self._image_quality_in_editor,
-        ).execute()
-
-        if not upload_response.errors and upload_response.data:
-            entity = upload_response.data
-            return ProcessedImage(
-                uploaded=True,
-                path=entity.path,
-                entity=entity,
-                name=Path(image_path).name,
-            )
+        )
+        # the thread cpu time doesn't include the work done in the process pool
+        timer = time.perf_counter if self._process_pool else time.thread_time
+        start = timer()
+        derivatives = use_case.generate_derivatives(self._process_pool)
+        cpu_time = timer() - start
+        if self.journal:
+            self.journal.set_state(Path(image_path).name, UploadJournal.PROCESSED)
+        return use_case, derivatives, (hash_, cpu_time, image_bytes.getbuffer().nbytes)
+
+    def _put_image(self, data) -> ImageEntity:
+        if isinstance(data, ImageEntity):
+            # the same content is already uploaded
+            image = data
         else:
-            return ProcessedImage(
-                uploaded=False, path=image_path, entity=None, name=Path(image_path).name
+            use_case, derivatives, (hash_, cpu_time, image_size) = data
+            image = use_case.upload_derivatives(derivatives)
+            if hash_:
+                self._content_index.add(
+                    hash_,
+                    {
+                        "path": image.path,
+                        "width": image.meta.width,
+                        "height": image.meta.height,
+                        "bytes": image_size
+                        + sum(
+                            file.getbuffer().nbytes
+                            for file in (
+                                derivatives.thumb,
+                                derivatives.lores,
+                                derivatives.huge,
+                            )
+                            if file
+                        ),
+                        "cpu_time": cpu_time,
+                    },
+                )
+        if self.journal:
+            self.journal.set_state(
+                image.name,
+                UploadJournal.UPLOADED,
+                {
+                    "path": image.path,
+                    "width": image.meta.width,
+                    "height": image.meta.height,
+                },
             )
+        return image
+
+    def _attach_images(self, images: List[ImageEntity]) -> List[ImageEntity]:
+        response = AttachFileUrlsUseCase(
+            project=self._project,
+            folder=self._folder,
+            backend_service_provider=self._backend_client,
+            attachments=images,
+            annotation_status=self._annotation_status,
+            upload_state_code=constances.UploadState.BASIC.value,
+        ).execute()
+        if response.errors:
+            raise AppException(response.errors)
+        attachments, duplications = response.data
+        with self._attach_lock:
+            self._attached.extend(attachment["name"] for attachment in attachments)
+            self._attach_duplications.extend(duplications)
+        if self.journal:
+            self.journal.set_states(
+                [(image.name, None) for image in images], UploadJournal.ATTACHED
+            )
+        return images
+
+    @property
+    def pipeline(self) -> Pipeline:
+        return Pipeline(
+            [
+                PipelineStage(
+                    self._read_image,
+                    workers=self.READ_WORKERS,
+                    queue_size=self.QUEUE_SIZE,
+                ),
+                PipelineStage(
+                    self._process_image,
+                    workers=self._processing_workers or self.PROCESS_WORKERS,
+                    queue_size=self.QUEUE_SIZE,
+                ),
+                PipelineStage(
+                    self._put_image,
+                    workers=self._upload_workers or self.UPLOAD_WORKERS,
+                    queue_size=self.QUEUE_SIZE,
+                ),
+                PipelineStage(
+                    self._attach_images,
+                    workers=self.ATTACH_WORKERS,
+                    queue_size=self.ATTACH_CHUNK_SIZE * self.ATTACH_WORKERS,
+                    batch_size=self.ATTACH_CHUNK_SIZE,
+                ),
+            ]
+        )
+
+    def _get_pipeline_source(self, images_to_upload: List[str]) -> Iterable:
+        return images_to_upload
+
+    @staticmethod
+    def _get_source_name(source) -> str:
+        return source.split("/")[-1]
 
     def filter_paths(self, paths: List[str]):
         paths = [
@@ -1413,8 +1935,8 @@ class UploadImagesToProject(BaseInteractiveUseCase):
                 duplicated_paths.append(name_path_map[file_name][1:])
             filtered_paths.append(name_path_map[file_name][0])
 
-        image_entities = (
-            GetBulkImages(
+        existing_images = (
+            GetBulkImagesMap(
                 service=self._backend_client,
                 project_id=self._project.uuid,
                 team_id=self._project.team_id,
@@ -1425,67 +1947,107 @@ class UploadImagesToProject(BaseInteractiveUseCase):
             .data
         )
         images_to_upload = []
-        image_list = [image.name for image in image_entities]
 
         for path in filtered_paths:
-            if Path(path).name not in image_list:
+            if Path(path).name not in existing_images:
                 images_to_upload.append(path)
             else:
                 duplicated_paths.append(path)
         return list(set(images_to_upload)), duplicated_paths
 
+    @property
+    def journaled_images(self) -> List[str]:
+        """
+        Names of the images attached by the previous runs with the journal, they are skipped
+        and reported as uploaded.
+        """
+        self.images_to_upload
+        return list(self._journaled_images)
+
+    @property
+    def images_to_attach(self) -> List[ImageEntity]:
+        """
+        Images put to S3 by the previous run of the journal, which are not attached yet.
+        """
+        self.images_to_upload
+        return self._images_to_attach
+
     @property
     def images_to_upload(self):
         if not self._images_to_upload:
-            self._images_to_upload = self.filter_paths(self._paths)
+            paths = self._paths
+            if self.journal:
+                paths = self.filter_journaled_paths(paths)
+            self._images_to_upload = self.filter_paths(paths)
         return self._images_to_upload
 
+    def _start_process_pools(self):
+        if self._processing_workers:
+            self._process_pool = _start_process_pool(self._processing_workers)
+
+    def _shutdown_process_pools(self):
+        if self._process_pool:
+            self._process_pool.shutdown()
+            self._process_pool = None
+
     def execute(self):
         if self.is_valid():
             images_to_upload, duplications = self.images_to_upload
             images_to_upload = images_to_upload[: self.auth_data["availableImageCount"]]
-            if not images_to_upload:
+            if not images_to_upload and not self._images_to_attach:
+                self._close_journal()
+                self._response.data = self.journaled_images, [], duplications
                 return self._response
 
-            uploaded_images = []
+            self._attached, self._attach_duplications = [], []
             failed_images = []
-            with concurrent.futures.ThreadPoolExecutor(
-                max_workers=self.MAX_WORKERS
-            ) as executor:
-                results = [
-                    executor.submit(self._upload_image, image_path)
-                    for image_path in images_to_upload
-                ]
-                for future in concurrent.futures.as_completed(results):
-                    processed_image = future.result()
-                    if processed_image.uploaded and processed_image.entity:
-                        uploaded_images.append(processed_image)
-                    else:
-                        failed_images.append(processed_image.path)
+            if self._content_index_path:
+                self._content_index = ContentIndex(
+                    self._content_index_path, scope=self.auth_data["bucket"]
+                )
+            self._start_process_pools()
+            try:
+                for i in range(0, len(self._images_to_attach), self.ATTACH_CHUNK_SIZE):
+                    images = self._images_to_attach[
+                        i : i + self.ATTACH_CHUNK_SIZE  # noqa: E203
+                    ]
+                    try:
+                        self._attach_images(images)
+                    except AppException as e:
+                        logger.error(e)
+                    for _ in images:
+                        yield
+                for item in self.pipeline.run(
+                    self._get_pipeline_source(images_to_upload)
+                ):
+                    if item.failed:
+                        if item.stage != self._attach_images.__name__:
+                            failed_images.append(
+                                self._get_source_name(item.source)
+                            )
+                        else:
+                            logger.error(item.error)
                     yield
-
-            uploaded = []
-            for i in range(0, len(uploaded_images), 100):
-                response = AttachFileUrlsUseCase(
-                    project=self._project,
-                    folder=self._folder,
-                    backend_service_provider=self._backend_client,
-                    attachments=[
-                        image.entity
-                        for image in uploaded_images[i : i + 100]  # noqa: E203
-                    ],
-                    annotation_status=self._annotation_status,
-                    upload_state_code=constances.UploadState.BASIC.value,
-                ).execute()
-                if response.errors:
-                    logger.error(response.errors)
-                    continue
-                attachments, attach_duplications = response.data
-                uploaded.extend(attachments)
-                duplications.extend(attach_duplications)
-            uploaded = [image["name"] for image in uploaded]
-            failed_images = [image.split("/")[-1] for image in failed_images]
-            self._response.data = uploaded, failed_images, duplications
+            finally:
+                self._shutdown_process_pools()
+                if self._content_index:
+                    self._content_index.close()
+                    self._content_index = None
+                self._close_journal()
+            if self._deduplication_report["images"]:
+                logger.info(
+                    "%s images with already uploaded content were attached without uploading, "
+                    "saved %s bytes of upload and %.2f seconds of processing.",
+                    self._deduplication_report["images"],
+                    self._deduplication_report["bytes"],
+                    self._deduplication_report["cpu_time"],
+                )
+            duplications.extend(self._attach_duplications)
+            self._response.data = (
+                self.journaled_images + self._attached,
+                failed_images,
+                duplications,
+            )
         return self._response
 
 
@@ -1506,6 +2068,10 @@ class UploadImagesFromFolderToProject(UploadImagesToProject):
         exclude_file_patterns: List[str] = constances.DEFAULT_FILE_EXCLUDE_PATTERNS,
         recursive_sub_folders: bool = False,
         image_quality_in_editor=None,
+        upload_workers: int = None,
+        processing_workers: int = None,
+        journal_path: str = None,
+        content_index_path: str = None,
     ):
         paths = UploadImagesFromFolderToProject.extract_paths(
             folder_path=folder_path,
@@ -1526,6 +2092,10 @@ class UploadImagesFromFolderToProject(UploadImagesToProject):
             exclude_file_patterns,
             recursive_sub_folders,
             image_quality_in_editor,
+            upload_workers,
+            processing_workers,
+            journal_path,
+            content_index_path,
         )
 
     @classmethod
@@ -1568,6 +2138,283 @@ class UploadImagesFromFolderToProject(UploadImagesToProject):
         return [str(path) for path in paths]
 
 
+class UploadVideoFramesUseCase(UploadImagesToProject):
+    """
+    Uploads the frames of the videos without writing them to the disk.
+    By default the frames are decoded in the pipeline feeder thread and encoded to JPEG by the read stage,
+    with video_workers the videos are decoded and encoded in parallel by a process pool.
+    Either way the frames of all the videos go through the same upload pipeline.
+    The frames to upload are named by the frames count of the video metadata,
+    the frames decoded past that estimate are uploaded as well within the limits.
+    """
+
+    FRAMES_QUEUE_SIZE = 2 * UploadImagesToProject.MAX_WORKERS
+    POLL_INTERVAL = 0.1
+
+    def __init__(
+        self,
+        project: ProjectEntity,
+        folder: FolderEntity,
+        settings: BaseManageableRepository,
+        s3_repo,
+        backend_client: SuerannotateServiceProvider,
+        video_paths: List[str],
+        start_time: float = 0.0,
+        end_time: float = None,
+        target_fps: float = None,
+        annotation_status="NotStarted",
+        image_quality_in_editor=None,
+        upload_workers: int = None,
+        processing_workers: int = None,
+        video_workers: int = None,
+    ):
+        self._start_time = start_time
+        self._end_time = end_time
+        self._target_fps = target_fps
+        self._video_workers = video_workers
+        self._limit = None
+        self._extra_frames = None
+        self._failed_frames = []
+        self._frames_queue = None
+        self._stop_event = None
+        self._video_pool = None
+        self._video_frame_names = {
+            str(video_path): VideoPlugin.get_extractable_frames(
+                video_path, start_time, end_time, target_fps
+            )
+            for video_path in video_paths
+        }
+        self._frame_videos = {}
+        self._video_progress = {video_path: 0 for video_path in self._video_frame_names}
+        super().__init__(
+            project,
+            folder,
+            settings,
+            s3_repo,
+            backend_client,
+            self.frame_names,
+            annotation_status=annotation_status,
+            image_quality_in_editor=image_quality_in_editor,
+            upload_workers=upload_workers,
+            processing_workers=processing_workers,
+        )
+
+    @property
+    def frame_names(self) -> List[str]:
+        return [
+            name for names in self._video_frame_names.values() for name in names
+        ]
+
+    @property
+    def video_frame_names(self) -> Dict[str, List[str]]:
+        return self._video_frame_names
+
+    @property
+    def video_progress(self) -> Dict[str, int]:
+        """
+        Number of the attached frames of every video.
+        """
+        return self._video_progress
+
+    def validate_limitations(self):
+        response = self._backend_client.get_limitations(
+            team_id=self._project.team_id,
+            project_id=self._project.uuid,
+            folder_id=self._folder.uuid,
+        )
+        if not response.ok:
+            raise AppValidationException(response.error)
+        if not response.data.folder_limit.remaining_image_count:
+            raise AppValidationException(constances.UPLOAD_FOLDER_LIMIT_ERROR_MESSAGE)
+        elif not response.data.project_limit.remaining_image_count:
+            raise AppValidationException(constances.UPLOAD_PROJECT_LIMIT_ERROR_MESSAGE)
+        elif (
+            response.data.user_limit
+            and response.data.user_limit.remaining_image_count < 1
+        ):
+            raise AppValidationException(constances.UPLOAD_USER_LIMIT_ERROR_MESSAGE)
+        limits = [
+            response.data.folder_limit.remaining_image_count,
+            response.data.project_limit.remaining_image_count,
+        ]
+        if response.data.user_limit:
+            limits.append(response.data.user_limit.remaining_image_count)
+        self._limit = min(limits)
+
+    def filter_paths(self, paths: List[str]):
+        images_to_upload, duplicated_paths = super().filter_paths(paths)
+        # keep the frames order, so the limits cut off the last frames of the last videos
+        images_to_upload = set(images_to_upload)
+        return [path for path in paths if path in images_to_upload], duplicated_paths
+
+    def _get_frames_to_upload(
+        self, images_to_upload: List[str]
+    ) -> Dict[str, List[str]]:
+        limit = self.auth_data["availableImageCount"]
+        if self._limit is not None:
+            limit = min(limit, self._limit)
+        images_to_upload = images_to_upload[:limit]
+        # the frames decoded past the metadata estimate are uploaded within the limit
+        self._extra_frames = limit - len(images_to_upload)
+        names_to_upload = set(images_to_upload)
+        video_frames = {}
+        for video_path, names in self._video_frame_names.items():
+            # a name repeated in several videos is uploaded from the first one
+            video_frames[video_path] = [
+                name for name in names if name in names_to_upload
+            ]
+            names_to_upload.difference_update(video_frames[video_path])
+            for name in video_frames[video_path]:
+                self._frame_videos[name] = video_path
+        return video_frames
+
+    def _select_frame(self, video_path: str, name: str) -> bool:
+        if self._frame_videos.get(name) == video_path:
+            return True
+        # decoded past the estimate, skipped if the name is taken or the limit is reached
+        if name in self._frame_videos or self._extra_frames <= 0:
+            return False
+        self._extra_frames -= 1
+        self._frame_videos[name] = video_path
+        self._video_frame_names[video_path].append(name)
+        return True
+
+    def _fail_video_frames(self, video_path: str, names: Iterable[str], error):
+        logger.error(f"Couldn't extract frames from video {video_path}: {error}")
+        self._failed_frames.extend(names)
+
+    def _decode_videos(self, video_frames: Dict[str, List[str]]) -> Iterable:
+        for video_path, names in video_frames.items():
+            if not names:
+                continue
+            remaining_names = dict.fromkeys(names)
+            try:
+                for name, frame in select_video_frames(
+                    video_path,
+                    names,
+                    len(self._video_frame_names[video_path]),
+                    self._extra_frames > 0,
+                    self._start_time,
+                    self._end_time,
+                    self._target_fps,
+                ):
+                    if self._select_frame(video_path, name):
+                        remaining_names.pop(name, None)
+                        yield name, frame
+            except Exception as e:
+                self._fail_video_frames(video_path, remaining_names, e)
+
+    def _decode_videos_in_processes(
+        self, video_frames: Dict[str, List[str]]
+    ) -> Iterable:
+        futures = {}
+        remaining_names = {}
+        try:
+            for video_path, names in video_frames.items():
+                if names:
+                    future = self._video_pool.submit(
+                        extract_video_frames,
+                        video_path,
+                        names,
+                        len(self._video_frame_names[video_path]),
+                        self._extra_frames > 0,
+                        self._start_time,
+                        self._end_time,
+                        self._target_fps,
+                    )
+                    futures[future] = video_path
+                    remaining_names[video_path] = dict.fromkeys(names)
+            while remaining_names:
+                try:
+                    video_path, name, data = self._frames_queue.get(
+                        timeout=self.POLL_INTERVAL
+                    )
+                except queue.Empty:
+                    # the end markers of the crashed workers never come
+                    if all(future.done() for future in futures) and any(
+                        isinstance(
+                            future.exception(),
+                            concurrent.futures.process.BrokenProcessPool,
+                        )
+                        for future in futures
+                    ):
+                        for future, video_path in futures.items():
+                            if video_path in remaining_names:
+                                self._fail_video_frames(
+                                    video_path,
+                                    remaining_names.pop(video_path),
+                                    future.exception(),
+                                )
+                    continue
+                if name is None:
+                    # the end marker carries the error of the worker
+                    names = remaining_names.pop(video_path)
+                    if data:
+                        self._fail_video_frames(video_path, names, data)
+                elif self._select_frame(video_path, name):
+                    remaining_names[video_path].pop(name, None)
+                    yield name, data
+        finally:
+            self._stop_event.set()
+            for future in futures:
+                future.cancel()
+
+    def _start_process_pools(self):
+        super()._start_process_pools()
+        if self._video_workers:
+            self._frames_queue = multiprocessing.Queue(maxsize=self.FRAMES_QUEUE_SIZE)
+            self._stop_event = multiprocessing.Event()
+            self._video_pool = _start_process_pool(
+                self._video_workers,
+                initializer=_init_video_worker,
+                initargs=(self._frames_queue, self._stop_event),
+            )
+
+    def _shutdown_process_pools(self):
+        super()._shutdown_process_pools()
+        if self._video_pool:
+            # unblocks the workers waiting for the queue if the pipeline stopped early
+            self._stop_event.set()
+            self._video_pool.shutdown()
+            self._video_pool = None
+
+    def execute(self):
+        self._failed_frames = []
+        yield from super().execute()
+        if self._failed_frames:
+            uploaded, failed_images, duplications = self._response.data
+            self._response.data = (
+                uploaded,
+                failed_images + self._failed_frames,
+                duplications,
+            )
+        return self._response
+
+    def _get_pipeline_source(self, images_to_upload: List[str]) -> Iterable:
+        video_frames = self._get_frames_to_upload(images_to_upload)
+        if self._video_workers:
+            return self._decode_videos_in_processes(video_frames)
+        return self._decode_videos(video_frames)
+
+    def _read_image(self, source):
+        name, frame = source
+        if isinstance(frame, bytes):
+            # encoded by the worker process
+            return name, io.BytesIO(frame)
+        return name, VideoPlugin.encode_frame(frame)
+
+    def _attach_images(self, images: List[ImageEntity]) -> List[ImageEntity]:
+        images = super()._attach_images(images)
+        with self._attach_lock:
+            for image in images:
+                self._video_progress[self._frame_videos[image.name]] += 1
+        return images
+
+    @staticmethod
+    def _get_source_name(source) -> str:
+        return source[0]
+
+
 class UploadImagesFromPublicUrls(BaseInteractiveUseCase):
     MAX_WORKERS = 10
     ProcessedImage = namedtuple("ProcessedImage", ["url", "uploaded", "path", "entity"])
@@ -1791,77 +2638,70 @@ class UploadImageS3UseCase(BaseUseCase):
             return constances.MAX_PIXEL_RESOLUTION
         return constances.MAX_VECTOR_RESOLUTION
 
-    def execute(self):
-        image_name = Path(self._image_path).name
-        try:
-            image_processor = ImagePlugin(self._image, self.max_resolution)
-            origin_width, origin_height = image_processor.get_size()
-            thumb_image, _, _ = image_processor.generate_thumb()
-            huge_image, huge_width, huge_height = image_processor.generate_huge()
-            quality = 60
-            if not self._image_quality_in_editor:
-                for setting in self._project_settings:
-                    if setting.attribute == "ImageQuality":
-                        quality = setting.value
-            else:
-                quality = ImageQuality.get_value(self._image_quality_in_editor)
-            if Path(image_name).suffix[1:].upper() in ("JPEG", "JPG"):
-                if quality == 100:
-                    self._image.seek(0)
-                    low_resolution_image = self._image
-                else:
-                    (
-                        low_resolution_image,
-                        _,
-                        _,
-                    ) = image_processor.generate_low_resolution(quality=quality)
-            else:
-                if quality == 100:
-                    (
-                        low_resolution_image,
-                        _,
-                        _,
-                    ) = image_processor.generate_low_resolution(
-                        quality=quality, subsampling=0
-                    )
-                else:
-                    (
-                        low_resolution_image,
-                        _,
-                        _,
-                    ) = image_processor.generate_low_resolution(
-                        quality=quality, subsampling=-1
-                    )
-            image_key = (
-                self._upload_path + str(uuid.uuid4()) + Path(self._image_path).suffix
-            )
+    @property
+    def quality(self) -> int:
+        quality = 60
+        if not self._image_quality_in_editor:
+            for setting in self._project_settings:
+                if setting.attribute == "ImageQuality":
+                    quality = setting.value
+        else:
+            quality = ImageQuality.get_value(self._image_quality_in_editor)
+        return quality
+
+    def generate_derivatives(self, process_pool=None) -> ImageDerivatives:
+        args = (
+            self._image,
+            Path(self._image_path).name,
+            self.max_resolution,
+            self.quality,
+        )
+        if process_pool:
+            return process_pool.submit(generate_image_derivatives, *args).result()
+        return generate_image_derivatives(*args)
 
-            file_entity = S3FileEntity(uuid=image_key, data=self._image)
+    def upload_derivatives(self, derivatives: ImageDerivatives) -> ImageEntity:
+        image_key = (
+            self._upload_path + str(uuid.uuid4()) + Path(self._image_path).suffix
+        )
 
-            thumb_image_name = image_key + "___thumb.jpg"
-            thumb_image_entity = S3FileEntity(uuid=thumb_image_name, data=thumb_image)
-            self._s3_repo.insert(thumb_image_entity)
+        file_entity = S3FileEntity(uuid=image_key, data=self._image)
 
-            low_resolution_image_name = image_key + "___lores.jpg"
-            low_resolution_file_entity = S3FileEntity(
-                uuid=low_resolution_image_name, data=low_resolution_image
-            )
-            self._s3_repo.insert(low_resolution_file_entity)
+        thumb_image_name = image_key + "___thumb.jpg"
+        thumb_image_entity = S3FileEntity(uuid=thumb_image_name, data=derivatives.thumb)
+        self._s3_repo.insert(thumb_image_entity)
 
-            huge_image_name = image_key + "___huge.jpg"
-            huge_file_entity = S3FileEntity(
-                uuid=huge_image_name,
-                data=huge_image,
-                metadata={"height": huge_width, "weight": huge_height},
-            )
-            self._s3_repo.insert(huge_file_entity)
-            file_entity.data.seek(0)
-            self._s3_repo.insert(file_entity)
-            self._response.data = ImageEntity(
-                name=image_name,
-                path=image_key,
-                meta=ImageInfoEntity(width=origin_width, height=origin_height),
-            )
+        low_resolution_image_name = image_key + "___lores.jpg"
+        low_resolution_image = derivatives.lores
+        if low_resolution_image is None:
+            self._image.seek(0)
+            low_resolution_image = self._image
+        low_resolution_file_entity = S3FileEntity(
+            uuid=low_resolution_image_name, data=low_resolution_image
+        )
+        self._s3_repo.insert(low_resolution_file_entity)
+
+        huge_image_name = image_key + "___huge.jpg"
+        huge_file_entity = S3FileEntity(
+            uuid=huge_image_name,
+            data=derivatives.huge,
+            metadata={
+                "height": derivatives.huge_width,
+                "weight": derivatives.huge_height,
+            },
+        )
+        self._s3_repo.insert(huge_file_entity)
+        file_entity.data.seek(0)
+        self._s3_repo.insert(file_entity)
+        return ImageEntity(
+            name=Path(self._image_path).name,
+            path=image_key,
+            meta=ImageInfoEntity(width=derivatives.width, height=derivatives.height),
+        )
+
+    def execute(self):
+        try:
+            self._response.data = self.upload_derivatives(self.generate_derivatives())
         except (ImageProcessingException, UnidentifiedImageError) as e:
             self._response.errors = e
         return self._response
@@ -2277,10 +3117,11 @@ class DownloadImageAnnotationsUseCase(BaseUseCase):
                 constances.LIMITED_FUNCTIONS[self._project.project_type]
             )
 
-    @property
-    def annotation_classes_id_name_map(self) -> dict:
+    @staticmethod
+    def get_annotation_classes_id_name_map(
+        annotation_classes: Iterable[AnnotationClassEntity],
+    ) -> dict:
         classes_data = defaultdict(dict)
-        annotation_classes = self._annotation_classes.get_all()
         for annotation_class in annotation_classes:
             class_info = {"name": annotation_class.name, "attribute_groups": {}}
             if annotation_class.attribute_groups:
@@ -2297,20 +3138,27 @@ class DownloadImageAnnotationsUseCase(BaseUseCase):
             classes_data[annotation_class.uuid] = class_info
         return classes_data
 
-    def get_templates_mapping(self):
-        templates = self._service.get_templates(team_id=self._project.team_id).get(
-            "data", []
+    @property
+    def annotation_classes_id_name_map(self) -> dict:
+        return self.get_annotation_classes_id_name_map(
+            self._annotation_classes.get_all()
         )
+
+    @staticmethod
+    def get_team_templates_mapping(service: SuerannotateServiceProvider, team_id: int):
+        templates = service.get_templates(team_id=team_id).get("data", [])
         templates_map = {}
         for template in templates:
             templates_map[template["id"]] = template["name"]
         return templates_map
 
-    def fill_classes_data(self, annotations: dict):
-        annotation_classes = self.annotation_classes_id_name_map
-        if "instances" not in annotations:
-            return
-        templates = self.get_templates_mapping()
+    def get_templates_mapping(self):
+        return self.get_team_templates_mapping(self._service, self._project.team_id)
+
+    @staticmethod
+    def fill_annotation_classes_data(
+        annotations: dict, annotation_classes: dict, templates: dict
+    ):
         for annotation in (
             i for i in annotations["instances"] if i.get("type", None) == "template"
         ):
@@ -2343,14 +3191,61 @@ class DownloadImageAnnotationsUseCase(BaseUseCase):
                     attribute["groupId"]
                 ]["attributes"][attribute["id"]]
 
+    def fill_classes_data(self, annotations: dict):
+        annotation_classes = self.annotation_classes_id_name_map
+        if "instances" not in annotations:
+            return
+        self.fill_annotation_classes_data(
+            annotations, annotation_classes, self.get_templates_mapping()
+        )
+
+    @staticmethod
+    def download_annotations(
+        get, project: ProjectEntity, credentials: dict, image_name: str, destination
+    ):
+        """
+        Downloads the annotation JSON of the image and saves its mask if it is a pixel project.
+
+        :param get: function sending the GET requests, requests.get or get of a session
+        :return: annotation JSON and mask path, None if the annotation JSON couldn't be loaded
+        """
+        annotation_json_creds = credentials["annotation_json_path"]
+        response = get(
+            url=annotation_json_creds["url"], headers=annotation_json_creds["headers"],
+        )
+        if not response.ok:
+            return None
+        annotation_json = response.json()
+        mask_path = None
+        if project.project_type == constances.ProjectType.PIXEL.value:
+            annotation_blue_map_creds = credentials["annotation_bluemap_path"]
+            response = get(
+                url=annotation_blue_map_creds["url"],
+                headers=annotation_blue_map_creds["headers"],
+            )
+            if response.ok:
+                mask_path = Path(destination) / f"{image_name}___save.png"
+                with open(mask_path, "wb") as f:
+                    f.write(io.BytesIO(response.content).getbuffer())
+            else:
+                logger.info("There is no blue-map for the image.")
+        return annotation_json, mask_path
+
+    @staticmethod
+    def save_annotation_json(
+        project: ProjectEntity, annotation_json: dict, image_name: str, destination
+    ) -> Path:
+        if project.project_type == constances.ProjectType.VECTOR.value:
+            file_postfix = "___objects.json"
+        else:
+            file_postfix = "___pixel.json"
+        json_path = Path(destination) / f"{image_name}{file_postfix}"
+        with open(json_path, "w") as f:
+            json.dump(annotation_json, f, indent=4)
+        return json_path
+
     def execute(self):
         if self.is_valid():
-            data = {
-                "annotation_json": None,
-                "annotation_json_filename": None,
-                "annotation_mask": None,
-                "annotation_mask_filename": None,
-            }
             image_response = self.image_use_case.execute()
             token = self._service.get_download_token(
                 project_id=self._project.uuid,
@@ -2359,47 +3254,315 @@ class DownloadImageAnnotationsUseCase(BaseUseCase):
                 image_id=image_response.data.uuid,
             )
             credentials = token["annotations"]["MAIN"][0]
-
-            annotation_json_creds = credentials["annotation_json_path"]
-            if self._project.project_type == constances.ProjectType.VECTOR.value:
-                file_postfix = "___objects.json"
-            else:
-                file_postfix = "___pixel.json"
-
-            response = requests.get(
-                url=annotation_json_creds["url"],
-                headers=annotation_json_creds["headers"],
+            annotations = self.download_annotations(
+                requests.get,
+                self._project,
+                credentials,
+                self._image_name,
+                self._destination,
             )
-            if not response.ok:
+            if not annotations:
                 logger.warning("Couldn't load annotations.")
                 self._response.data = (None, None)
                 return self._response
-            data["annotation_json"] = response.json()
-            data["annotation_json_filename"] = f"{self._image_name}{file_postfix}"
-            mask_path = None
-            if self._project.project_type == constances.ProjectType.PIXEL.value:
-                annotation_blue_map_creds = credentials["annotation_bluemap_path"]
-                response = requests.get(
-                    url=annotation_blue_map_creds["url"],
-                    headers=annotation_blue_map_creds["headers"],
-                )
-                data["annotation_mask_filename"] = f"{self._image_name}___save.png"
-                if response.ok:
-                    data["annotation_mask"] = io.BytesIO(response.content).getbuffer()
-                    mask_path = (
-                        Path(self._destination) / data["annotation_mask_filename"]
-                    )
-                    with open(mask_path, "wb") as f:
-                        f.write(data["annotation_mask"])
-                else:
-                    logger.info("There is no blue-map for the image.")
+            annotation_json, mask_path = annotations
+            self.fill_classes_data(annotation_json)
+            json_path = self.save_annotation_json(
+                self._project, annotation_json, self._image_name, self._destination
+            )
+            self._response.data = (str(json_path), str(mask_path))
+        return self._response
 
-            json_path = Path(self._destination) / data["annotation_json_filename"]
-            self.fill_classes_data(data["annotation_json"])
-            with open(json_path, "w") as f:
-                json.dump(data["annotation_json"], f, indent=4)
 
-            self._response.data = (str(json_path), str(mask_path))
+class DownloadImagesAnnotationsUseCase(BaseInteractiveUseCase):
+    """
+    Downloads the annotations of several images.
+    The images are resolved and the class and template maps are built once,
+    then the download tokens, JSONs and masks are requested by a thread pool sharing a connection pool.
+    """
+
+    DOWNLOAD_WORKERS = 16
+
+    def __init__(
+        self,
+        service: SuerannotateServiceProvider,
+        project: ProjectEntity,
+        folder: FolderEntity,
+        image_names: List[str],
+        destination: str,
+        annotation_classes: BaseManageableRepository,
+        download_workers: int = None,
+    ):
+        super().__init__()
+        self._service = service
+        self._project = project
+        self._folder = folder
+        self._image_names = image_names
+        self._destination = destination
+        self._annotation_classes = annotation_classes
+        self._download_workers = download_workers or self.DOWNLOAD_WORKERS
+        self._annotation_classes_map = {}
+        self._templates = {}
+        self._images_to_download = None
+        self._downloaded = {}
+
+    @property
+    def images_to_download(self) -> Dict[str, ImageEntity]:
+        if self._images_to_download is None:
+            self._images_to_download = self._get_images()
+        return self._images_to_download
+
+    def validate_project_type(self):
+        if self._project.project_type in constances.LIMITED_FUNCTIONS:
+            raise AppValidationException(
+                constances.LIMITED_FUNCTIONS[self._project.project_type]
+            )
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self._download_workers,
+            pool_maxsize=self._download_workers,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _get_download_token(self, image: ImageEntity) -> dict:
+        return self._service.get_download_token(
+            project_id=self._project.uuid,
+            team_id=self._project.team_id,
+            folder_id=self._folder.uuid,
+            image_id=image.uuid,
+        )
+
+    def _download_annotations(
+        self, session: requests.Session, image: ImageEntity, token: dict
+    ):
+        credentials = token["annotations"]["MAIN"][0]
+        annotations = DownloadImageAnnotationsUseCase.download_annotations(
+            session.get, self._project, credentials, image.name, self._destination
+        )
+        if not annotations:
+            logger.warning("Couldn't load annotations of %s.", image.name)
+            return None, None
+        annotation_json, mask_path = annotations
+        if "instances" in annotation_json:
+            DownloadImageAnnotationsUseCase.fill_annotation_classes_data(
+                annotation_json, self._annotation_classes_map, self._templates
+            )
+        json_path = DownloadImageAnnotationsUseCase.save_annotation_json(
+            self._project, annotation_json, image.name, self._destination
+        )
+        return str(json_path), str(mask_path)
+
+    def _download(self, session: requests.Session, image: ImageEntity):
+        try:
+            return self._download_annotations(
+                session, image, self._get_download_token(image)
+            )
+        except Exception as e:
+            logger.warning("Couldn't download annotations of %s: %s", image.name, e)
+            return None, None
+
+    def _get_images(self) -> Dict[str, ImageEntity]:
+        images = (
+            GetBulkImagesMap(
+                service=self._service,
+                project_id=self._project.uuid,
+                team_id=self._project.team_id,
+                folder_id=self._folder.uuid,
+                images=list(dict.fromkeys(self._image_names)),
+            )
+            .execute()
+            .data
+        )
+        not_found = [name for name in self._image_names if name not in images]
+        if not_found:
+            logger.warning(
+                "Couldn't find %s images: %s", len(not_found), ", ".join(not_found)
+            )
+        return images
+
+    def _prepare_annotation_maps(self):
+        self._annotation_classes_map = (
+            DownloadImageAnnotationsUseCase.get_annotation_classes_id_name_map(
+                self._annotation_classes.get_all()
+            )
+        )
+        self._templates = DownloadImageAnnotationsUseCase.get_team_templates_mapping(
+            self._service, self._project.team_id
+        )
+
+    def _download_all(self, images: Dict[str, ImageEntity]) -> Iterable:
+        """
+        Downloads the images in the thread pool and yields after every image,
+        the results are kept in the name to result map self._downloaded.
+        """
+        self._downloaded = {}
+        with self._create_session() as session, concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._download_workers
+        ) as executor:
+            futures = {
+                executor.submit(self._download, session, image): name
+                for name, image in images.items()
+            }
+            try:
+                for future in concurrent.futures.as_completed(futures):
+                    self._downloaded[futures[future]] = future.result()
+                    yield
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def execute(self):
+        """
+        Yields after every downloaded image, the response data is the list of
+        (annotation JSON path, mask path) of the images, (None, None) for the not found images.
+        """
+        if self.is_valid():
+            images = self.images_to_download
+            self._prepare_annotation_maps()
+            yield from self._download_all(images)
+            self._response.data = [
+                self._downloaded.get(name, (None, None)) for name in self._image_names
+            ]
+        return self._response
+
+
+class DownloadImagesUseCase(DownloadImagesAnnotationsUseCase):
+    """
+    Downloads the original or lores variants of several images, optionally with their annotations.
+    The image files are streamed to the disk by a thread pool, the files which are already
+    in the download directory with the size of the remote file are not downloaded again.
+    """
+
+    DOWNLOAD_WORKERS = 32
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(
+        self,
+        service: SuerannotateServiceProvider,
+        project: ProjectEntity,
+        folder: FolderEntity,
+        image_names: Optional[List[str]],
+        images: BaseReadOnlyRepository,
+        destination: str,
+        annotation_classes: BaseManageableRepository,
+        image_variant: str = "original",
+        include_annotations: bool = False,
+        download_workers: int = None,
+    ):
+        super().__init__(
+            service=service,
+            project=project,
+            folder=folder,
+            image_names=image_names,
+            destination=destination,
+            annotation_classes=annotation_classes,
+            download_workers=download_workers,
+        )
+        self._images = images
+        self._image_variant = image_variant
+        self._include_annotations = include_annotations
+        self._lock = threading.Lock()
+        self._downloaded_bytes = 0
+        self._skipped_count = 0
+
+    def validate_variant_type(self):
+        if self._image_variant not in ["original", "lores"]:
+            raise AppValidationException(
+                "Image download variant should be either original or lores"
+            )
+
+    def validate_download_path(self):
+        if not Path(str(self._destination)).is_dir():
+            raise AppValidationException(
+                f"local_dir_path {self._destination} is not an existing directory"
+            )
+
+    def _get_images(self) -> Dict[str, ImageEntity]:
+        if self._image_names is not None:
+            return super()._get_images()
+        condition = (
+            Condition("team_id", self._project.team_id, EQ)
+            & Condition("project_id", self._project.uuid, EQ)
+            & Condition("folder_id", self._folder.uuid, EQ)
+        )
+        images = {image.name: image for image in self._images.get_all(condition)}
+        self._image_names = list(images)
+        return images
+
+    def _prepare_annotation_maps(self):
+        if self._include_annotations:
+            super()._prepare_annotation_maps()
+
+    def _download_image(
+        self, session: requests.Session, image: ImageEntity, token: dict
+    ) -> Optional[str]:
+        path = Path(self._destination) / image.name
+        if self._image_variant == "lores":
+            path = path.with_name(f"{path.name}___lores.jpg")
+        credentials = token[self._image_variant]
+        with session.get(
+            url=credentials["url"], headers=credentials["headers"], stream=True
+        ) as response:
+            if not response.ok:
+                logger.warning(
+                    "Couldn't download image %s: %s", image.name, response.status_code
+                )
+                return None
+            size = response.headers.get("Content-Length")
+            if size and path.is_file() and path.stat().st_size == int(size):
+                with self._lock:
+                    self._skipped_count += 1
+                return str(path)
+            # the file is renamed when complete, so an interrupted download isn't taken for a downloaded one
+            part_path = path.with_name(f"{path.name}.part")
+            with open(part_path, "wb") as file:
+                for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                    file.write(chunk)
+                    with self._lock:
+                        self._downloaded_bytes += len(chunk)
+            os.replace(part_path, path)
+        return str(path)
+
+    def _download(self, session: requests.Session, image: ImageEntity):
+        try:
+            token = self._get_download_token(image)
+            image_path = self._download_image(session, image, token)
+            annotations = None
+            if image_path and self._include_annotations:
+                annotations = self._download_annotations(session, image, token)
+            return image_path, annotations
+        except Exception as e:
+            logger.warning("Couldn't download image %s: %s", image.name, e)
+            return None, None
+
+    def execute(self):
+        """
+        Yields after every downloaded image, the response data is the list of
+        (image path, annotation paths) of the images, (None, None) for the images which couldn't be downloaded.
+        """
+        if self.is_valid():
+            images = self.images_to_download
+            self._prepare_annotation_maps()
+            start = time.monotonic()
+            yield from self._download_all(images)
+            duration = max(time.monotonic() - start, 1e-6)
+            self._response.data = [
+                self._downloaded.get(name, (None, None)) for name in self._image_names
+            ]
+            downloaded_mb = self._downloaded_bytes / 2 ** 20
+            logger.info(
+                "Downloaded %s images (%s already existing) %.1f MB in %.1f s, %.1f MB/s.",
+                sum(1 for path, _ in self._response.data if path),
+                self._skipped_count,
+                downloaded_mb,
+                duration,
+                downloaded_mb / duration,
+            )
         return self._response
 
 
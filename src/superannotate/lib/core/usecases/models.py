@@ -14,8 +14,9 @@ import pandas as pd
 import requests
 from botocore.exceptions import ClientError
 from lib.app.analytics.common import aggregate_annotations_as_df
+from lib.app.analytics.common import aggregate_instance_attributes
 from lib.app.analytics.common import consensus_plot
-from lib.app.analytics.common import image_consensus
+from lib.app.analytics.common import images_consensus
 from lib.core.conditions import Condition
 from lib.core.conditions import CONDITION_EQ as EQ
 from lib.core.entities import FolderEntity
@@ -533,6 +534,7 @@ class BenchmarkUseCase(BaseUseCase):
         image_list: list,
         annotation_type: str,
         show_plots: bool,
+        processing_workers: int = None,
     ):
         super().__init__()
         self._project = project
@@ -542,69 +544,33 @@ class BenchmarkUseCase(BaseUseCase):
         self._image_list = image_list
         self._annotation_type = annotation_type
         self._show_plots = show_plots
+        self._processing_workers = processing_workers
 
     def execute(self):
         project_df = aggregate_annotations_as_df(self._export_dir)
+        project_df = project_df[project_df["instanceId"].notna()]
+        project_df = project_df.loc[
+            project_df["folderName"].isin(
+                [self._ground_truth_folder_name, *self._folder_names]
+            )
+        ]
+        if self._image_list is not None:
+            project_df = project_df.loc[project_df["imageName"].isin(self._image_list)]
+        project_df = project_df.query("type == '" + self._annotation_type + "'")
+        project_df = aggregate_instance_attributes(project_df)
+
         gt_project_df = project_df[
             project_df["folderName"] == self._ground_truth_folder_name
         ]
         benchmark_dfs = []
         for folder_name in self._folder_names:
-            folder_df = project_df[project_df["folderName"] == folder_name]
-            project_gt_df = pd.concat([folder_df, gt_project_df])
-            project_gt_df = project_gt_df[project_gt_df["instanceId"].notna()]
-
-            if self._image_list is not None:
-                project_gt_df = project_gt_df.loc[
-                    project_gt_df["imageName"].isin(self._image_list)
-                ]
-
-            project_gt_df.query("type == '" + self._annotation_type + "'", inplace=True)
-
-            project_gt_df = project_gt_df.groupby(
-                ["imageName", "instanceId", "folderName"]
+            # the folder instances are matched first, as the consensus matching is greedy
+            project_gt_df = pd.concat(
+                [project_df[project_df["folderName"] == folder_name], gt_project_df]
             )
-
-            def aggregate_attributes(instance_df):
-                def attribute_to_list(attribute_df):
-                    attribute_names = list(attribute_df["attributeName"])
-                    attribute_df["attributeNames"] = len(attribute_df) * [
-                        attribute_names
-                    ]
-                    return attribute_df
-
-                attributes = None
-                if not instance_df["attributeGroupName"].isna().all():
-                    attrib_group_name = instance_df.groupby("attributeGroupName")[
-                        ["attributeGroupName", "attributeName"]
-                    ].apply(attribute_to_list)
-                    attributes = dict(
-                        zip(
-                            attrib_group_name["attributeGroupName"],
-                            attrib_group_name["attributeNames"],
-                        )
-                    )
-
-                instance_df.drop(
-                    ["attributeGroupName", "attributeName"], axis=1, inplace=True
-                )
-                instance_df.drop_duplicates(
-                    subset=["imageName", "instanceId", "folderName"], inplace=True
-                )
-                instance_df["attributes"] = [attributes]
-                return instance_df
-
-            project_gt_df = project_gt_df.apply(aggregate_attributes).reset_index(
-                drop=True
+            benchmark_project_df = images_consensus(
+                project_gt_df, self._annotation_type, self._processing_workers
             )
-            unique_images = set(project_gt_df["imageName"])
-            all_benchmark_data = []
-            for image_name in unique_images:
-                image_data = image_consensus(
-                    project_gt_df, image_name, self._annotation_type
-                )
-                all_benchmark_data.append(pd.DataFrame(image_data))
-            benchmark_project_df = pd.concat(all_benchmark_data, ignore_index=True)
             benchmark_project_df = benchmark_project_df[
                 benchmark_project_df["folderName"] == folder_name
             ]
@@ -625,6 +591,7 @@ class ConsensusUseCase(BaseUseCase):
         image_list: list,
         annotation_type: str,
         show_plots: bool,
+        processing_workers: int = None,
     ):
         super().__init__()
         self._project = project
@@ -633,6 +600,7 @@ class ConsensusUseCase(BaseUseCase):
         self._image_list = image_list
         self._annota_type_type = annotation_type
         self._show_plots = show_plots
+        self._processing_workers = processing_workers
 
     def execute(self):
         project_df = aggregate_annotations_as_df(self._export_dir)
@@ -646,50 +614,13 @@ class ConsensusUseCase(BaseUseCase):
                 all_projects_df["imageName"].isin(self._image_list)
             ]
 
-        all_projects_df.query("type == '" + self._annota_type_type + "'", inplace=True)
-
-        def aggregate_attributes(instance_df):
-            def attribute_to_list(attribute_df):
-                attribute_names = list(attribute_df["attributeName"])
-                attribute_df["attributeNames"] = len(attribute_df) * [attribute_names]
-                return attribute_df
-
-            attributes = None
-            if not instance_df["attributeGroupName"].isna().all():
-                attrib_group_name = instance_df.groupby("attributeGroupName")[
-                    ["attributeGroupName", "attributeName"]
-                ].apply(attribute_to_list)
-                attributes = dict(
-                    zip(
-                        attrib_group_name["attributeGroupName"],
-                        attrib_group_name["attributeNames"],
-                    )
-                )
-
-            instance_df.drop(
-                ["attributeGroupName", "attributeName"], axis=1, inplace=True
-            )
-            instance_df.drop_duplicates(
-                subset=["imageName", "instanceId", "folderName"], inplace=True
-            )
-            instance_df["attributes"] = [attributes]
-            return instance_df
-
-        all_projects_df = all_projects_df.groupby(
-            ["imageName", "instanceId", "folderName"]
+        all_projects_df = all_projects_df.query(
+            "type == '" + self._annota_type_type + "'"
         )
-        all_projects_df = all_projects_df.apply(aggregate_attributes).reset_index(
-            drop=True
+        all_projects_df = aggregate_instance_attributes(all_projects_df)
+        consensus_df = images_consensus(
+            all_projects_df, self._annota_type_type, self._processing_workers
         )
-        unique_images = set(all_projects_df["imageName"])
-        all_consensus_data = []
-        for image_name in unique_images:
-            image_data = image_consensus(
-                all_projects_df, image_name, self._annota_type_type
-            )
-            all_consensus_data.append(pd.DataFrame(image_data))
-
-        consensus_df = pd.concat(all_consensus_data, ignore_index=True)
 
         if self._show_plots:
             consensus_plot(consensus_df, self._folder_names)
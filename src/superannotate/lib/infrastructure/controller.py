@@ -115,7 +115,6 @@ class BaseController(metaclass=SingleInstanceMetaClass):
         else:
             self._backend_client.api_url = main_endpoint
             self._backend_client._auth_token = token
-            self._backend_client.get_session.cache_clear()
         self._team_id = None
         self.validate_token(token)
         self._team_id = int(token.split("=")[-1])
@@ -159,7 +158,6 @@ class BaseController(metaclass=SingleInstanceMetaClass):
         self._backend_client = SuperannotateBackendService.get_instance()
         self._backend_client._api_url = self.configs.get_one("main_endpoint").value
         self._backend_client._auth_token = self.configs.get_one("token").value
-        self._backend_client.get_session.cache_clear()
 
     @property
     def projects(self):
@@ -408,6 +406,10 @@ class Controller(BaseController):
         recursive_sub_folders: Optional[bool] = None,
         image_quality_in_editor: str = None,
         from_s3_bucket=None,
+        upload_workers: Optional[int] = None,
+        processing_workers: Optional[int] = None,
+        journal_path: Optional[str] = None,
+        content_index_path: Optional[str] = None,
     ):
         project = self._get_project(project_name)
         folder = self._get_folder(project, folder_name)
@@ -427,6 +429,42 @@ class Controller(BaseController):
             exclude_file_patterns=exclude_file_patterns,
             recursive_sub_folders=recursive_sub_folders,
             image_quality_in_editor=image_quality_in_editor,
+            upload_workers=upload_workers,
+            processing_workers=processing_workers,
+            journal_path=journal_path,
+            content_index_path=content_index_path,
+        )
+
+    def upload_video_frames(
+        self,
+        project_name: str,
+        folder_name: str,
+        video_paths: List[str],
+        start_time: float = 0.0,
+        end_time: float = None,
+        target_fps: float = None,
+        annotation_status: str = None,
+        image_quality_in_editor: str = None,
+        video_workers: Optional[int] = None,
+    ):
+        project = self._get_project(project_name)
+        folder = self._get_folder(project, folder_name)
+
+        return usecases.UploadVideoFramesUseCase(
+            project=project,
+            folder=folder,
+            settings=ProjectSettingsRepository(
+                service=self._backend_client, project=project
+            ),
+            s3_repo=self.s3_repo,
+            backend_client=self._backend_client,
+            video_paths=video_paths,
+            start_time=start_time,
+            end_time=end_time,
+            target_fps=target_fps,
+            annotation_status=annotation_status,
+            image_quality_in_editor=image_quality_in_editor,
+            video_workers=video_workers,
         )
 
     def upload_images_from_public_urls_to_project(
@@ -1041,6 +1079,28 @@ class Controller(BaseController):
         )
         return use_case.execute()
 
+    def download_image_annotations_bulk(
+        self,
+        project_name: str,
+        folder_name: str,
+        image_names: List[str],
+        destination: str,
+        download_workers: Optional[int] = None,
+    ):
+        project = self._get_project(project_name)
+        folder = self._get_folder(project=project, name=folder_name)
+        return usecases.DownloadImagesAnnotationsUseCase(
+            service=self._backend_client,
+            project=project,
+            folder=folder,
+            image_names=image_names,
+            destination=destination,
+            annotation_classes=AnnotationClassRepository(
+                service=self._backend_client, project=project
+            ),
+            download_workers=download_workers,
+        )
+
     def download_image_pre_annotations(
         self, project_name: str, folder_name: str, image_name: str, destination: str
     ):
@@ -1261,6 +1321,20 @@ class Controller(BaseController):
         )
         return use_case.execute()
 
+    @staticmethod
+    def create_fuse_images(
+        project_type: str,
+        export_root: str,
+        generate_overlay: bool,
+        processing_workers: Optional[int] = None,
+    ):
+        return usecases.CreateFuseImagesUseCase(
+            project_type=project_type,
+            export_root=export_root,
+            generate_overlay=generate_overlay,
+            processing_workers=processing_workers,
+        )
+
     def download_image(
         self,
         project_name: str,
@@ -1294,6 +1368,33 @@ class Controller(BaseController):
         )
         return use_case.execute()
 
+    def download_images(
+        self,
+        project_name: str,
+        folder_name: str,
+        image_names: Optional[List[str]],
+        destination: str,
+        image_variant: str = "original",
+        include_annotations: bool = False,
+        download_workers: Optional[int] = None,
+    ):
+        project = self._get_project(project_name)
+        folder = self._get_folder(project, folder_name)
+        return usecases.DownloadImagesUseCase(
+            service=self._backend_client,
+            project=project,
+            folder=folder,
+            image_names=image_names,
+            images=self.images,
+            destination=destination,
+            annotation_classes=AnnotationClassRepository(
+                service=self._backend_client, project=project
+            ),
+            image_variant=image_variant,
+            include_annotations=include_annotations,
+            download_workers=download_workers,
+        )
+
     def set_project_workflow(self, project_name: str, steps: list):
         project = self._get_project(project_name)
         use_case = usecases.SetWorkflowUseCase(
@@ -1316,6 +1417,8 @@ class Controller(BaseController):
         annotation_paths: List[str],
         client_s3_bucket=None,
         is_pre_annotations: bool = False,
+        async_upload: bool = False,
+        journal_path: Optional[str] = None,
     ):
         project = self._get_project(project_name)
         folder = self._get_folder(project, folder_name)
@@ -1334,6 +1437,8 @@ class Controller(BaseController):
             ),
             validators=self.annotation_validators,
             reporter=Reporter(log_info=False, log_warning=False),
+            async_upload=async_upload,
+            journal_path=journal_path,
         )
         return use_case.execute()
 
@@ -1468,6 +1573,7 @@ class Controller(BaseController):
         image_list: List[str],
         annot_type: str,
         show_plots: bool,
+        processing_workers: int = None,
     ):
         project = self._get_project(project_name)
 
@@ -1499,6 +1605,7 @@ class Controller(BaseController):
             image_list=image_list,
             annotation_type=annot_type,
             show_plots=show_plots,
+            processing_workers=processing_workers,
         )
         return use_case.execute()
 
@@ -1510,6 +1617,7 @@ class Controller(BaseController):
         image_list: list,
         annot_type: str,
         show_plots: bool,
+        processing_workers: int = None,
     ):
         project = self._get_project(project_name)
 
@@ -1535,6 +1643,7 @@ class Controller(BaseController):
             image_list=image_list,
             annotation_type=annot_type,
             show_plots=show_plots,
+            processing_workers=processing_workers,
         )
         return use_case.execute()
 
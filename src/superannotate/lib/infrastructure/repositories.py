@@ -148,7 +148,7 @@ class ProjectRepository(BaseManageableRepository):
 class S3Repository(BaseS3Repository):
     def get_one(self, uuid: str) -> S3FileEntity:
         file = io.BytesIO()
-        self._resource.Object(self._bucket, uuid).download_fileobj(file)
+        self._client.download_fileobj(self._bucket, uuid, file)
         return S3FileEntity(uuid=uuid, data=file)
 
     def insert(self, entity: S3FileEntity) -> S3FileEntity:
@@ -158,7 +158,7 @@ class S3Repository(BaseS3Repository):
             for k in temp:
                 temp[k] = str(temp[k])
             data["Metadata"] = temp
-        self.bucket.put_object(**data)
+        self._client.put_object(Bucket=self._bucket, **data)
         return entity
 
     def update(self, entity: ProjectEntity):
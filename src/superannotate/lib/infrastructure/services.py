@@ -1,4 +1,8 @@
+import random
+import re
+import threading
 import time
+from collections import defaultdict
 from contextlib import contextmanager
 from datetime import datetime
 from typing import Dict
@@ -7,6 +11,7 @@ from typing import List
 from typing import Tuple
 from typing import Union
 from urllib.parse import urljoin
+from urllib.parse import urlparse
 
 import lib.core as constance
 import requests.packages.urllib3
@@ -16,16 +21,70 @@ from lib.core.service_types import ServiceResponse
 from lib.core.service_types import UploadAnnotationAuthData
 from lib.core.service_types import UserLimits
 from lib.core.serviceproviders import SuerannotateServiceProvider
-from lib.infrastructure.helpers import timed_lru_cache
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ChunkedEncodingError
+from requests.exceptions import ConnectionError as RequestsConnectionError
 from requests.exceptions import HTTPError
 
 requests.packages.urllib3.disable_warnings()
 
 
+class EndpointStatistics:
+    """
+    Thread-safe per endpoint request counters.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data = defaultdict(
+            lambda: {
+                "requests": 0,
+                "retries": 0,
+                "errors": 0,
+                "total_time": 0.0,
+                "max_time": 0.0,
+            }
+        )
+
+    @staticmethod
+    def endpoint(method: str, url: str) -> str:
+        path = re.sub(r"/\d+(?=/|$)", "/{id}", urlparse(url).path)
+        return f"{method.upper()} {path}"
+
+    def add(self, endpoint: str, elapsed: float, retries: int, failed: bool):
+        with self._lock:
+            data = self._data[endpoint]
+            data["requests"] += 1
+            data["retries"] += retries
+            data["errors"] += int(failed)
+            data["total_time"] += elapsed
+            data["max_time"] = max(data["max_time"], elapsed)
+
+    def to_dict(self) -> Dict[str, dict]:
+        with self._lock:
+            return {
+                endpoint: {
+                    **data,
+                    "average_time": data["total_time"] / data["requests"],
+                }
+                for endpoint, data in self._data.items()
+            }
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
 class BaseBackendService(SuerannotateServiceProvider):
     AUTH_TYPE = "sdk"
     PAGINATE_BY = 100
     LIMIT = 100
+    # covers the upload/download workers of the use cases running in parallel
+    POOL_SIZE = 32
+    MAX_RETRIES = 3
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+    BACKOFF_FACTOR = 0.5
+    MAX_BACKOFF = 30
 
     """
     Base service class
@@ -40,13 +99,22 @@ class BaseBackendService(SuerannotateServiceProvider):
         self._paginate_by = paginate_by
         self._verify_ssl = verify_ssl
         self.team_id = auth_token.split("=")[-1]
-        self.get_session()
-
-    @timed_lru_cache(seconds=360)
-    def get_session(self):
-        session = requests.Session()
-        session.headers.update(self.default_headers)
-        return session
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._statistics = EndpointStatistics()
+
+    def get_session(self) -> requests.Session:
+        if not self._session:
+            with self._session_lock:
+                if not self._session:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=self.POOL_SIZE, pool_maxsize=self.POOL_SIZE
+                    )
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    self._session = session
+        return self._session
 
     @property
     def default_headers(self):
@@ -57,6 +125,13 @@ class BaseBackendService(SuerannotateServiceProvider):
             # "User-Agent": constance.__version__,
         }
 
+    @property
+    def statistics(self) -> Dict[str, dict]:
+        """
+        Requests count, retries, errors and latency per endpoint.
+        """
+        return self._statistics.to_dict()
+
     @property
     def safe_api(self):
         """
@@ -70,7 +145,7 @@ class BaseBackendService(SuerannotateServiceProvider):
             """
             try:
                 yield None
-            except (HTTPError, ConnectionError) as exc:
+            except (HTTPError, ConnectionError, RequestsConnectionError) as exc:
                 raise AppException(f"Unknown exception: {exc}.")
 
         return safe_api
@@ -82,6 +157,49 @@ class BaseBackendService(SuerannotateServiceProvider):
         else:
             return self.PAGINATE_BY
 
+    def _retry_delay(self, attempt: int, response: requests.Response = None) -> float:
+        if response is not None and response.headers.get("Retry-After"):
+            try:
+                return min(float(response.headers["Retry-After"]), self.MAX_BACKOFF)
+            except ValueError:
+                pass
+        delay = min(self.BACKOFF_FACTOR * 2 ** attempt, self.MAX_BACKOFF)
+        return delay * random.uniform(0.5, 1)
+
+    def _send(self, prepared: requests.PreparedRequest) -> requests.Response:
+        """
+        Sends the request retrying the same method and body on
+        connection errors and 429/5xx responses with exponential backoff.
+        """
+        session = self.get_session()
+        endpoint = self._statistics.endpoint(prepared.method, prepared.url)
+        attempt = 0
+        start = time.monotonic()
+        while True:
+            try:
+                response = session.send(request=prepared, verify=self._verify_ssl)
+            except (RequestsConnectionError, ChunkedEncodingError):
+                if attempt >= self.MAX_RETRIES:
+                    self._statistics.add(
+                        endpoint, time.monotonic() - start, attempt, True
+                    )
+                    raise
+                time.sleep(self._retry_delay(attempt))
+            else:
+                if (
+                    response.status_code not in self.RETRY_STATUS_CODES
+                    or attempt >= self.MAX_RETRIES
+                ):
+                    self._statistics.add(
+                        endpoint,
+                        time.monotonic() - start,
+                        attempt,
+                        response.status_code > 299,
+                    )
+                    return response
+                time.sleep(self._retry_delay(attempt, response))
+            attempt += 1
+
     def _request(
         self,
         url,
@@ -89,26 +207,16 @@ class BaseBackendService(SuerannotateServiceProvider):
         data=None,
         headers=None,
         params=None,
-        retried=0,
         content_type=None,
     ) -> Union[requests.Response, ServiceResponse]:
         kwargs = {"json": data} if data else {}
-        session = self.get_session()
-        session.headers.update(headers if headers else {})
+        request_headers = {**self.default_headers, **(headers if headers else {})}
         with self.safe_api():
-            req = requests.Request(method=method, url=url, **kwargs, params=params)
-            prepared = session.prepare_request(req)
-            response = session.send(request=prepared, verify=self._verify_ssl)
-        if response.status_code == 404 and retried < 3:
-            return self._request(
-                url,
-                method="get",
-                data=None,
-                headers=None,
-                params=None,
-                retried=retried + 1,
-                content_type=content_type,
+            req = requests.Request(
+                method=method, url=url, headers=request_headers, params=params, **kwargs
             )
+            prepared = self.get_session().prepare_request(req)
+            response = self._send(prepared)
         if response.status_code > 299:
             import traceback
 
@@ -654,8 +762,6 @@ class SuperannotateBackendService(BaseBackendService):
         self, project_id: int, team_id: int, folder_id: int, images: List[str]
     ) -> List[dict]:
         bulk_get_images_url = urljoin(self.api_url, self.URL_BULK_GET_IMAGES)
-        time.sleep(1)
-
         res = self._request(
             bulk_get_images_url,
             "post",
@@ -70,3 +70,33 @@ class TestCocoSplit(TestCase):
 
             gen = input_dir.glob("*.json")
             self.compare_jsons(gen, input_dir)
+
+    def test_processing_workers(self):
+        for project in (
+            "cats_dogs_pixel_instance_segm",
+            "cats_dogs_vector_instance_segm",
+        ):
+            input_dir = (
+                self.folder_path
+                / "converter_test"
+                / "COCO"
+                / "input"
+                / "fromSuperAnnotate"
+                / project
+            )
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                serial_dir = Path(tmp_dir) / "serial"
+                parallel_dir = Path(tmp_dir) / "parallel"
+
+                sa.convert_project_type(input_dir, serial_dir)
+                sa.convert_project_type(input_dir, parallel_dir, processing_workers=2)
+
+                paths = sorted(path.name for path in serial_dir.glob("*.json"))
+                self.assertEqual(
+                    paths, sorted(path.name for path in parallel_dir.glob("*.json"))
+                )
+                for name in paths:
+                    self.assertEqual(
+                        (serial_dir / name).read_text(),
+                        (parallel_dir / name).read_text(),
+                    )
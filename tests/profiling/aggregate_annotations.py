@@ -0,0 +1,86 @@
+"""
+Time of aggregating a generated vector project export as a DataFrame
+serially, in a process pool, in chunks and from the cache.
+
+Usage: python -m tests.profiling.aggregate_annotations [images] [instances per image]
+"""
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src.superannotate.lib.app.analytics.common import aggregate_annotations_as_df
+
+CLASSES = [
+    {
+        "name": f"class_{i}",
+        "color": f"#0000{i:02}",
+        "attribute_groups": [
+            {"name": "group", "attributes": [{"name": "a"}, {"name": "b"}]}
+        ],
+    }
+    for i in range(10)
+]
+
+
+def generate_export(root: Path, images: int, instances: int):
+    (root / "classes").mkdir()
+    (root / "classes" / "classes.json").write_text(json.dumps(CLASSES))
+    for i in range(images):
+        annotation = {
+            "metadata": {"width": 1000, "height": 1000, "status": "Completed"},
+            "instances": [
+                {
+                    "type": "bbox",
+                    "className": f"class_{j % 10}",
+                    "groupId": 0,
+                    "points": {"x1": j, "y1": j, "x2": j + 10, "y2": j + 10},
+                    "attributes": [{"groupName": "group", "name": "ab"[j % 2]}],
+                    "createdAt": "2020-10-23T12:29:56.638Z",
+                    "createdBy": {"email": "user@example.com", "role": "Annotator"},
+                    "updatedAt": "2020-10-23T12:29:56.638Z",
+                    "updatedBy": {"email": "user@example.com", "role": "Annotator"},
+                }
+                for j in range(instances)
+            ],
+            "tags": [],
+            "comments": [],
+        }
+        (root / f"image_{i}.jpg___objects.json").write_text(json.dumps(annotation))
+
+
+def run(root: Path, **kwargs):
+    start = time.perf_counter()
+    result = aggregate_annotations_as_df(root, verbose=False, **kwargs)
+    if kwargs.get("chunk_size"):
+        rows = sum(len(df) for df in result)
+    else:
+        rows = len(result)
+    return rows, time.perf_counter() - start
+
+
+def main():
+    images = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    instances = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    with tempfile.TemporaryDirectory() as temp_dir:
+        generate_export(Path(temp_dir), images, instances)
+        for name, kwargs in (
+            ("serial", {}),
+            ("categorical", {"categorical": True}),
+            ("4 processes", {"processing_workers": 4}),
+            ("chunks of 500 files", {"chunk_size": 500}),
+        ):
+            rows, duration = run(Path(temp_dir), **kwargs)
+            print(f"{name:>20}: {rows} rows {duration:8.3f} sec")
+        with tempfile.TemporaryDirectory() as cache_dir:
+            for name in ("cache write", "cache read", "one file changed"):
+                if name == "one file changed":
+                    path = Path(temp_dir) / "image_0.jpg___objects.json"
+                    path.write_text(path.read_text().replace("Completed", "InProgress"))
+                rows, duration = run(Path(temp_dir), cache_dir=cache_dir)
+                print(f"{name:>20}: {rows} rows {duration:8.3f} sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Annotations/sec of the thread and the asyncio annotation upload for an S3 stand-in
+answering every PUT after the given latency.
+
+Usage: python -m tests.profiling.annotation_upload [annotations_count] [latency_ms]
+"""
+import asyncio
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from aiohttp import web
+from src.superannotate.lib.core.entities import FolderEntity
+from src.superannotate.lib.core.entities import ProjectEntity
+from src.superannotate.lib.core.service_types import UploadAnnotationAuthData
+from src.superannotate.lib.core.usecases.annotations import UploadAnnotationsUseCase
+
+
+def start_s3_stand_in(latency: float) -> str:
+    async def put_object(request):
+        await request.read()
+        await asyncio.sleep(latency)
+        return web.Response(headers={"ETag": '"etag"'})
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    loop = asyncio.new_event_loop()
+    app = web.Application()
+    app.router.add_put("/{key:.*}", put_object)
+    runner = web.AppRunner(app, access_log=None)
+    loop.run_until_complete(runner.setup())
+    loop.run_until_complete(web.TCPSite(runner, "127.0.0.1", port).start())
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return f"http://127.0.0.1:{port}"
+
+
+def get_upload_data(**kwargs):
+    response = MagicMock(ok=True)
+    response.data = UploadAnnotationAuthData(
+        creds={
+            "accessKeyId": "access",
+            "secretAccessKey": "secret",
+            "sessionToken": "token",
+            "region": "us-east-1",
+        },
+        bucket="annotations",
+        images={
+            image_id: {"annotation_json_path": f"{image_id}.json"}
+            for image_id in kwargs["image_ids"]
+        },
+    )
+    return response
+
+
+def run(paths, async_upload: bool) -> float:
+    backend = MagicMock()
+    backend.get_bulk_images.side_effect = lambda **kwargs: [
+        {"name": name, "id": int(name[6:-4])} for name in kwargs["images"]
+    ]
+    backend.get_annotation_upload_data.side_effect = get_upload_data
+    use_case = UploadAnnotationsUseCase(
+        reporter=MagicMock(),
+        project=ProjectEntity(uuid=1, team_id=1, project_type=1),
+        folder=FolderEntity(uuid=int(async_upload)),
+        annotation_classes=[],
+        annotation_paths=paths,
+        backend_service_provider=backend,
+        templates=[],
+        validators=MagicMock(),
+        async_upload=async_upload,
+    )
+    start = time.perf_counter()
+    uploaded, _, _ = use_case.execute().data
+    assert len(uploaded) == len(paths)
+    return len(paths) / (time.perf_counter() - start)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    latency = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    folder = tempfile.mkdtemp()
+    paths = []
+    for i in range(count):
+        path = os.path.join(folder, f"image_{i}.jpg___objects.json")
+        with open(path, "w") as file:
+            json.dump({"metadata": {"name": f"image_{i}.jpg"}, "instances": []}, file)
+        paths.append(path)
+    endpoint = start_s3_stand_in(latency / 1000)
+    with patch.dict(os.environ, {"AWS_ENDPOINT_URL_S3": endpoint}):
+        print(f"{'threads':>8}: {run(paths, False):8.2f} annotations/sec")
+        print(f"{'asyncio':>8}: {run(paths, True):8.2f} annotations/sec")
+
+
+if __name__ == "__main__":
+    main()
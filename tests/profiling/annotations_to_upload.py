@@ -0,0 +1,53 @@
+"""
+Time of matching local annotation files to platform images in UploadAnnotationsUseCase
+for a growing number of annotations, it should grow linearly.
+
+Usage: python -m tests.profiling.annotations_to_upload [sizes ...]
+"""
+import sys
+import time
+from unittest.mock import MagicMock
+
+from src.superannotate.lib.core.entities import FolderEntity
+from src.superannotate.lib.core.entities import ProjectEntity
+from src.superannotate.lib.core.usecases.annotations import UploadAnnotationsUseCase
+
+
+class BackendService:
+    def __init__(self, existing_ratio: float = 0.9):
+        self._existing_ratio = existing_ratio
+
+    def get_bulk_images(self, project_id, team_id, folder_id, images):
+        return [
+            {"name": name, "id": idx}
+            for idx, name in enumerate(images)
+            if idx % 100 < self._existing_ratio * 100
+        ]
+
+
+def run(size: int) -> float:
+    use_case = UploadAnnotationsUseCase(
+        reporter=MagicMock(),
+        project=ProjectEntity(uuid=1, team_id=1, project_type=1),
+        folder=FolderEntity(uuid=1),
+        annotation_classes=[],
+        annotation_paths=[
+            f"annotations/image_{i}.jpg___objects.json" for i in range(size)
+        ],
+        backend_service_provider=BackendService(),
+        templates=[],
+        validators=MagicMock(),
+    )
+    start = time.perf_counter()
+    use_case.annotations_to_upload
+    return time.perf_counter() - start
+
+
+def main():
+    sizes = [int(size) for size in sys.argv[1:]] or [1000, 10000, 100000]
+    for size in sizes:
+        print(f"{size:>8} annotations: {run(size):8.3f} sec")
+
+
+if __name__ == "__main__":
+    main()
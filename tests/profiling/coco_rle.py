@@ -0,0 +1,102 @@
+"""
+Time of the COCO RLE string encoding and decoding of 4K masks with many runs,
+per count in Python as pycocotools maskApi.c and vectorised.
+
+Usage: python -m tests.profiling.coco_rle [masks] [blobs per mask]
+"""
+import sys
+import time
+
+import cv2
+import numpy as np
+from src.superannotate.lib.app.input_converters.converters.coco_converters.coco_api import (
+    _frString,
+)
+from src.superannotate.lib.app.input_converters.converters.coco_converters.coco_api import (
+    _masktoRLE,
+)
+from src.superannotate.lib.app.input_converters.converters.coco_converters.coco_api import (
+    _toString,
+)
+from src.superannotate.lib.app.input_converters.converters.coco_converters.coco_api import (
+    decode,
+)
+from src.superannotate.lib.app.input_converters.converters.coco_converters.coco_api import (
+    encode,
+)
+
+
+def to_string_per_count(counts):
+    string = ""
+    for i, count in enumerate(counts):
+        x = int(count)
+        if i > 2:
+            x -= int(counts[i - 2])
+        more = True
+        while more:
+            c = x & 0x1F
+            x >>= 5
+            more = x != -1 if c & 0x10 else x != 0
+            string += chr((c | 0x20 if more else c) + 48)
+    return string
+
+
+def from_string_per_count(string):
+    counts, i = [], 0
+    while i < len(string):
+        count, k, more = 0, 0, True
+        while more:
+            value = ord(string[i]) - 48
+            count |= (value & 0x1F) << 5 * k
+            more = value & 0x20
+            i += 1
+            k += 1
+            if not more and value & 0x10:
+                count |= -1 << 5 * k
+        if len(counts) > 2:
+            count += counts[-2]
+        counts.append(count)
+    return counts
+
+
+def generate_mask(blobs, random):
+    mask = np.zeros((2160, 3840), dtype=np.uint8)
+    for _ in range(blobs):
+        center = tuple(int(value) for value in random.integers(0, (3840, 2160)))
+        axes = tuple(int(value) for value in random.integers(5, 200, 2))
+        cv2.ellipse(mask, center, axes, int(random.integers(0, 180)), 0, 360, 1, -1)
+    return mask
+
+
+def measure(function, items):
+    start = time.perf_counter()
+    results = [function(item) for item in items]
+    return time.perf_counter() - start, results
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    blobs = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    random = np.random.default_rng(0)
+    masks = [generate_mask(blobs, random) for _ in range(count)]
+    counts = [_masktoRLE(mask)["counts"] for mask in masks]
+    print(f"{count} 3840x2160 masks, {sum(map(len, counts)) // count} runs per mask")
+
+    per_count, expected = measure(to_string_per_count, counts)
+    vectorised, strings = measure(_toString, counts)
+    assert strings == expected
+    print(f"  to string:   per count {per_count:.2f} s, vectorised {vectorised:.3f} s")
+
+    per_count, expected = measure(from_string_per_count, strings)
+    vectorised, decoded = measure(_frString, strings)
+    assert [value.tolist() for value in decoded] == expected
+    print(f"  from string: per count {per_count:.2f} s, vectorised {vectorised:.3f} s")
+
+    encoding, rles = measure(encode, masks)
+    decoding, decoded_masks = measure(decode, rles)
+    assert all(np.array_equal(a, b) for a, b in zip(masks, decoded_masks))
+    print(f"  encode {encoding:.3f} s, decode {decoding:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
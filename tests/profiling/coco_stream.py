@@ -0,0 +1,74 @@
+"""
+Time and peak memory of converting a generated COCO object detection dataset to SuperAnnotate JSONs,
+with the whole COCO JSON loaded and with the streamed index.
+
+Usage: python -m tests.profiling.coco_stream [images] [instances per image]
+"""
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from src.superannotate.lib.app.input_converters.converters.coco_converters.coco_stream import (
+    CocoIndex,
+)
+from src.superannotate.lib.app.input_converters.converters.coco_converters.coco_to_sa_vector import (
+    coco_object_detection_to_sa_vector,
+)
+from tests.profiling.conversion import generate_coco_json
+
+
+def load_whole_json(coco_path):
+    with open(coco_path) as file:
+        coco_json = json.load(file)
+    image_id_to_annotations = {}
+    for annot in coco_json["annotations"]:
+        image_id_to_annotations.setdefault(str(annot["image_id"]), []).append(annot)
+    for img in coco_json["images"]:
+        image_id_to_annotations.get(str(img["id"]), [])
+
+
+def index_json(coco_path):
+    with CocoIndex(coco_path) as coco_index:
+        for _ in coco_index.iter_images():
+            pass
+
+
+def main():
+    images = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    instances = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    with tempfile.TemporaryDirectory() as temp_dir:
+        coco_path = Path(temp_dir) / "coco.json"
+        coco_json = generate_coco_json(images, instances)
+        for annot in coco_json["annotations"]:
+            x, y, x2, _, _, y2 = annot["segmentation"][0][:6]
+            annot["bbox"] = [x, y, x2 - x, y2 - y]
+        with open(coco_path, "w") as file:
+            json.dump(coco_json, file)
+        del coco_json
+        print(f"COCO JSON: {coco_path.stat().st_size / 2 ** 20:.1f} MB")
+
+        for name, function in (
+            ("json.load", load_whole_json),
+            ("index", index_json),
+            (
+                "conversion",
+                lambda path: coco_object_detection_to_sa_vector(
+                    path, Path(temp_dir) / "output"
+                ),
+            ),
+        ):
+            (Path(temp_dir) / "output").mkdir(exist_ok=True)
+            tracemalloc.start()
+            start = time.perf_counter()
+            function(coco_path)
+            duration = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{name:>12}: {duration:8.3f} sec, peak {peak / 2 ** 20:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Time of computing the consensus scores of generated dense annotations of three folders,
+serially and in a process pool.
+
+Usage: python -m tests.profiling.consensus [images] [instances per image]
+"""
+import random
+import sys
+import time
+
+import pandas as pd
+
+from src.superannotate.lib.app.analytics.common import images_consensus
+
+FOLDERS = ["folder_1", "folder_2", "folder_3"]
+
+
+def generate_instances(images: int, instances: int, annot_type: str) -> pd.DataFrame:
+    generator = random.Random(0)
+    rows = []
+    for i in range(images):
+        boxes = [
+            (
+                generator.uniform(0, 2000),
+                generator.uniform(0, 2000),
+                generator.uniform(10, 80),
+                generator.uniform(10, 80),
+            )
+            for _ in range(instances)
+        ]
+        for folder_name in FOLDERS:
+            for j, (x, y, width, height) in enumerate(boxes):
+                # every annotator misses some instances and shifts the others
+                if generator.random() < 0.1:
+                    continue
+                x, y = x + generator.gauss(0, 3), y + generator.gauss(0, 3)
+                x2, y2 = x + width, y + height
+                if annot_type == "bbox":
+                    meta = {"points": {"x1": x, "y1": y, "x2": x2, "y2": y2}}
+                elif annot_type == "polygon":
+                    meta = {"points": [x, y, x2, y, x2, y2, x, y2]}
+                else:
+                    meta = {"x": x, "y": y}
+                rows.append(
+                    {
+                        "imageName": f"image_{i}.jpg",
+                        "folderName": folder_name,
+                        "className": f"class_{j % 5}",
+                        "creatorEmail": f"{folder_name}@example.com",
+                        "attributes": None,
+                        "meta": meta,
+                    }
+                )
+    return pd.DataFrame(rows)
+
+
+def main():
+    images = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    instances = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    for annot_type in ("bbox", "polygon", "point"):
+        df = generate_instances(images, instances, annot_type)
+        for name, kwargs in (
+            ("serial", {}),
+            ("4 processes", {"processing_workers": 4}),
+        ):
+            start = time.perf_counter()
+            consensus_df = images_consensus(df, annot_type, **kwargs)
+            duration = time.perf_counter() - start
+            print(
+                f"{annot_type:>8} {name:>12}: {len(consensus_df)} rows {duration:8.3f} sec"
+            )
+
+
+if __name__ == "__main__":
+    main()
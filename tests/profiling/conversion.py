@@ -0,0 +1,69 @@
+"""
+Time of converting a generated COCO instance segmentation dataset to SuperAnnotate pixel annotations,
+serially and in a process pool.
+
+Usage: python -m tests.profiling.conversion [images] [instances per image]
+"""
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src.superannotate.lib.app.input_converters.converters.coco_converters.coco_to_sa_pixel import (
+    coco_instance_segmentation_to_sa_pixel,
+)
+
+
+def generate_coco_json(images: int, instances: int) -> dict:
+    generator = random.Random(0)
+    coco_json = {
+        "images": [],
+        "annotations": [],
+        "categories": [{"id": i, "name": f"class_{i}"} for i in range(5)],
+    }
+    for image_id in range(images):
+        coco_json["images"].append(
+            {
+                "id": image_id,
+                "file_name": f"image_{image_id}.jpg",
+                "height": 720,
+                "width": 1280,
+            }
+        )
+        for _ in range(instances):
+            x, y = generator.uniform(0, 1200), generator.uniform(0, 640)
+            x2, y2 = x + generator.uniform(10, 80), y + generator.uniform(10, 80)
+            coco_json["annotations"].append(
+                {
+                    "id": len(coco_json["annotations"]) + 1,
+                    "image_id": image_id,
+                    "category_id": generator.randrange(5),
+                    "segmentation": [[x, y, x2, y, x2, y2, x, y2]],
+                }
+            )
+    return coco_json
+
+
+def main():
+    images = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    instances = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    with tempfile.TemporaryDirectory() as temp_dir:
+        coco_path = Path(temp_dir) / "coco.json"
+        with open(coco_path, "w") as file:
+            json.dump(generate_coco_json(images, instances), file)
+        for name, kwargs in (
+            ("serial", {}),
+            ("4 processes", {"processing_workers": 4}),
+        ):
+            output_dir = Path(temp_dir) / name
+            output_dir.mkdir()
+            start = time.perf_counter()
+            coco_instance_segmentation_to_sa_pixel(coco_path, output_dir, **kwargs)
+            duration = time.perf_counter() - start
+            print(f"{name:>12}: {images} images {duration:8.3f} sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Time of writing the annotations of a generated vector project export from its DataFrame
+and of filtering its instances.
+
+Usage: python -m tests.profiling.df_to_annotations [images] [instances per image]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src.superannotate.lib.app.analytics.common import aggregate_annotations_as_df
+from src.superannotate.lib.app.input_converters.df_converter import df_to_annotations
+from src.superannotate.lib.app.input_converters.df_converter import (
+    filter_annotation_instances,
+)
+from tests.profiling.aggregate_annotations import generate_export
+
+
+def main():
+    images = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    instances = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    with tempfile.TemporaryDirectory() as temp_dir:
+        generate_export(Path(temp_dir), images, instances)
+        df = aggregate_annotations_as_df(temp_dir, verbose=False)
+    with tempfile.TemporaryDirectory() as output_dir:
+        start = time.perf_counter()
+        # the undecorated functions, without the usage tracking
+        df_to_annotations.function(df, output_dir)
+        print(
+            f"{'df_to_annotations':>28}: {len(df)} rows {time.perf_counter() - start:8.3f} sec"
+        )
+    start = time.perf_counter()
+    filtered_df = filter_annotation_instances.function(
+        df,
+        include=[{"className": "class_1"}, {"type": "bbox"}],
+        exclude=[{"attributes": [{"groupName": "group", "name": "a"}]}],
+    )
+    print(
+        f"{'filter_annotation_instances':>28}: {len(filtered_df)} rows {time.perf_counter() - start:8.3f} sec"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Throughput of the bulk image download for a storage stand-in answering every GET
+after the given latency, with one thread as the sequential download_image loop and with the thread pool.
+
+Usage: python -m tests.profiling.download_images [images_count] [image_size_kb] [latency_ms]
+"""
+import asyncio
+import socket
+import sys
+import tempfile
+import threading
+import time
+from unittest.mock import MagicMock
+
+from aiohttp import web
+from src.superannotate.lib.core.entities import FolderEntity
+from src.superannotate.lib.core.entities import ProjectEntity
+from src.superannotate.lib.core.usecases.images import DownloadImagesUseCase
+
+
+def start_storage_stand_in(size: int, latency: float) -> str:
+    body = b"\0" * size
+
+    async def get_object(request):
+        await asyncio.sleep(latency)
+        return web.Response(body=body)
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    loop = asyncio.new_event_loop()
+    app = web.Application()
+    app.router.add_get("/{key:.*}", get_object)
+    runner = web.AppRunner(app, access_log=None)
+    loop.run_until_complete(runner.setup())
+    loop.run_until_complete(web.TCPSite(runner, "127.0.0.1", port).start())
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return f"http://127.0.0.1:{port}"
+
+
+def run(endpoint: str, names, destination: str, workers: int) -> float:
+    backend = MagicMock()
+    backend.get_bulk_images.side_effect = lambda **kwargs: [
+        {"name": name, "id": int(name[6:-4])} for name in kwargs["images"]
+    ]
+    backend.get_download_token.side_effect = lambda **kwargs: {
+        "original": {"url": f"{endpoint}/{kwargs['image_id']}", "headers": {}}
+    }
+    use_case = DownloadImagesUseCase(
+        service=backend,
+        project=ProjectEntity(uuid=1, team_id=1, project_type=1),
+        folder=FolderEntity(uuid=1),
+        image_names=names,
+        images=MagicMock(),
+        destination=destination,
+        annotation_classes=MagicMock(),
+        download_workers=workers,
+    )
+    start = time.perf_counter()
+    for _ in use_case.execute():
+        pass
+    assert all(path for path, _ in use_case.data)
+    return len(names) / (time.perf_counter() - start)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 512
+    latency = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+    endpoint = start_storage_stand_in(size * 1024, latency / 1000)
+    names = [f"image_{i}.jpg" for i in range(count)]
+    for name, workers in (
+        ("1 thread", 1),
+        ("pool", None),
+        ("existing", None),
+    ):
+        if name != "existing":
+            destination = tempfile.mkdtemp()
+        images_per_second = run(endpoint, names, destination, workers)
+        print(
+            f"{name:>9}: {images_per_second:8.2f} images/sec "
+            f"{images_per_second * size / 1024:8.2f} MB/sec"
+        )
+
+
+if __name__ == "__main__":
+    main()
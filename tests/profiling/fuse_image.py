@@ -0,0 +1,99 @@
+"""
+Time of creating the fuse and overlay images of a large image with many instances,
+with a full size layer composited per shape (the previous drawing) and with the shape sized layers,
+and of mapping a pixel mask with many parts by a comparison per part and by the color lookup.
+
+Usage: python -m tests.profiling.fuse_image [instances] [image_width] [image_height]
+"""
+import random
+import sys
+import time
+
+import numpy as np
+from PIL import Image
+from PIL import ImageDraw
+from src.superannotate.lib.core.plugin import ImagePlugin
+from src.superannotate.lib.core.usecases.images import CreateFuseImageUseCase
+
+
+class FullLayerImagePlugin(ImagePlugin):
+    def draw_polygon(self, points, fill_color, outline_color):
+        image = self.get_empty_image()
+        ImageDraw.Draw(image).polygon(points, fill_color, outline_color)
+        self._image = Image.alpha_composite(self._image, image)
+
+
+def generate_polygons(count, width, height):
+    polygons = []
+    for _ in range(count):
+        x, y = random.uniform(0, width), random.uniform(0, height)
+        polygons.append(
+            [
+                coordinate
+                for _ in range(8)
+                for coordinate in (
+                    x + random.uniform(-60, 60),
+                    y + random.uniform(-60, 60),
+                )
+            ]
+        )
+    return polygons
+
+
+def draw(plugin_class, polygons, width, height):
+    start = time.perf_counter()
+    for fill_alpha in (255, CreateFuseImageUseCase.TRANSPARENCY):
+        plugin = plugin_class.__new__(plugin_class)
+        plugin._image = Image.new("RGBA", (width, height), (10, 20, 30, 255))
+        for polygon in polygons:
+            plugin.draw_polygon(
+                polygon, fill_color=(200, 40, 90, fill_alpha), outline_color=4 * (255,)
+            )
+    return time.perf_counter() - start
+
+
+def map_per_part(mask, colors, fill_colors):
+    result = np.full((*mask.shape[:2], 4), [0, 0, 0, 255], np.uint8)
+    for color, fill_color in zip(colors, fill_colors):
+        result[np.all(mask == (*color, 255), axis=2)] = fill_color
+    return result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    width = int(sys.argv[2]) if len(sys.argv) > 2 else 3840
+    height = int(sys.argv[3]) if len(sys.argv) > 3 else 2160
+    random.seed(0)
+    polygons = generate_polygons(count, width, height)
+    print(
+        f"{count} polygons on {width}x{height}: "
+        f"full size layers {draw(FullLayerImagePlugin, polygons, width, height):.2f} s, "
+        f"shape sized layers {draw(ImagePlugin, polygons, width, height):.2f} s"
+    )
+
+    colors = [(0, index // 256, index % 256) for index in range(1, count + 1)]
+    fill_colors = [(*color[::-1], 255) for color in colors]
+    mask = np.array([(*color, 255) for color in colors], dtype=np.uint8)[
+        np.random.default_rng(0).integers(0, count, (height, width))
+    ]
+    start = time.perf_counter()
+    expected = map_per_part(mask, colors, fill_colors)
+    per_part = time.perf_counter() - start
+    start = time.perf_counter()
+    mapped = CreateFuseImageUseCase.map_mask_colors(
+        mask,
+        {
+            int(CreateFuseImageUseCase.pack_colors(color)): fill_color
+            for color, fill_color in zip(colors, fill_colors)
+        },
+    )
+    lookup = time.perf_counter() - start
+    assert np.array_equal(expected, mapped)
+    print(
+        f"{count} parts on {width}x{height}: "
+        f"per part comparison {per_part:.2f} s, color lookup {lookup:.2f} s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Images/sec of thumbnail, low resolution and huge image generation against the number of cores.
+
+Usage: python -m tests.profiling.image_derivatives [images_count] [width] [height]
+"""
+import concurrent.futures
+import io
+import os
+import sys
+import time
+
+import numpy as np
+from PIL import Image
+
+from src.superannotate.lib.core import MAX_VECTOR_RESOLUTION
+from src.superannotate.lib.core.usecases.images import generate_image_derivatives
+
+
+def create_images(count: int, width: int, height: int):
+    images = []
+    for i in range(count):
+        gradient = np.linspace(0, 255, width, dtype=np.uint8)
+        array = np.dstack(
+            [np.tile(gradient, (height, 1)), np.full((height, width), i % 255, np.uint8)]
+            + [np.random.randint(0, 255, (height, width), np.uint8)]
+        )
+        buffer = io.BytesIO()
+        Image.fromarray(array).save(buffer, "JPEG")
+        images.append(buffer.getvalue())
+    return images
+
+
+def generate(image: bytes):
+    return generate_image_derivatives(
+        io.BytesIO(image), "image.jpg", MAX_VECTOR_RESOLUTION, 60
+    )
+
+
+def run(images, executor) -> float:
+    start = time.perf_counter()
+    list(executor.map(generate, images))
+    return len(images) / (time.perf_counter() - start)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    width = int(sys.argv[2]) if len(sys.argv) > 2 else 4000
+    height = int(sys.argv[3]) if len(sys.argv) > 3 else 3000
+    images = create_images(count, width, height)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+        print(f"{'threads (10)':>16}: {run(images, executor):8.2f} images/sec")
+
+    workers = 1
+    while workers <= os.cpu_count():
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            executor.submit(int).result()
+            print(
+                f"{f'processes ({workers})':>16}: {run(images, executor):8.2f} images/sec"
+            )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Time of collapsing the attribute rows of a generated annotation DataFrame to one row per instance,
+the stage benchmark and consensus run before matching the instances.
+
+Usage: python -m tests.profiling.instance_attributes [instances] [attributes per instance]
+"""
+import sys
+import time
+
+import pandas as pd
+
+from src.superannotate.lib.app.analytics.common import aggregate_instance_attributes
+
+FOLDERS = ["folder_1", "folder_2", "folder_3"]
+
+
+def generate_rows(instances: int, attributes: int) -> pd.DataFrame:
+    rows = []
+    for i in range(instances):
+        instance = {
+            "imageName": f"image_{i // 300}.jpg",
+            "instanceId": i % 100,
+            "folderName": FOLDERS[i // 100 % 3],
+            "className": f"class_{i % 5}",
+            "type": "bbox",
+            "meta": {"points": {"x1": i, "y1": i, "x2": i + 10, "y2": i + 10}},
+        }
+        # every tenth instance doesn't have attributes
+        if i % 10 == 0:
+            rows.append({**instance, "attributeGroupName": None, "attributeName": None})
+            continue
+        for j in range(attributes):
+            rows.append(
+                {
+                    **instance,
+                    "attributeGroupName": f"group_{j % 2}",
+                    "attributeName": f"attribute_{j}",
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+def main():
+    instances = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    attributes = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    df = generate_rows(instances, attributes)
+    start = time.perf_counter()
+    instances_df = aggregate_instance_attributes(df)
+    duration = time.perf_counter() - start
+    print(f"{len(df)} rows to {len(instances_df)} instances {duration:8.3f} sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Time of finding the polygons of every part of a 4K pixel annotation mask,
+with a whole mask comparison per part and with the color indexed regions,
+and of the conversion of generated pixel and vector annotations to the other project type.
+
+Usage: python -m tests.profiling.project_type_conversion [parts] [files] [processing_workers]
+"""
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+from src.superannotate.lib.app.common import blue_color_generator
+from src.superannotate.lib.app.common import hex_to_rgb
+from src.superannotate.lib.app.input_converters.sa_conversion import _color_polygons
+from src.superannotate.lib.app.input_converters.sa_conversion import _color_regions
+from src.superannotate.lib.app.input_converters.sa_conversion import (
+    from_pixel_to_vector,
+)
+from src.superannotate.lib.app.input_converters.sa_conversion import (
+    from_vector_to_pixel,
+)
+
+HEIGHT, WIDTH = 2160, 3840
+
+
+def polygons_per_part(img, colors):
+    polygons = []
+    for color in colors:
+        mask = np.zeros(img.shape[:2], dtype=np.uint8)
+        mask[np.all(img == list(hex_to_rgb(color))[::-1], axis=2)] = 255
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        polygons.append(
+            [
+                contour.flatten().tolist()
+                for contour in contours
+                if len(contour.flatten()) > 6
+            ]
+        )
+    return polygons
+
+
+def polygons_per_region(img, colors):
+    packed, regions = _color_regions(img)
+    return [_color_polygons(packed, regions, int(color[1:], 16)) for color in colors]
+
+
+def generate_files(directory, parts, files, random):
+    colors = blue_color_generator(parts)[1:]
+    for index in range(files):
+        name = f"image_{index}.png"
+        img = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+        instances = []
+        for color in colors:
+            center = tuple(int(value) for value in random.integers(0, (WIDTH, HEIGHT)))
+            points = cv2.ellipse2Poly(
+                center,
+                tuple(int(value) for value in random.integers(10, 120, 2)),
+                int(random.integers(0, 180)),
+                0,
+                360,
+                30,
+            )
+            cv2.fillPoly(img, [points], list(hex_to_rgb(color))[::-1])
+            instances.append({"className": "class", "parts": [{"color": color}]})
+            instances.append(
+                {
+                    "type": "polygon",
+                    "className": "class",
+                    "groupId": 0,
+                    "pointLabels": {},
+                    "points": points.flatten().tolist(),
+                }
+            )
+        cv2.imwrite(str(directory / f"{name}___save.png"), img)
+        cv2.imwrite(str(directory / name), img)
+        with open(directory / f"{name}___pixel.json", "w") as file:
+            json.dump({"instances": instances[::2]}, file)
+        with open(directory / f"{name}___objects.json", "w") as file:
+            json.dump({"instances": instances[1::2]}, file)
+    return colors
+
+
+def main():
+    parts = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    files = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+    random = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        directory = Path(tmp_dir)
+        colors = generate_files(directory, parts, files, random)
+        img = cv2.imread(str(directory / "image_0.png___save.png"))
+
+        start = time.perf_counter()
+        expected = polygons_per_part(img, colors)
+        per_part = time.perf_counter() - start
+        start = time.perf_counter()
+        polygons = polygons_per_region(img, colors)
+        per_region = time.perf_counter() - start
+        assert polygons == expected
+        print(
+            f"{parts} parts on {WIDTH}x{HEIGHT}: "
+            f"per part {per_part:.2f} s, per color region {per_region:.2f} s"
+        )
+
+        for name, convert, pattern in (
+            ("pixel to vector", from_pixel_to_vector, "*___pixel.json"),
+            ("vector to pixel", from_vector_to_pixel, "*___objects.json"),
+        ):
+            json_paths = sorted(directory.glob(pattern))
+            for processing_workers in (None, workers):
+                output_dir = directory / f"{pattern[4:-5]}_{processing_workers}"
+                output_dir.mkdir()
+                start = time.perf_counter()
+                convert(json_paths, output_dir, processing_workers)
+                print(
+                    f"{name} of {files} files, processing_workers={processing_workers}: "
+                    f"{time.perf_counter() - start:.2f} s"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+from pathlib import Path
+from unittest import TestCase
+
+import pandas as pd
+
+from src.superannotate.lib.app.analytics.common import aggregate_annotations_as_df
+
+
+class TestAggregateAnnotations(TestCase):
+    TEST_FOLDER_PATH = "data_set/consensus_benchmark/consensus_test_data"
+
+    @property
+    def folder_path(self):
+        return Path(__file__).parent.parent / self.TEST_FOLDER_PATH
+
+    def test_dates_are_converted(self):
+        df = aggregate_annotations_as_df(self.folder_path, verbose=False)
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(df["createdAt"]))
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(df["updatedAt"]))
+        self.assertEqual(df["probability"].dtype, float)
+
+    def test_processing_workers(self):
+        df = aggregate_annotations_as_df(
+            self.folder_path, include_classes_wo_annotations=True, verbose=False
+        )
+        pd.testing.assert_frame_equal(
+            df,
+            aggregate_annotations_as_df(
+                self.folder_path,
+                include_classes_wo_annotations=True,
+                verbose=False,
+                processing_workers=2,
+            ),
+        )
+
+    def test_chunks(self):
+        df = aggregate_annotations_as_df(
+            self.folder_path, include_classes_wo_annotations=True, verbose=False
+        )
+        chunks = list(
+            aggregate_annotations_as_df(
+                self.folder_path,
+                include_classes_wo_annotations=True,
+                verbose=False,
+                chunk_size=2,
+            )
+        )
+        self.assertGreater(len(chunks), 2)
+        self.assertTrue(chunks[-1]["imageName"].isna().all())
+        pd.testing.assert_frame_equal(
+            df, pd.concat(chunks, ignore_index=True), check_dtype=False
+        )
+
+    def test_categorical(self):
+        df = aggregate_annotations_as_df(self.folder_path, verbose=False)
+        categorical_df = aggregate_annotations_as_df(
+            self.folder_path, verbose=False, categorical=True
+        )
+        self.assertEqual(categorical_df["className"].dtype, "category")
+        self.assertEqual(categorical_df["type"].dtype, "category")
+        self.assertEqual(
+            df["className"].tolist(),
+            categorical_df["className"].astype(object).tolist(),
+        )
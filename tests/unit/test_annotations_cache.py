@@ -0,0 +1,72 @@
+import json
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from src.superannotate.lib.app.analytics import common
+from src.superannotate.lib.app.analytics.common import aggregate_annotations_as_df
+
+pytest.importorskip("pyarrow")
+
+
+class TestAnnotationsCache(TestCase):
+    TEST_FOLDER_PATH = "data_set/consensus_benchmark/consensus_test_data"
+
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.export_path = Path(self._temp_dir.name) / "export"
+        self.cache_dir = Path(self._temp_dir.name) / "cache"
+        shutil.copytree(
+            Path(__file__).parent.parent / self.TEST_FOLDER_PATH, self.export_path
+        )
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def _aggregate(self, **kwargs):
+        with patch.object(
+            common, "aggregate_annotation_file", wraps=common.aggregate_annotation_file
+        ) as aggregate_file:
+            df = aggregate_annotations_as_df(
+                self.export_path,
+                include_classes_wo_annotations=True,
+                include_comments=True,
+                include_tags=True,
+                verbose=False,
+                **kwargs,
+            )
+        return df, aggregate_file.call_count
+
+    def test_cached_rows_are_equal(self):
+        df, _ = self._aggregate()
+        cached_df, parsed_count = self._aggregate(cache_dir=self.cache_dir)
+        self.assertGreater(parsed_count, 0)
+        pd.testing.assert_frame_equal(df, cached_df)
+        cached_df, parsed_count = self._aggregate(cache_dir=self.cache_dir)
+        self.assertEqual(parsed_count, 0)
+        pd.testing.assert_frame_equal(df, cached_df)
+
+    def test_changed_files_are_parsed(self):
+        self._aggregate(cache_dir=self.cache_dir)
+        annotation_paths = sorted(self.export_path.rglob("*___objects.json"))
+        annotation = json.loads(annotation_paths[0].read_text())
+        annotation["instances"] = annotation["instances"][:1]
+        annotation_paths[0].write_text(json.dumps(annotation))
+        annotation_paths[1].unlink()
+
+        df, _ = self._aggregate()
+        cached_df, parsed_count = self._aggregate(cache_dir=self.cache_dir)
+        self.assertEqual(parsed_count, 1)
+        pd.testing.assert_frame_equal(df, cached_df)
+
+    def test_options_are_not_shared(self):
+        self._aggregate(cache_dir=self.cache_dir)
+        df = aggregate_annotations_as_df(self.export_path, verbose=False)
+        cached_df = aggregate_annotations_as_df(
+            self.export_path, verbose=False, cache_dir=self.cache_dir
+        )
+        pd.testing.assert_frame_equal(df, cached_df)
@@ -0,0 +1,98 @@
+import json
+import os
+import socket
+import tempfile
+from unittest import TestCase
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import boto3
+import pytest
+from src.superannotate.lib.core.entities import FolderEntity
+from src.superannotate.lib.core.entities import ProjectEntity
+from src.superannotate.lib.core.service_types import UploadAnnotationAuthData
+from src.superannotate.lib.core.usecases.annotations import UploadAnnotationsUseCase
+
+pytest.importorskip("aiohttp")
+moto_server = pytest.importorskip("moto.server")
+
+
+class TestAsyncAnnotationUpload(TestCase):
+    BUCKET = "annotations"
+    ANNOTATIONS_COUNT = 30
+
+    @classmethod
+    def setUpClass(cls):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        cls.server = moto_server.ThreadedMotoServer(port=port, verbose=False)
+        cls.server.start()
+        cls.endpoint = f"http://127.0.0.1:{port}"
+        cls._client().create_bucket(Bucket=cls.BUCKET)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    @classmethod
+    def _client(cls):
+        return boto3.client(
+            "s3",
+            endpoint_url=cls.endpoint,
+            aws_access_key_id="access",
+            aws_secret_access_key="secret",
+            region_name="us-east-1",
+        )
+
+    def _upload_data(self, **kwargs):
+        response = MagicMock(ok=True)
+        response.data = UploadAnnotationAuthData(
+            creds={
+                "accessKeyId": "access",
+                "secretAccessKey": "secret",
+                "sessionToken": "token",
+                "region": "us-east-1",
+            },
+            bucket=self.BUCKET,
+            images={
+                image_id: {"annotation_json_path": f"{image_id}.json"}
+                for image_id in kwargs["image_ids"]
+            },
+        )
+        return response
+
+    def test_annotations_are_uploaded(self):
+        folder = tempfile.mkdtemp()
+        paths = []
+        for i in range(self.ANNOTATIONS_COUNT):
+            path = os.path.join(folder, f"image_{i}.jpg___objects.json")
+            with open(path, "w") as file:
+                json.dump(
+                    {"metadata": {"name": f"image_{i}.jpg"}, "instances": []}, file
+                )
+            paths.append(path)
+        backend = MagicMock()
+        backend.get_bulk_images.side_effect = lambda **kwargs: [
+            {"name": name, "id": int(name[6:-4])} for name in kwargs["images"]
+        ]
+        backend.get_annotation_upload_data.side_effect = self._upload_data
+        use_case = UploadAnnotationsUseCase(
+            reporter=MagicMock(),
+            project=ProjectEntity(uuid=1, team_id=1, project_type=1),
+            # a folder not used by other tests, so no cached s3 client is reused
+            folder=FolderEntity(uuid=8),
+            annotation_classes=[],
+            annotation_paths=paths,
+            backend_service_provider=backend,
+            templates=[],
+            validators=MagicMock(),
+            async_upload=True,
+        )
+        use_case.AUTH_DATA_CHUNK_SIZE = 7
+        with patch.dict(os.environ, {"AWS_ENDPOINT_URL_S3": self.endpoint}):
+            uploaded, failed, missing = use_case.execute().data
+        self.assertEqual(sorted(uploaded), sorted(paths))
+        self.assertEqual((failed, missing), ([], []))
+        body = self._client().get_object(Bucket=self.BUCKET, Key="3.json")["Body"]
+        self.assertEqual(json.load(body)["metadata"]["name"], "image_3.jpg")
@@ -0,0 +1,71 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import requests
+from src.superannotate.lib.infrastructure.services import SuperannotateBackendService
+
+
+class TestBackendServiceTransport(TestCase):
+    def setUp(self):
+        # bypass the single instance metaclass
+        self.service = SuperannotateBackendService.__new__(SuperannotateBackendService)
+        self.service.__init__(
+            api_url="https://api.test/", auth_token="token=1", logger=MagicMock()
+        )
+        self.service.BACKOFF_FACTOR = 0
+
+    @staticmethod
+    def _response(status_code, headers=None):
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers.update(headers or {})
+        response._content = b"{}"
+        return response
+
+    def test_session_is_shared(self):
+        session = self.service.get_session()
+        self.assertIs(session, self.service.get_session())
+        self.assertEqual(
+            session.get_adapter("https://api.test/").poolmanager.connection_pool_kw["maxsize"],
+            self.service.POOL_SIZE,
+        )
+
+    def test_retry_keeps_method_and_body(self):
+        responses = [self._response(503), self._response(429), self._response(200)]
+        with patch.object(requests.Session, "send", side_effect=responses) as send:
+            response = self.service._request(
+                "https://api.test/project/12/folder", "post", data={"a": 1}
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(send.call_count, 3)
+        for call in send.call_args_list:
+            self.assertEqual(call.kwargs["request"].method, "POST")
+            self.assertEqual(call.kwargs["request"].body, b'{"a": 1}')
+        stats = self.service.statistics["POST /project/{id}/folder"]
+        self.assertEqual((stats["requests"], stats["retries"], stats["errors"]), (1, 2, 0))
+
+    def test_retry_after_header(self):
+        self.assertEqual(
+            self.service._retry_delay(0, self._response(429, {"Retry-After": "2"})), 2
+        )
+
+    def test_connection_error_after_retries(self):
+        with patch.object(
+            requests.Session, "send", side_effect=requests.ConnectionError("refused")
+        ) as send:
+            with self.assertRaisesRegex(Exception, "refused"):
+                self.service._request("https://api.test/projects")
+        self.assertEqual(send.call_count, self.service.MAX_RETRIES + 1)
+        self.assertEqual(self.service.statistics["GET /projects"]["errors"], 1)
+
+    def test_headers_are_not_shared(self):
+        with patch.object(
+            requests.Session, "send", return_value=self._response(200)
+        ) as send:
+            self.service._request("https://api.test/projects", headers={"x-extra": "1"})
+            self.service._request("https://api.test/projects")
+        first, second = (call.kwargs["request"].headers for call in send.call_args_list)
+        self.assertEqual(first["x-extra"], "1")
+        self.assertNotIn("x-extra", second)
+        self.assertEqual(second["Authorization"], "token=1")
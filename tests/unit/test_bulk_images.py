@@ -0,0 +1,53 @@
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from src.superannotate.lib.core.usecases.images import GetBulkImages
+from src.superannotate.lib.core.usecases.images import GetBulkImagesMap
+
+
+class TestGetBulkImages(TestCase):
+    def setUp(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        self.service = MagicMock()
+        self.service.get_bulk_images.side_effect = self._get_bulk_images
+
+    def _get_bulk_images(self, project_id, team_id, folder_id, images):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.05)
+        with self.lock:
+            self.in_flight -= 1
+        return [
+            {"name": name, "id": int(name.split("_")[1])}
+            for name in images
+            if int(name.split("_")[1]) % 2
+        ]
+
+    def _use_case(self, use_case, images):
+        return use_case(
+            service=self.service, project_id=1, team_id=1, folder_id=1, images=images
+        )
+
+    def test_chunks_are_requested_in_parallel(self):
+        names = [f"image_{i}" for i in range(GetBulkImages.CHUNK_SIZE * 6 + 1)]
+        images = self._use_case(GetBulkImages, names).execute().data
+        self.assertEqual(self.service.get_bulk_images.call_count, 7)
+        self.assertEqual([image.name for image in images], names[1::2])
+        self.assertGreater(self.max_in_flight, 1)
+        self.assertLessEqual(self.max_in_flight, GetBulkImages.MAX_WORKERS)
+
+    def test_name_map(self):
+        data = self._use_case(GetBulkImagesMap, ["image_1", "image_2"]).execute().data
+        self.assertEqual(list(data), ["image_1"])
+        self.assertEqual(data["image_1"].uuid, 1)
+
+    def test_error_response(self):
+        self.service.get_bulk_images.side_effect = None
+        self.service.get_bulk_images.return_value = {"error": "Project not found"}
+        with self.assertRaisesRegex(Exception, "Project not found"):
+            self._use_case(GetBulkImages, ["image_1"]).execute()
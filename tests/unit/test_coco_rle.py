@@ -0,0 +1,100 @@
+from unittest import TestCase
+
+import numpy as np
+
+from src.superannotate.lib.app.input_converters.converters.coco_converters.coco_api import (
+    _frString,
+)
+from src.superannotate.lib.app.input_converters.converters.coco_converters.coco_api import (
+    _masktoRLE,
+)
+from src.superannotate.lib.app.input_converters.converters.coco_converters.coco_api import (
+    _toBbox,
+)
+from src.superannotate.lib.app.input_converters.converters.coco_converters.coco_api import (
+    _toString,
+)
+from src.superannotate.lib.app.input_converters.converters.coco_converters.coco_api import (
+    decode,
+)
+from src.superannotate.lib.app.input_converters.converters.coco_converters.coco_api import (
+    encode,
+)
+
+
+def rle_to_string(counts):
+    # rleToString of the pycocotools maskApi.c
+    string = ""
+    for i, count in enumerate(counts):
+        x = int(count)
+        if i > 2:
+            x -= int(counts[i - 2])
+        more = True
+        while more:
+            c = x & 0x1F
+            x >>= 5
+            more = x != -1 if c & 0x10 else x != 0
+            if more:
+                c |= 0x20
+            string += chr(c + 48)
+    return string
+
+
+def mask_to_counts(bitmask):
+    # rleEncode of the pycocotools maskApi.c
+    counts, previous, count = [], 0, 0
+    for value in bitmask.ravel(order="F"):
+        if value != previous:
+            counts.append(count)
+            count, previous = 0, value
+        count += 1
+    counts.append(count)
+    return counts
+
+
+class TestCocoRLE(TestCase):
+    def setUp(self):
+        self.random = np.random.default_rng(0)
+
+    def _masks(self):
+        yield np.zeros((5, 7), dtype=np.uint8)
+        yield np.ones((5, 7), dtype=np.uint8)
+        yield np.zeros((0, 3), dtype=np.uint8)
+        for _ in range(200):
+            height, width = self.random.integers(1, 50, 2)
+            yield (self.random.random((height, width)) < self.random.random()).astype(
+                np.uint8
+            )
+
+    def test_encode_matches_pycocotools(self):
+        for mask in self._masks():
+            counts = mask_to_counts(mask)
+            self.assertEqual(_masktoRLE(mask)["counts"].tolist(), counts)
+            self.assertEqual(
+                encode(mask),
+                {"counts": rle_to_string(counts), "size": list(mask.shape)},
+            )
+
+    def test_round_trip(self):
+        for mask in self._masks():
+            rle = encode(mask)
+            self.assertEqual(_frString(rle["counts"]).tolist(), mask_to_counts(mask))
+            decoded = decode(rle)
+            self.assertEqual(decoded.shape, mask.shape)
+            self.assertTrue(np.array_equal(decoded, mask))
+
+    def test_string_of_any_counts(self):
+        for _ in range(200):
+            counts = self.random.integers(
+                -(2 ** 31), 2 ** 31, self.random.integers(0, 20)
+            ).tolist()
+            string = _toString(counts)
+            self.assertEqual(string, rle_to_string(counts))
+            self.assertEqual(_frString(string).tolist(), counts)
+
+    def test_bbox(self):
+        mask = np.zeros((10, 20), dtype=bool)
+        self.assertEqual(_toBbox(mask), [0, 0, 0, 0])
+        mask[2:5, 3:9] = True
+        mask[7, 1] = True
+        self.assertEqual(_toBbox(mask), [1, 2, 8, 6])
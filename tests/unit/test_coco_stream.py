@@ -0,0 +1,102 @@
+import json
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from src.superannotate.lib.app.input_converters.converters.coco_converters.coco_stream import (
+    _JSONStream,
+)
+from src.superannotate.lib.app.input_converters.converters.coco_converters.coco_stream import (
+    CocoIndex,
+)
+from src.superannotate.lib.app.input_converters.converters.coco_converters.coco_stream import (
+    CocoWriter,
+)
+from src.superannotate.lib.app.input_converters.converters.coco_converters.coco_stream import (
+    iter_coco_json,
+)
+
+
+class TestCocoStream(TestCase):
+    COCO_JSON = {
+        "info": {"description": "test", "year": 2021},
+        "licenses": [],
+        "images": [
+            {"id": 1, "file_name": "1.jpg", "height": 10, "width": 20},
+            {"id": 2, "file_name": "2.jpg", "height": 10, "width": 20},
+            {"id": 3, "file_name": "3.jpg", "height": 10, "width": 20},
+        ],
+        "annotations": [
+            {"id": 1, "image_id": 2, "bbox": [1.5, 2, 3, 4], "category_id": 1},
+            {"id": 2, "image_id": 1, "segmentation": [[1, 2, 3, 4.25, 5, 6]]},
+            {"id": 2, "image_id": 2, "segmentation": {"counts": 'ab"c'}},
+            {"id": 3, "image_id": 2, "bbox": [1, 2, 3, 4], "category_id": 1},
+        ],
+        "categories": [{"id": 1, "name": "car"}, {"id": 2, "name": "person"}],
+    }
+
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self._temp_dir.name) / "coco.json"
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def _dump(self, indent=None):
+        with open(self.path, "w") as file:
+            json.dump(self.COCO_JSON, file, indent=indent)
+
+    def test_iter_coco_json(self):
+        expected = [("info", self.COCO_JSON["info"], False)]
+        for key in ("images", "annotations", "categories"):
+            expected.extend((key, item, True) for item in self.COCO_JSON[key])
+        for indent in (None, 2):
+            self._dump(indent)
+            # values split between the chunks are read again
+            with patch.object(_JSONStream, "CHUNK_SIZE", 7):
+                self.assertEqual(list(iter_coco_json(self.path)), expected)
+
+    def test_index(self):
+        self._dump()
+        with CocoIndex(self.path) as coco_index:
+            self.assertEqual(coco_index.categories, self.COCO_JSON["categories"])
+            self.assertEqual(coco_index.images_count, 3)
+            self.assertEqual(coco_index.annotations_count, 4)
+            self.assertEqual(coco_index.get_repeated_annotation_ids(), {2: 2})
+            annotations = self.COCO_JSON["annotations"]
+            self.assertEqual(
+                list(coco_index.iter_images()),
+                [
+                    (self.COCO_JSON["images"][0], [annotations[1]]),
+                    (
+                        self.COCO_JSON["images"][1],
+                        [annotations[0], annotations[2], annotations[3]],
+                    ),
+                    (self.COCO_JSON["images"][2], []),
+                ],
+            )
+
+    def test_writer(self):
+        for images, annotations in ((3, 4), (0, 0)):
+            out_json = dict(self.COCO_JSON, images=[], annotations=[])
+            with CocoWriter(self.path, out_json) as writer:
+                for image in self.COCO_JSON["images"][:images]:
+                    writer.add_image(image)
+                for annotation in self.COCO_JSON["annotations"][:annotations]:
+                    writer.add_annotation(annotation)
+            expected = dict(
+                self.COCO_JSON,
+                images=self.COCO_JSON["images"][:images],
+                annotations=self.COCO_JSON["annotations"][:annotations],
+            )
+            with open(self.path) as file:
+                self.assertEqual(file.read(), json.dumps(expected, indent=2))
+
+    def test_writer_error(self):
+        with self.assertRaises(ValueError):
+            with CocoWriter(self.path, dict(self.COCO_JSON)) as writer:
+                writer.add_image(self.COCO_JSON["images"][0])
+                raise ValueError
+        with open(self.path) as file:
+            self.assertRaises(json.JSONDecodeError, json.load, file)
@@ -0,0 +1,227 @@
+from pathlib import Path
+from unittest import TestCase
+
+import pandas as pd
+
+from src.superannotate.lib.app.analytics.common import aggregate_instance_attributes
+from src.superannotate.lib.app.analytics.common import image_consensus
+from src.superannotate.lib.app.analytics.common import images_consensus
+from src.superannotate.lib.core.usecases.models import BenchmarkUseCase
+from src.superannotate.lib.core.usecases.models import ConsensusUseCase
+
+
+class TestAggregateInstanceAttributes(TestCase):
+    def test_attributes(self):
+        df = pd.DataFrame(
+            [
+                ("2.jpg", 0, "f1", "car", "color", "red"),
+                ("1.jpg", 1, "f1", "car", "doors", "2"),
+                ("1.jpg", 1, "f1", "car", "color", "red"),
+                ("1.jpg", 1, "f1", "car", "color", "blue"),
+                ("1.jpg", 0, "f2", "car", None, None),
+                ("1.jpg", 0, "f1", "person", None, None),
+            ],
+            columns=[
+                "imageName",
+                "instanceId",
+                "folderName",
+                "className",
+                "attributeGroupName",
+                "attributeName",
+            ],
+        )
+        instances_df = aggregate_instance_attributes(df)
+        self.assertEqual(
+            list(instances_df.columns),
+            ["imageName", "instanceId", "folderName", "className", "attributes"],
+        )
+        self.assertEqual(
+            instances_df.values.tolist(),
+            [
+                ["2.jpg", 0, "f1", "car", {"color": ["red"]}],
+                ["1.jpg", 1, "f1", "car", {"doors": ["2"], "color": ["red", "blue"]}],
+                ["1.jpg", 0, "f2", "car", None],
+                ["1.jpg", 0, "f1", "person", None],
+            ],
+        )
+        self.assertEqual(
+            list(instances_df["attributes"][1]),
+            ["doors", "color"],
+        )
+
+
+class TestImagesConsensus(TestCase):
+    @staticmethod
+    def _bbox(x1, y1, x2, y2):
+        return {"points": {"x1": x1, "y1": y1, "x2": x2, "y2": y2}}
+
+    @staticmethod
+    def _polygon(x1, y1, x2, y2):
+        return {"points": [x1, y1, x2, y1, x2, y2, x1, y2]}
+
+    @staticmethod
+    def _df(rows):
+        return pd.DataFrame(
+            [
+                {
+                    "imageName": image_name,
+                    "folderName": folder_name,
+                    "className": class_name,
+                    "creatorEmail": f"{folder_name}@example.com",
+                    "attributes": None,
+                    "meta": meta,
+                }
+                for image_name, folder_name, class_name, meta in rows
+            ]
+        )
+
+    def _instances_df(self, instance):
+        return self._df(
+            [
+                ("1.jpg", "f1", "car", instance(0, 0, 10, 10)),
+                ("1.jpg", "f1", "car", instance(100, 100, 110, 110)),
+                ("1.jpg", "f2", "car", instance(5, 0, 15, 10)),
+                ("1.jpg", "f2", "person", instance(100, 100, 110, 110)),
+                ("2.jpg", "f1", "car", instance(0, 0, 10, 10)),
+                ("2.jpg", "f2", "car", instance(0, 0, 10, 10)),
+            ]
+        )
+
+    def test_bbox_and_polygon_matching(self):
+        for instance in (self._bbox, self._polygon):
+            annot_type = "bbox" if instance == self._bbox else "polygon"
+            df = images_consensus(self._instances_df(instance), annot_type)
+            self.assertEqual(
+                list(
+                    zip(
+                        df["imageName"], df["instanceId"], df["folderName"], df["score"]
+                    )
+                ),
+                [
+                    ("1.jpg", 0, "f1", 1 / 3),
+                    ("1.jpg", 0, "f2", 1 / 3),
+                    ("1.jpg", 1, "f1", 0),
+                    ("1.jpg", 2, "f2", 0),
+                    ("2.jpg", 0, "f1", 1),
+                    ("2.jpg", 0, "f2", 1),
+                ],
+            )
+            self.assertEqual(list(df["area"]), [100] * 6)
+
+    def test_point_matches_nearest(self):
+        df = self._df(
+            [
+                ("1.jpg", "f1", "car", {"x": 0, "y": 0}),
+                ("1.jpg", "f2", "car", {"x": 30, "y": 40}),
+                ("1.jpg", "f2", "car", {"x": 3, "y": 4}),
+                ("1.jpg", "f3", "car", {"x": 100, "y": 100}),
+            ]
+        )
+        consensus_df = images_consensus(df, "point")
+        self.assertEqual(list(consensus_df["folderName"]), ["f1", "f2", "f3", "f2"])
+        self.assertEqual(list(consensus_df["instanceId"]), [0, 0, 0, 1])
+        self.assertEqual(list(consensus_df["score"]), [1, 1, 1, 0])
+
+    def test_image_consensus(self):
+        df = self._instances_df(self._bbox)
+        self.assertEqual(
+            pd.DataFrame(image_consensus(df, "2.jpg", "bbox")).to_dict("list"),
+            images_consensus(df[df["imageName"] == "2.jpg"], "bbox").to_dict("list"),
+        )
+
+    def test_processing_workers(self):
+        df = self._instances_df(self._polygon)
+        pd.testing.assert_frame_equal(
+            images_consensus(df, "polygon"),
+            images_consensus(df, "polygon", processing_workers=2),
+        )
+
+    def test_empty(self):
+        df = images_consensus(
+            self._df([]).reindex(columns=["imageName", "folderName"]), "bbox"
+        )
+        self.assertTrue(df.empty)
+        self.assertEqual(len(df.columns), 8)
+
+
+class TestConsensusBenchmarkScores(TestCase):
+    TEST_FOLDER_PATH = "data_set/consensus_benchmark/consensus_test_data"
+    FOLDER_NAMES = ["consensus_1", "consensus_2", "consensus_3"]
+    # the folder score sums before the instance attributes aggregation was vectorised
+    CONSENSUS_SCORES = {
+        "polygon": {"consensus_1": 13.44, "consensus_2": 12.932, "consensus_3": 10.979},
+        "bbox": {"consensus_1": 13.727, "consensus_2": 12.9, "consensus_3": 12.945},
+        "point": {"consensus_1": 11.5, "consensus_2": 10.5, "consensus_3": 11.0},
+    }
+    BENCHMARK_SCORES = {
+        "polygon": {"consensus_2": 15.394, "consensus_3": 11.486},
+        "bbox": {"consensus_2": 13.682, "consensus_3": 13.773},
+        "point": {"consensus_2": 11.0, "consensus_3": 12.0},
+    }
+
+    @property
+    def folder_path(self):
+        return str(Path(__file__).parent.parent / self.TEST_FOLDER_PATH)
+
+    @staticmethod
+    def _folder_scores(df):
+        return df.groupby("folderName")["score"].sum().round(3).to_dict()
+
+    def test_consensus(self):
+        for annotation_type, scores in self.CONSENSUS_SCORES.items():
+            df = (
+                ConsensusUseCase(
+                    None,
+                    self.FOLDER_NAMES,
+                    self.folder_path,
+                    None,
+                    annotation_type,
+                    False,
+                )
+                .execute()
+                .data
+            )
+            self.assertEqual(self._folder_scores(df), scores)
+
+    def test_bbox_consensus_instances(self):
+        df = (
+            ConsensusUseCase(
+                None, self.FOLDER_NAMES, self.folder_path, None, "bbox", False
+            )
+            .execute()
+            .data
+        )
+        df = df[df["imageName"] == "leverkusen_000000_000019_leftImg8bit.png"]
+        self.assertEqual(
+            list(zip(df["instanceId"], df["folderName"], df["score"].round(6))),
+            [
+                (0, "consensus_2", 0.246222),
+                (0, "consensus_1", 0.246222),
+                (1, "consensus_2", 0.651527),
+                (1, "consensus_1", 0.825763),
+                (1, "consensus_3", 0.825763),
+                (2, "consensus_2", 1.0),
+                (2, "consensus_1", 1.0),
+                (2, "consensus_3", 1.0),
+                (3, "consensus_2", 1.0),
+                (3, "consensus_1", 1.0),
+                (3, "consensus_3", 1.0),
+            ],
+        )
+
+    def test_benchmark(self):
+        for annotation_type, scores in self.BENCHMARK_SCORES.items():
+            df = (
+                BenchmarkUseCase(
+                    None,
+                    self.FOLDER_NAMES[0],
+                    self.FOLDER_NAMES[1:],
+                    self.folder_path,
+                    None,
+                    annotation_type,
+                    False,
+                )
+                .execute()
+                .data
+            )
+            self.assertEqual(self._folder_scores(df), scores)
@@ -0,0 +1,81 @@
+import os
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from src.superannotate.lib.core.content_index import content_hash
+from src.superannotate.lib.core.content_index import ContentIndex
+from src.superannotate.lib.core.entities import FolderEntity
+from src.superannotate.lib.core.entities import ProjectEntity
+from src.superannotate.lib.core.usecases.images import UploadImagesToProject
+
+
+class TestContentIndex(TestCase):
+    def test_index_is_scoped(self):
+        path = os.path.join(tempfile.mkdtemp(), "index.db")
+        hash_ = content_hash(b"image")
+        self.assertEqual(hash_, content_hash(b"image"))
+        self.assertNotEqual(hash_, content_hash(b"other image"))
+        ContentIndex(path, "bucket").add(hash_, {"path": "key"})
+        self.assertEqual(ContentIndex(path, "bucket").get(hash_), {"path": "key"})
+        self.assertIsNone(ContentIndex(path, "other bucket").get(hash_))
+
+
+class TestImageUploadDeduplication(TestCase):
+    TEST_FOLDER_PATH = "data_set/sample_project_vector"
+
+    def test_same_content_is_not_uploaded_again(self):
+        index_path = os.path.join(tempfile.mkdtemp(), "index.db")
+        folder = Path(__file__).parent.parent / self.TEST_FOLDER_PATH
+        paths = sorted(str(path) for path in folder.glob("*.jpg"))
+        s3_keys = []
+        s3_repo = MagicMock()
+        s3_repo.insert.side_effect = lambda entity: s3_keys.append(entity.uuid)
+        backend = MagicMock()
+        backend.get_bulk_images.return_value = []
+        backend.get_s3_upload_auth_token.return_value = {
+            "accessKeyId": "access",
+            "secretAccessKey": "secret",
+            "sessionToken": "token",
+            "bucket": "bucket",
+            "filePath": "images/",
+            "availableImageCount": 100,
+        }
+        limits = MagicMock(ok=True)
+        limits.data.user_limit = None
+        limits.data.folder_limit.remaining_image_count = 100
+        limits.data.project_limit.remaining_image_count = 100
+        backend.get_limitations.return_value = limits
+        backend.attach_files.side_effect = lambda **kwargs: [
+            {"name": file["name"]} for file in kwargs["files"]
+        ]
+        use_cases = []
+        for folder_id in (1, 2):
+            use_case = UploadImagesToProject(
+                project=ProjectEntity(
+                    uuid=1, team_id=1, project_type=1, upload_state=1
+                ),
+                folder=FolderEntity(uuid=folder_id),
+                settings=MagicMock(),
+                s3_repo=lambda *_: s3_repo,
+                backend_client=backend,
+                paths=paths,
+                content_index_path=index_path,
+            )
+            list(use_case.execute())
+            self.assertEqual(len(use_case.data[0]), len(paths))
+            use_cases.append(use_case)
+
+        self.assertEqual(len(s3_keys), len(paths) * 4)
+        attached = [
+            {file["path"] for file in call.kwargs["files"]}
+            for call in backend.attach_files.call_args_list
+        ]
+        self.assertEqual(attached[0], attached[1])
+        self.assertEqual(use_cases[0].deduplication_report["images"], 0)
+        report = use_cases[1].deduplication_report
+        self.assertEqual(report["images"], len(paths))
+        self.assertGreater(
+            report["bytes"], sum(os.path.getsize(path) for path in paths)
+        )
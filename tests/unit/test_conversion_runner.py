@@ -0,0 +1,39 @@
+import os
+import time
+from unittest import TestCase
+
+from src.superannotate.lib.app.input_converters.converters.runner import (
+    ConversionRunner,
+)
+
+
+def square(value, delay=0):
+    time.sleep(delay)
+    return value * value, os.getpid()
+
+
+class TestConversionRunner(TestCase):
+    TASKS = [(i, 0.05 if i == 0 else 0) for i in range(20)]
+
+    def test_serial(self):
+        results = list(ConversionRunner().run(square, self.TASKS, len(self.TASKS)))
+        self.assertEqual([value for value, _ in results], [i * i for i in range(20)])
+        self.assertEqual({pid for _, pid in results}, {os.getpid()})
+
+    def test_processes_ordered(self):
+        runner = ConversionRunner(processing_workers=2, chunk_size=2)
+        results = list(runner.run(square, iter(self.TASKS), len(self.TASKS)))
+        self.assertEqual([value for value, _ in results], [i * i for i in range(20)])
+        self.assertNotIn(os.getpid(), {pid for _, pid in results})
+
+    def test_processes_unordered(self):
+        runner = ConversionRunner(processing_workers=2, ordered=False, chunk_size=2)
+        results = list(runner.run(square, self.TASKS))
+        self.assertEqual(
+            sorted(value for value, _ in results), [i * i for i in range(20)]
+        )
+
+    def test_error(self):
+        runner = ConversionRunner(processing_workers=2)
+        with self.assertRaises(TypeError):
+            list(runner.run(square, [(1,), ("a",)], 2))
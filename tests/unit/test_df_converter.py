@@ -0,0 +1,75 @@
+import json
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+import pandas as pd
+
+from src.superannotate.lib.app.analytics.common import aggregate_annotations_as_df
+from src.superannotate.lib.app.input_converters.df_converter import df_to_annotations
+from src.superannotate.lib.app.input_converters.df_converter import (
+    filter_annotation_instances,
+)
+
+
+class TestDfConverter(TestCase):
+    TEST_FOLDER_PATH = "data_set/sample_project_vector"
+
+    @property
+    def folder_path(self):
+        return Path(__file__).parent.parent / self.TEST_FOLDER_PATH
+
+    def _aggregate(self, path):
+        return aggregate_annotations_as_df(
+            path, include_comments=True, include_tags=True, verbose=False
+        )
+
+    def test_df_to_annotations(self):
+        df = self._aggregate(self.folder_path)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # the undecorated function, without the usage tracking
+            df_to_annotations.function(df, tmp_dir, writing_workers=2)
+            annotation = json.loads(
+                (Path(tmp_dir) / "example_image_1.jpg___objects.json").read_text()
+            )
+            self.assertEqual(
+                annotation["metadata"],
+                {"width": 1024, "height": 683, "status": "Completed", "pinned": False},
+            )
+            self.assertEqual(
+                len(annotation["instances"]),
+                df.loc[
+                    df["imageName"] == "example_image_1.jpg", "instanceId"
+                ].nunique(),
+            )
+            classes = json.loads(
+                (Path(tmp_dir) / "classes" / "classes.json").read_text()
+            )
+            self.assertEqual(
+                [annotation_class["name"] for annotation_class in classes],
+                list(df["className"].dropna().unique()),
+            )
+            pd.testing.assert_frame_equal(
+                df.drop(columns=["folderName"]),
+                self._aggregate(tmp_dir).drop(columns=["folderName"]),
+            )
+
+    def test_filter_annotation_instances(self):
+        df = self._aggregate(self.folder_path)
+        filtered_df = filter_annotation_instances.function(
+            df,
+            include=[{"className": "Personal vehicle"}, {"type": "bbox"}],
+            exclude=[
+                {"type": "polygon"},
+                {"attributes": [{"groupName": "Num doors", "name": "4"}]},
+            ],
+        )
+        excluded = (df["type"] == "polygon") | (
+            (df["attributeGroupName"] == "Num doors") & (df["attributeName"] == "4")
+        )
+        # the rows matching several include rules are repeated
+        self.assertEqual(
+            list(filtered_df.index),
+            list(df.index[(df["className"] == "Personal vehicle") & ~excluded])
+            + list(df.index[(df["type"] == "bbox") & ~excluded]),
+        )
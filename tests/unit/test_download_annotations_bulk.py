@@ -0,0 +1,138 @@
+import json
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from src.superannotate.lib.core.entities import AnnotationClassEntity
+from src.superannotate.lib.core.entities import FolderEntity
+from src.superannotate.lib.core.entities import ProjectEntity
+from src.superannotate.lib.core.usecases.images import DownloadImagesAnnotationsUseCase
+
+
+class TestDownloadImagesAnnotations(TestCase):
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.service = MagicMock()
+        self.service.get_bulk_images.return_value = [
+            {"name": "a.jpg", "id": 1},
+            {"name": "b.jpg", "id": 2},
+        ]
+        self.service.get_templates.return_value = {
+            "data": [{"id": 5, "name": "skeleton"}]
+        }
+        self.service.get_download_token.side_effect = lambda **kwargs: {
+            "annotations": {
+                "MAIN": [
+                    {
+                        "annotation_json_path": {
+                            "url": f"json/{kwargs['image_id']}",
+                            "headers": {},
+                        },
+                        "annotation_bluemap_path": {
+                            "url": f"mask/{kwargs['image_id']}",
+                            "headers": {},
+                        },
+                    }
+                ]
+            }
+        }
+        self.annotation_classes = MagicMock()
+        self.annotation_classes.get_all.return_value = [
+            AnnotationClassEntity(
+                uuid=10,
+                name="car",
+                attribute_groups=[
+                    {
+                        "id": 20,
+                        "name": "color",
+                        "attributes": [{"id": 30, "name": "red"}],
+                    }
+                ],
+            )
+        ]
+        self.session = MagicMock()
+        self.session.__enter__.return_value = self.session
+        self.session.get.side_effect = self._get
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    @staticmethod
+    def _get(url, headers):
+        response = MagicMock()
+        response.ok = url != "json/2"
+        response.json.return_value = {
+            "instances": [
+                {"classId": 10, "attributes": [{"groupId": 20, "id": 30}]},
+                {"type": "template", "templateId": 5, "attributes": []},
+            ]
+        }
+        response.content = b"mask"
+        return response
+
+    def _use_case(self, project_type):
+        use_case = DownloadImagesAnnotationsUseCase(
+            service=self.service,
+            project=ProjectEntity(uuid=1, team_id=1, project_type=project_type),
+            folder=FolderEntity(uuid=1),
+            image_names=["a.jpg", "b.jpg", "c.jpg", "a.jpg"],
+            destination=self._temp_dir.name,
+            annotation_classes=self.annotation_classes,
+            download_workers=2,
+        )
+        use_case._create_session = lambda: self.session
+        return use_case
+
+    def test_vector(self):
+        use_case = self._use_case(project_type=1)
+        self.assertEqual(len(list(use_case.execute())), 2)
+        json_path = str(Path(self._temp_dir.name) / "a.jpg___objects.json")
+        self.assertEqual(
+            use_case.data,
+            [(json_path, "None"), (None, None), (None, None), (json_path, "None")],
+        )
+        with open(json_path) as file:
+            instances = json.load(file)["instances"]
+        self.assertEqual(instances[0]["className"], "car")
+        self.assertEqual(
+            instances[0]["attributes"],
+            [{"groupId": 20, "id": 30, "groupName": "color", "name": "red"}],
+        )
+        self.assertEqual(instances[1]["templateName"], "skeleton")
+        # the images, classes and templates are requested once for all the images
+        self.service.get_bulk_images.assert_called_once()
+        self.annotation_classes.get_all.assert_called_once()
+        self.service.get_templates.assert_called_once()
+        self.assertEqual(self.service.get_download_token.call_count, 2)
+
+    def test_pixel_mask(self):
+        use_case = self._use_case(project_type=2)
+        list(use_case.execute())
+        mask_path = Path(self._temp_dir.name) / "a.jpg___save.png"
+        self.assertEqual(
+            use_case.data[0],
+            (str(Path(self._temp_dir.name) / "a.jpg___pixel.json"), str(mask_path)),
+        )
+        self.assertEqual(mask_path.read_bytes(), b"mask")
+
+    def test_failed_image_doesnt_stop_the_download(self):
+        get_download_token = self.service.get_download_token.side_effect
+
+        def failing_download_token(**kwargs):
+            if kwargs["image_id"] == 2:
+                raise ConnectionError("Connection reset.")
+            return get_download_token(**kwargs)
+
+        self.service.get_download_token.side_effect = failing_download_token
+        use_case = self._use_case(project_type=1)
+        self.assertEqual(len(use_case.images_to_download), 2)
+        with self.assertLogs("root", level="WARNING") as logs:
+            self.assertEqual(len(list(use_case.execute())), 2)
+        self.assertIn("Connection reset.", "".join(logs.output))
+        json_path = str(Path(self._temp_dir.name) / "a.jpg___objects.json")
+        self.assertEqual(
+            use_case.data,
+            [(json_path, "None"), (None, None), (None, None), (json_path, "None")],
+        )
+        self.service.get_bulk_images.assert_called_once()
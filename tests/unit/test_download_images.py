@@ -0,0 +1,123 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from src.superannotate.lib.core.entities import FolderEntity
+from src.superannotate.lib.core.entities import ImageEntity
+from src.superannotate.lib.core.entities import ProjectEntity
+from src.superannotate.lib.core.usecases.images import DownloadImagesUseCase
+
+
+class TestDownloadImages(TestCase):
+    CONTENT = {"original": b"original image", "lores": b"lores"}
+
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.destination = Path(self._temp_dir.name)
+        self.service = MagicMock()
+        self.service.get_download_token.side_effect = lambda **kwargs: {
+            variant: {"url": f"{variant}/{kwargs['image_id']}", "headers": {}}
+            for variant in ("original", "lores")
+        }
+        self.images = MagicMock()
+        self.images.get_all.return_value = [
+            ImageEntity(uuid=1, name="a.jpg"),
+            ImageEntity(uuid=2, name="b.jpg"),
+        ]
+        self.session = MagicMock()
+        self.session.__enter__.return_value = self.session
+        self.session.get.side_effect = self._get
+        self.requested_urls = []
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def _get(self, url, headers, stream):
+        self.requested_urls.append(url)
+        variant, image_id = url.split("/")
+        content = self.CONTENT[variant]
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.ok = image_id != "2"
+        response.status_code = 200 if response.ok else 404
+        response.headers = {"Content-Length": str(len(content))}
+        response.iter_content.return_value = [content[:3], content[3:]]
+        return response
+
+    def _use_case(self, **kwargs):
+        use_case = DownloadImagesUseCase(
+            service=self.service,
+            project=ProjectEntity(uuid=1, team_id=1, project_type=1),
+            folder=FolderEntity(uuid=1),
+            images=self.images,
+            destination=str(self.destination),
+            annotation_classes=MagicMock(),
+            download_workers=2,
+            **kwargs,
+        )
+        use_case._create_session = lambda: self.session
+        return use_case
+
+    def test_folder_images(self):
+        use_case = self._use_case(image_names=None)
+        self.assertEqual(len(list(use_case.execute())), 2)
+        self.assertEqual(
+            use_case.data, [(str(self.destination / "a.jpg"), None), (None, None)]
+        )
+        self.assertEqual(
+            (self.destination / "a.jpg").read_bytes(), self.CONTENT["original"]
+        )
+        self.assertEqual(
+            sorted(path.name for path in self.destination.iterdir()), ["a.jpg"]
+        )
+
+    def test_lores_and_existing_files(self):
+        (self.destination / "a.jpg___lores.jpg").write_bytes(b"12345")
+        (self.destination / "c.jpg___lores.jpg").write_bytes(b"1234")
+        self.service.get_bulk_images.return_value = [
+            {"name": "a.jpg", "id": 1},
+            {"name": "c.jpg", "id": 3},
+        ]
+        use_case = self._use_case(image_names=["a.jpg", "c.jpg"], image_variant="lores")
+        list(use_case.execute())
+        self.assertEqual(
+            use_case.data,
+            [
+                (str(self.destination / "a.jpg___lores.jpg"), None),
+                (str(self.destination / "c.jpg___lores.jpg"), None),
+            ],
+        )
+        # the file with the size of the remote one isn't downloaded again
+        self.assertEqual(
+            (self.destination / "a.jpg___lores.jpg").read_bytes(), b"12345"
+        )
+        self.assertEqual(
+            (self.destination / "c.jpg___lores.jpg").read_bytes(), b"lores"
+        )
+        self.assertEqual(use_case._skipped_count, 1)
+        self.assertEqual(use_case._downloaded_bytes, 5)
+
+    def test_invalid_variant(self):
+        use_case = self._use_case(image_names=["a.jpg"], image_variant="huge")
+        self.assertFalse(use_case.is_valid())
+
+    def test_failed_image_doesnt_stop_the_download(self):
+        get_download_token = self.service.get_download_token.side_effect
+
+        def failing_download_token(**kwargs):
+            if kwargs["image_id"] == 1:
+                raise ConnectionError("Connection reset.")
+            return get_download_token(**kwargs)
+
+        self.service.get_download_token.side_effect = failing_download_token
+        self.images.get_all.return_value.append(ImageEntity(uuid=3, name="c.jpg"))
+        use_case = self._use_case(image_names=None)
+        self.assertEqual(len(use_case.images_to_download), 3)
+        with self.assertLogs("root", level="WARNING") as logs:
+            self.assertEqual(len(list(use_case.execute())), 3)
+        self.assertIn("Connection reset.", "".join(logs.output))
+        self.assertEqual(
+            use_case.data,
+            [(None, None), (None, None), (str(self.destination / "c.jpg"), None)],
+        )
@@ -0,0 +1,135 @@
+import json
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+import numpy as np
+from PIL import Image
+
+from src.superannotate.lib.core.usecases.images import CreateFuseImagesUseCase
+from src.superannotate.lib.core.usecases.images import CreateFuseImageUseCase
+
+
+class TestFuseImage(TestCase):
+    CLASSES = [
+        {"id": 1, "name": "car", "color": "#ff0000"},
+        {"id": 2, "name": "tree", "color": "#00ff00"},
+    ]
+
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self._temp_dir.name)
+        (self.root / "classes").mkdir()
+        with open(self.root / "classes" / "classes.json", "w") as file:
+            json.dump(self.CLASSES, file)
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def _add_image(self, name, annotations, suffix, mask=None):
+        Image.new("RGB", (40, 30), (10, 20, 30)).save(self.root / name)
+        with open(self.root / f"{name}{suffix}", "w") as file:
+            json.dump(annotations, file)
+        if mask is not None:
+            Image.fromarray(mask).save(self.root / f"{name}___save.png")
+
+    def test_map_mask_colors(self):
+        mask = np.array(
+            [[[1, 2, 3, 255], [1, 2, 3, 0], [4, 5, 6, 255], [7, 8, 9, 255]]],
+            dtype=np.uint8,
+        )
+        color_map = {
+            int(CreateFuseImageUseCase.pack_colors((1, 2, 3))): (100, 0, 0, 255),
+            int(CreateFuseImageUseCase.pack_colors((7, 8, 9, 255))): (0, 100, 0, 255),
+        }
+        self.assertEqual(
+            CreateFuseImageUseCase.map_mask_colors(mask, color_map).tolist(),
+            [
+                [
+                    [100, 0, 0, 255],
+                    [0, 0, 0, 255],
+                    [0, 0, 0, 255],
+                    [0, 100, 0, 255],
+                ]
+            ],
+        )
+        self.assertEqual(
+            CreateFuseImageUseCase.map_mask_colors(mask, {}).tolist(),
+            [4 * [[0, 0, 0, 255]]],
+        )
+
+    def test_pixel_fuse_image(self):
+        mask = np.zeros((30, 40, 4), dtype=np.uint8)
+        mask[:10] = (0, 0, 1, 255)
+        mask[10:20] = (0, 0, 2, 255)
+        mask[20:] = (0, 0, 3, 255)
+        annotations = {
+            "instances": [
+                {"className": "car", "parts": [{"color": "#000001"}]},
+                {"className": "tree", "parts": [{"color": "#000002"}]},
+                {"className": "unknown", "parts": [{"color": "#000003"}]},
+                # the later instance of a part color is drawn over the earlier ones
+                {"className": "tree", "parts": [{"color": "#000001"}]},
+            ]
+        }
+        self._add_image("image.png", annotations, "___pixel.json", mask)
+        response = CreateFuseImageUseCase(
+            project_type="Pixel",
+            image_path=str(self.root / "image.png"),
+            classes=self.CLASSES,
+        ).execute()
+        fuse = np.array(Image.open(response.data[0]))
+        self.assertEqual(fuse[0, 0].tolist(), [0, 255, 0, 255])
+        self.assertEqual(fuse[15, 0].tolist(), [0, 255, 0, 255])
+        self.assertEqual(fuse[25, 0].tolist(), [0, 0, 0, 255])
+
+    def test_create_fuse_images(self):
+        for index in range(3):
+            self._add_image(
+                f"image_{index}.jpg",
+                {
+                    "instances": [
+                        {
+                            "type": "bbox",
+                            "className": "car",
+                            "points": {"x1": index, "x2": 20, "y1": 5, "y2": 25},
+                        }
+                    ]
+                },
+                "___objects.json",
+            )
+        # the annotations without an image are skipped
+        with open(self.root / "missing.jpg___objects.json", "w") as file:
+            json.dump({"instances": []}, file)
+        for processing_workers in (None, 2):
+            use_case = CreateFuseImagesUseCase(
+                project_type="Vector",
+                export_root=str(self.root),
+                generate_overlay=True,
+                processing_workers=processing_workers,
+            )
+            self.assertEqual(len(list(use_case.execute())), 3)
+            self.assertEqual(
+                use_case.data,
+                [
+                    [
+                        str(self.root / f"image_{index}.jpg___fuse.png"),
+                        str(self.root / f"image_{index}.jpg___overlay.png"),
+                    ]
+                    for index in range(3)
+                ],
+            )
+            fuse = Image.open(self.root / "image_2.jpg___fuse.png")
+            self.assertEqual(fuse.getpixel((10, 10)), (255, 0, 0, 255))
+            self.assertEqual(fuse.getpixel((1, 10)), (0, 0, 0, 255))
+
+    def test_invalid_export_root(self):
+        use_case = CreateFuseImagesUseCase(
+            project_type="Vector", export_root=str(self.root / "missing")
+        )
+        self.assertFalse(use_case.is_valid())
+        self.assertFalse(
+            CreateFuseImagesUseCase(
+                project_type="Video", export_root=str(self.root)
+            ).is_valid()
+        )
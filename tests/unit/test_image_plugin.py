@@ -0,0 +1,135 @@
+import io
+from unittest import TestCase
+
+from PIL import Image
+from PIL import ImageDraw
+
+from src.superannotate.lib.core.plugin import ImagePlugin
+
+
+class TestImagePluginDerivatives(TestCase):
+    @staticmethod
+    def _image_bytes(mode, size, image_format):
+        buffer = io.BytesIO()
+        Image.new(mode, size, (10, 20, 30, 128)[: len(mode)]).save(buffer, image_format)
+        buffer.seek(0)
+        return buffer
+
+    def test_derivative_sizes(self):
+        plugin = ImagePlugin(self._image_bytes("RGB", (1200, 800), "JPEG"), 10 ** 8)
+        thumb, huge, low_resolution = plugin.generate_derivatives()
+        self.assertEqual(Image.open(thumb).size, ImagePlugin.THUMB_SIZE)
+        self.assertEqual(Image.open(huge).size, (600, 400))
+        self.assertEqual(Image.open(low_resolution).size, (1200, 800))
+        self.assertEqual(plugin.get_size(), (1200, 800))
+
+    def test_draft_mode_keeps_original_size(self):
+        plugin = ImagePlugin(self._image_bytes("RGB", (4800, 3200), "JPEG"), 10 ** 8)
+        _, huge, low_resolution = plugin.generate_derivatives(low_resolution=False)
+        self.assertIsNone(low_resolution)
+        self.assertEqual(Image.open(huge).size, (600, 400))
+        self.assertEqual(plugin.get_size(), (4800, 3200))
+
+    def test_transparent_image_low_resolution_on_white(self):
+        plugin = ImagePlugin(self._image_bytes("RGBA", (700, 700), "PNG"), 10 ** 8)
+        _, _, low_resolution = plugin.generate_derivatives(quality=100, subsampling=0)
+        red, _, _ = Image.open(low_resolution).getpixel((350, 350))
+        self.assertAlmostEqual(red, (10 * 128 + 255 * 127) // 255, delta=3)
+
+    def test_resolution_limit(self):
+        plugin = ImagePlugin(self._image_bytes("RGB", (100, 100), "PNG"), 100)
+        with self.assertRaisesRegex(Exception, "too large"):
+            plugin.generate_derivatives()
+
+
+class TestImagePluginDrawing(TestCase):
+    SIZE = (120, 90)
+    FILL = (200, 40, 90, 128)
+    OUTLINE = (255, 255, 255, 255)
+
+    def _plugin(self):
+        buffer = io.BytesIO()
+        Image.new("RGB", self.SIZE, (10, 20, 30)).save(buffer, "PNG")
+        buffer.seek(0)
+        return ImagePlugin(buffer)
+
+    def _expected(self, draw_shape):
+        image = Image.new("RGBA", self.SIZE, (10, 20, 30, 255))
+        layer = Image.new("RGBA", self.SIZE)
+        draw_shape(ImageDraw.Draw(layer))
+        return Image.alpha_composite(image, layer)
+
+    def assertDrawnAs(self, plugin, expected):
+        self.assertEqual(plugin.content.tobytes(), expected.tobytes())
+
+    def test_shapes_match_full_size_layers(self):
+        cases = [
+            (
+                lambda plugin: plugin.draw_bbox(
+                    10, 50, 5, 40, fill_color=self.FILL, outline_color=self.OUTLINE
+                ),
+                lambda draw: draw.rectangle(
+                    ((10, 5), (50, 40)), self.FILL, self.OUTLINE
+                ),
+            ),
+            (
+                lambda plugin: plugin.draw_polygon(
+                    [-10, 20, 60, 2, 130, 80, 30, 70],
+                    fill_color=self.FILL,
+                    outline_color=self.OUTLINE,
+                ),
+                lambda draw: draw.polygon(
+                    [-10, 20, 60, 2, 130, 80, 30, 70], self.FILL, self.OUTLINE
+                ),
+            ),
+            (
+                lambda plugin: plugin.draw_polyline(
+                    [5, 5, 60, 40, 100, 10], fill_color=self.FILL
+                ),
+                lambda draw: draw.line([5, 5, 60, 40, 100, 10], self.FILL, width=2),
+            ),
+            (
+                lambda plugin: plugin.draw_ellipse(
+                    100, 70, 30, 25, fill_color=self.FILL, outline_color=self.OUTLINE
+                ),
+                lambda draw: draw.ellipse(
+                    (70, 45, 130, 95), fill=self.FILL, outline=self.OUTLINE
+                ),
+            ),
+            (
+                lambda plugin: plugin.draw_point(
+                    0, 0, fill_color=self.FILL, outline_color=self.OUTLINE
+                ),
+                lambda draw: draw.ellipse((-2, -2, 2, 2), self.FILL, self.OUTLINE),
+            ),
+            (
+                lambda plugin: plugin.draw_line((20, 80), (110, 15), self.FILL),
+                lambda draw: draw.line(((20, 80), (110, 15)), fill=self.FILL, width=1),
+            ),
+        ]
+        for draw_plugin, draw_expected in cases:
+            plugin = self._plugin()
+            draw_plugin(plugin)
+            self.assertDrawnAs(plugin, self._expected(draw_expected))
+
+    def test_overlapping_shapes_are_composited_in_order(self):
+        plugin = self._plugin()
+        plugin.draw_bbox(
+            10, 60, 10, 60, fill_color=self.FILL, outline_color=self.OUTLINE
+        )
+        plugin.draw_ellipse(
+            50, 50, 20, 20, fill_color=(0, 0, 255, 128), outline_color=self.OUTLINE
+        )
+        expected = self._expected(
+            lambda draw: draw.rectangle(((10, 10), (60, 60)), self.FILL, self.OUTLINE)
+        )
+        layer = Image.new("RGBA", self.SIZE)
+        ImageDraw.Draw(layer).ellipse((30, 30, 70, 70), (0, 0, 255, 128), self.OUTLINE)
+        self.assertDrawnAs(plugin, Image.alpha_composite(expected, layer))
+
+    def test_shape_outside_of_image(self):
+        plugin = self._plugin()
+        plugin.draw_bbox(
+            200, 300, 200, 300, fill_color=self.FILL, outline_color=self.OUTLINE
+        )
+        self.assertDrawnAs(plugin, self._expected(lambda draw: None))
@@ -0,0 +1,83 @@
+import threading
+import time
+from unittest import TestCase
+
+from src.superannotate.lib.core.pipeline import Pipeline
+from src.superannotate.lib.core.pipeline import PipelineStage
+
+
+class TestPipeline(TestCase):
+    def test_all_items_pass_all_stages(self):
+        pipeline = Pipeline(
+            [
+                PipelineStage(lambda x: x + 1, workers=3),
+                PipelineStage(lambda x: x * 2, workers=2),
+            ]
+        )
+        result = sorted(item.value for item in pipeline.run(range(100)))
+        self.assertEqual(result, sorted((x + 1) * 2 for x in range(100)))
+
+    def test_failed_items_are_not_passed_further(self):
+        calls = []
+
+        def fail_odd(value):
+            if value % 2:
+                raise ValueError(value)
+            return value
+
+        pipeline = Pipeline(
+            [
+                PipelineStage(fail_odd, workers=2),
+                PipelineStage(lambda x: calls.append(x) or x, workers=2),
+            ]
+        )
+        items = list(pipeline.run(range(10)))
+        failed = sorted(item.source for item in items if item.failed)
+        self.assertEqual(failed, [1, 3, 5, 7, 9])
+        self.assertEqual(sorted(calls), [0, 2, 4, 6, 8])
+        self.assertTrue(all(item.stage == "fail_odd" for item in items if item.failed))
+
+    def test_batches_are_flushed(self):
+        batches = []
+        pipeline = Pipeline(
+            [
+                PipelineStage(lambda x: x, workers=4),
+                PipelineStage(
+                    lambda values: batches.append(len(values)) or values,
+                    batch_size=10,
+                ),
+            ]
+        )
+        self.assertEqual(len(list(pipeline.run(range(25)))), 25)
+        self.assertEqual(sorted(batches), [5, 10, 10])
+
+    def test_queues_are_bounded(self):
+        produced = []
+        lock = threading.Lock()
+
+        def source():
+            for i in range(1000):
+                with lock:
+                    produced.append(i)
+                yield i
+
+        pipeline = Pipeline([PipelineStage(lambda x: x, workers=1, queue_size=2)])
+        iterator = pipeline.run(source())
+        next(iterator)
+        time.sleep(0.3)
+        with lock:
+            self.assertLess(len(produced), 10)
+        iterator.close()
+
+    def test_source_error_is_raised_after_the_read_items(self):
+        def source():
+            yield 1
+            yield 2
+            raise RuntimeError("corrupt source")
+
+        pipeline = Pipeline([PipelineStage(lambda x: x * 10, workers=2)])
+        values = []
+        with self.assertRaisesRegex(RuntimeError, "corrupt source"):
+            for item in pipeline.run(source()):
+                values.append(item.value)
+        self.assertEqual(sorted(values), [10, 20])
@@ -0,0 +1,42 @@
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from src.superannotate.lib.core.s3 import S3ClientCache
+
+
+class TestS3ClientCache(TestCase):
+    def setUp(self):
+        self.cache = S3ClientCache()
+        self.cache.clear()
+        patcher = patch.object(
+            S3ClientCache, "_create_client", side_effect=lambda *args: object()
+        )
+        self.create_client = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.cache.clear)
+
+    def _get(self, key="key", **kwargs):
+        return self.cache.get_client(key, "access", "secret", "token", **kwargs)
+
+    def test_client_is_shared(self):
+        self.assertIs(S3ClientCache(), self.cache)
+        self.assertIs(self._get(), self._get())
+        self.assertIsNot(self._get(), self._get("other"))
+        self.assertEqual(self.create_client.call_count, 2)
+
+    def test_expired_client_is_recreated(self):
+        client = self._get(expiration=time.time() + S3ClientCache.EXPIRATION_MARGIN / 2)
+        self.assertIsNot(client, self._get())
+        self.assertIs(self._get(), self._get())
+
+    def test_expiration_formats(self):
+        timestamp = 1600000000
+        for expiration in (
+            timestamp,
+            timestamp * 1000,
+            "2020-09-13T12:26:40Z",
+        ):
+            self.assertEqual(
+                S3ClientCache._expiration_timestamp(expiration), timestamp
+            )
@@ -0,0 +1,51 @@
+from unittest import TestCase
+
+import cv2
+import numpy as np
+
+from src.superannotate.lib.app.input_converters.sa_conversion import _color_polygons
+from src.superannotate.lib.app.input_converters.sa_conversion import _color_regions
+
+
+class TestColorRegions(TestCase):
+    def setUp(self):
+        # BGR mask with a color touching the borders, a color with two regions and a single pixel
+        self.img = np.zeros((30, 40, 3), dtype=np.uint8)
+        self.img[0:10, 30:40] = (3, 2, 1)
+        self.img[12:20, 5:15] = (0, 0, 255)
+        self.img[22:28, 20:35] = (0, 0, 255)
+        self.img[25, 2] = (1, 0, 0)
+
+    def full_mask_polygons(self, color):
+        b, g, r = color
+        mask = np.zeros(self.img.shape[:2], dtype=np.uint8)
+        mask[np.all(self.img == (b, g, r), axis=2)] = 255
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        segments = [contour.flatten().tolist() for contour in contours]
+        return [segment for segment in segments if len(segment) > 6]
+
+    def test_regions(self):
+        packed, regions = _color_regions(self.img)
+        self.assertEqual(packed[0, 30], 0x010203)
+        self.assertEqual(
+            regions,
+            {
+                0x010203: (0, 9, 30, 39),
+                0xFF0000: (12, 27, 5, 34),
+                0x000001: (25, 25, 2, 2),
+            },
+        )
+
+    def test_polygons_match_whole_mask(self):
+        packed, regions = _color_regions(self.img)
+        for color, bgr in (
+            (0x010203, (3, 2, 1)),
+            (0xFF0000, (0, 0, 255)),
+            (0x000001, (1, 0, 0)),
+            (0x000000, (0, 0, 0)),
+            (0x123456, (0x56, 0x34, 0x12)),
+        ):
+            self.assertEqual(
+                _color_polygons(packed, regions, color), self.full_mask_polygons(bgr)
+            )
+        self.assertEqual(len(_color_polygons(packed, regions, 0xFF0000)), 2)
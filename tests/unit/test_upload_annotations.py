@@ -0,0 +1,66 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from src.superannotate.lib.core.entities import FolderEntity
+from src.superannotate.lib.core.entities import ProjectEntity
+from src.superannotate.lib.core.journal import UploadJournal
+from src.superannotate.lib.core.usecases.annotations import UploadAnnotationsUseCase
+
+
+class TestAnnotationsToUpload(TestCase):
+    def test_paths_are_matched_to_image_ids(self):
+        service = MagicMock()
+        service.get_bulk_images.return_value = [
+            {"name": "b.jpg", "id": 2},
+            {"name": "a.jpg", "id": 1},
+        ]
+        use_case = UploadAnnotationsUseCase(
+            reporter=MagicMock(),
+            project=ProjectEntity(uuid=1, team_id=1, project_type=1),
+            folder=FolderEntity(uuid=1),
+            annotation_classes=[],
+            annotation_paths=[
+                "dir/a.jpg___objects.json",
+                "dir/c.jpg___objects.json",
+                "dir/b.jpg___objects.json",
+            ],
+            backend_service_provider=service,
+            templates=[],
+            validators=MagicMock(),
+        )
+        self.assertEqual(
+            [(image.name, image.id) for image in use_case.annotations_to_upload],
+            [("a.jpg", 1), ("b.jpg", 2)],
+        )
+        self.assertEqual(
+            [image.path for image in use_case._missing_annotations],
+            ["dir/c.jpg___objects.json"],
+        )
+        use_case.annotations_to_upload
+        service.get_bulk_images.assert_called_once()
+
+    def test_journaled_annotations_are_reported_as_uploaded(self):
+        journal_path = os.path.join(tempfile.mkdtemp(), "journal.db")
+        journal = UploadJournal(journal_path, scope="annotations:1:1:1")
+        journal.set_state("a.jpg", UploadJournal.UPLOADED)
+        journal.close()
+        service = MagicMock()
+        service.get_bulk_images.return_value = []
+        use_case = UploadAnnotationsUseCase(
+            reporter=MagicMock(),
+            project=ProjectEntity(uuid=1, team_id=1, project_type=1),
+            folder=FolderEntity(uuid=1),
+            annotation_classes=[],
+            annotation_paths=["dir/a.jpg___objects.json", "dir/b.jpg___objects.json"],
+            backend_service_provider=service,
+            templates=[],
+            validators=MagicMock(),
+            journal_path=journal_path,
+        )
+        self.assertEqual(
+            use_case.execute().data,
+            (["dir/a.jpg___objects.json"], [], ["dir/b.jpg___objects.json"]),
+        )
+        self.assertEqual(service.get_bulk_images.call_args.kwargs["images"], ["b.jpg"])
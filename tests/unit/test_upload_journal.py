@@ -0,0 +1,107 @@
+import os
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from src.superannotate.lib.core.entities import FolderEntity
+from src.superannotate.lib.core.entities import ProjectEntity
+from src.superannotate.lib.core.journal import UploadJournal
+from src.superannotate.lib.core.usecases.images import UploadImagesToProject
+
+
+class TestUploadJournal(TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), "journal.db")
+
+    def test_states_are_scoped(self):
+        journal = UploadJournal(self.path, "folder_1")
+        journal.set_state("a.jpg", UploadJournal.PROCESSED)
+        journal.set_states(
+            [("a.jpg", {"path": "key"}), ("b.jpg", None)], UploadJournal.UPLOADED
+        )
+        UploadJournal(self.path, "folder_2").set_state("c.jpg", UploadJournal.ATTACHED)
+        journal.close()
+        self.assertEqual(
+            UploadJournal(self.path, "folder_1").get_states(),
+            {
+                "a.jpg": (UploadJournal.UPLOADED, {"path": "key"}),
+                "b.jpg": (UploadJournal.UPLOADED, None),
+            },
+        )
+
+
+class TestResumeImageUpload(TestCase):
+    TEST_FOLDER_PATH = "data_set/sample_project_vector"
+
+    def setUp(self):
+        self.journal_path = os.path.join(tempfile.mkdtemp(), "journal.db")
+        folder = Path(__file__).parent.parent / self.TEST_FOLDER_PATH
+        self.paths = sorted(str(path) for path in folder.glob("*.jpg"))
+        self.s3_keys = []
+        self.backend = MagicMock()
+        self.backend.get_bulk_images.return_value = []
+        self.backend.get_s3_upload_auth_token.return_value = {
+            "accessKeyId": "access",
+            "secretAccessKey": "secret",
+            "sessionToken": "token",
+            "bucket": "bucket",
+            "filePath": "images/",
+            "availableImageCount": 100,
+        }
+        limits = MagicMock(ok=True)
+        limits.data.user_limit = None
+        limits.data.folder_limit.remaining_image_count = 100
+        limits.data.project_limit.remaining_image_count = 100
+        self.backend.get_limitations.return_value = limits
+
+    def _upload(self):
+        s3_repo = MagicMock()
+        s3_repo.insert.side_effect = lambda entity: self.s3_keys.append(entity.uuid)
+        settings = MagicMock()
+        settings.get_all.return_value = []
+        use_case = UploadImagesToProject(
+            project=ProjectEntity(uuid=1, team_id=1, project_type=1, upload_state=1),
+            folder=FolderEntity(uuid=1),
+            settings=settings,
+            s3_repo=lambda *_: s3_repo,
+            backend_client=self.backend,
+            paths=self.paths,
+            journal_path=self.journal_path,
+        )
+        self.assertTrue(use_case.is_valid())
+        list(use_case.execute())
+        return use_case
+
+    def test_uploaded_images_are_only_attached(self):
+        self.backend.attach_files.return_value = {"error": "Internal server error"}
+        self._upload()
+        uploaded_keys = set(self.s3_keys)
+        self.assertEqual(len(uploaded_keys), len(self.paths) * 4)
+
+        self.s3_keys.clear()
+        self.backend.get_bulk_images.reset_mock()
+        self.backend.attach_files.side_effect = lambda **kwargs: [
+            {"name": file["name"]} for file in kwargs["files"]
+        ]
+        use_case = self._upload()
+        self.assertEqual(self.s3_keys, [])
+        self.assertEqual(len(use_case.images_to_attach), len(self.paths))
+        self.assertEqual(
+            sorted(use_case.data[0]), sorted(Path(path).name for path in self.paths)
+        )
+        attached_paths = {
+            file["path"] for file in self.backend.attach_files.call_args.kwargs["files"]
+        }
+        self.assertTrue(attached_paths <= uploaded_keys)
+
+        self.backend.attach_files.reset_mock()
+        use_case = self._upload()
+        self.assertEqual(use_case.images_to_upload[0], [])
+        self.assertEqual(use_case.images_to_attach, [])
+        self.backend.attach_files.assert_not_called()
+        # the images attached by the previous runs are reported as uploaded
+        self.assertEqual(
+            sorted(use_case.data[0]), sorted(Path(path).name for path in self.paths)
+        )
+        self.assertEqual(use_case.data[1], [])
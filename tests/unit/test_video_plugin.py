@@ -0,0 +1,245 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+
+from src.superannotate.lib.core.entities import FolderEntity
+from src.superannotate.lib.core.entities import ProjectEntity
+from src.superannotate.lib.core.exceptions import ImageProcessingException
+from src.superannotate.lib.core.plugin import VideoPlugin
+from src.superannotate.lib.core.usecases.images import UploadVideoFramesUseCase
+
+
+class VideoTestCase(TestCase):
+    FPS = 30
+    FRAMES_COUNT = 90
+
+    @classmethod
+    def setUpClass(cls):
+        cls._temp_dir = tempfile.TemporaryDirectory()
+        cls.video_path = str(Path(cls._temp_dir.name) / "video.mp4")
+        writer = cv2.VideoWriter(
+            cls.video_path, cv2.VideoWriter_fourcc(*"mp4v"), cls.FPS, (64, 48)
+        )
+        for i in range(cls.FRAMES_COUNT):
+            writer.write(np.full((48, 64, 3), i * 2, np.uint8))
+        writer.release()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._temp_dir.cleanup()
+
+
+class TestVideoPluginFrames(VideoTestCase):
+    def _frames(self, start_time, end_time, target_fps):
+        return list(
+            VideoPlugin.frames_generator(
+                self.video_path, start_time, end_time, target_fps, log=False
+            )
+        )
+
+    def test_frames_count(self):
+        self.assertEqual(
+            VideoPlugin.get_frames_count(self.video_path), self.FRAMES_COUNT
+        )
+
+    def test_all_frames(self):
+        frames = self._frames(0, None, None)
+        self.assertEqual(len(frames), self.FRAMES_COUNT)
+        self.assertEqual(
+            len(VideoPlugin.get_extractable_frames(self.video_path, 0, None, None)),
+            self.FRAMES_COUNT,
+        )
+
+    def test_target_fps_and_time_range(self):
+        for start_time, end_time, target_fps in (
+            (0, None, 10),
+            (1.1, None, 7),
+            (0.5, 2, 12.5),
+            (2.5, None, None),
+        ):
+            frames = self._frames(start_time, end_time, target_fps)
+            frame_names = VideoPlugin.get_extractable_frames(
+                self.video_path, start_time, end_time, target_fps
+            )
+            self.assertEqual(len(frames), len(frame_names))
+
+    def test_seek_to_start_time(self):
+        frames = self._frames(2, None, None)
+        self.assertEqual(len(frames), self.FRAMES_COUNT - 2 * self.FPS)
+        self.assertAlmostEqual(int(frames[0][0, 0, 0]), 2 * self.FPS * 2, delta=4)
+
+    def test_frame_names(self):
+        frame_names = VideoPlugin.get_extractable_frames(self.video_path, 0, 1, 10)
+        self.assertEqual(frame_names[0], "video_01.jpg")
+        self.assertEqual(frame_names[-1], f"video_{len(frame_names):02}.jpg")
+
+
+class TestUploadVideoFrames(VideoTestCase):
+    def setUp(self):
+        self.s3_keys = []
+        self.s3_repo = MagicMock()
+        self.s3_repo.insert.side_effect = lambda entity: self.s3_keys.append(
+            entity.uuid
+        )
+        self.backend = MagicMock()
+        self.backend.get_s3_upload_auth_token.return_value = {
+            "accessKeyId": "access",
+            "secretAccessKey": "secret",
+            "sessionToken": "token",
+            "bucket": "bucket",
+            "filePath": "images/",
+            "availableImageCount": 100,
+        }
+        self.limits = MagicMock(ok=True)
+        self.limits.data.user_limit = None
+        self.limits.data.folder_limit.remaining_image_count = 100
+        self.limits.data.project_limit.remaining_image_count = 100
+        self.backend.get_limitations.return_value = self.limits
+        self.backend.attach_files.side_effect = lambda **kwargs: [
+            {"name": file["name"]} for file in kwargs["files"]
+        ]
+
+    def _use_case(self, video_paths=None, video_workers=None):
+        return UploadVideoFramesUseCase(
+            project=ProjectEntity(uuid=1, team_id=1, project_type=1, upload_state=1),
+            folder=FolderEntity(uuid=1),
+            settings=MagicMock(),
+            s3_repo=lambda *_: self.s3_repo,
+            backend_client=self.backend,
+            video_paths=video_paths or [self.video_path],
+            target_fps=10,
+            video_workers=video_workers,
+        )
+
+    def _copy_videos(self, count):
+        video_paths = []
+        for i in range(count):
+            video_path = Path(self._temp_dir.name) / f"copy_{i}.mp4"
+            video_path.write_bytes(Path(self.video_path).read_bytes())
+            video_paths.append(str(video_path))
+        return video_paths
+
+    def test_existing_frames_are_skipped(self):
+        existing_names = {f"video_0{i}.jpg" for i in range(1, 6)}
+        self.backend.get_bulk_images.side_effect = lambda **kwargs: [
+            {"name": name, "id": 1}
+            for name in kwargs["images"]
+            if name in existing_names
+        ]
+        use_case = self._use_case()
+        self.assertEqual(len(use_case.frame_names), 30)
+        self.assertTrue(use_case.is_valid())
+        list(use_case.execute())
+        uploaded, failed, duplications = use_case.response.data
+        self.assertEqual(sorted(uploaded), use_case.frame_names[5:])
+        self.assertEqual(failed, [])
+        self.assertEqual(len(duplications), 5)
+        self.assertEqual(len(self.s3_keys), 25 * 4)
+
+    def test_upload_is_limited(self):
+        self.backend.get_bulk_images.return_value = []
+        self.limits.data.folder_limit.remaining_image_count = 7
+        use_case = self._use_case()
+        self.assertTrue(use_case.is_valid())
+        list(use_case.execute())
+        uploaded, _, _ = use_case.response.data
+        self.assertEqual(sorted(uploaded), use_case.frame_names[:7])
+
+    def test_videos_decoded_in_processes(self):
+        self.backend.get_bulk_images.return_value = []
+        video_paths = self._copy_videos(3)
+        use_case = self._use_case(video_paths, video_workers=2)
+        self.assertTrue(use_case.is_valid())
+        list(use_case.execute())
+        uploaded, failed, _ = use_case.response.data
+        self.assertEqual(sorted(uploaded), sorted(use_case.frame_names))
+        self.assertEqual(failed, [])
+        self.assertEqual(len(self.s3_keys), 90 * 4)
+        self.assertEqual(use_case.video_progress, dict.fromkeys(video_paths, 30))
+
+    def test_limit_is_shared_by_videos(self):
+        self.backend.get_bulk_images.return_value = []
+        self.limits.data.project_limit.remaining_image_count = 40
+        video_paths = self._copy_videos(3)
+        use_case = self._use_case(video_paths, video_workers=2)
+        self.assertTrue(use_case.is_valid())
+        list(use_case.execute())
+        self.assertEqual(len(use_case.response.data[0]), 40)
+        self.assertEqual(
+            list(use_case.video_progress.values()),
+            [30, 10, 0],
+        )
+
+    def _use_case_with_estimate(self, estimate, video_workers=None):
+        frame_names = VideoPlugin.get_extractable_frames(self.video_path, 0, None, 10)
+        frame_names += [f"video_{i}.jpg" for i in range(31, 36)]
+        with patch(
+            "lib.core.plugin.VideoPlugin.get_extractable_frames",
+            return_value=frame_names[:estimate],
+        ):
+            return self._use_case(video_workers=video_workers)
+
+    def test_frames_past_the_estimate_are_uploaded(self):
+        self.backend.get_bulk_images.return_value = []
+        for video_workers in (None, 2):
+            self.s3_keys.clear()
+            use_case = self._use_case_with_estimate(20, video_workers)
+            self.assertTrue(use_case.is_valid())
+            list(use_case.execute())
+            uploaded, failed, _ = use_case.response.data
+            self.assertEqual(len(use_case.frame_names), 30)
+            self.assertEqual(sorted(uploaded), use_case.frame_names)
+            self.assertEqual(failed, [])
+            self.assertEqual(use_case.video_progress, {self.video_path: 30})
+
+    def test_frames_past_the_estimate_are_limited(self):
+        self.backend.get_bulk_images.return_value = []
+        self.limits.data.folder_limit.remaining_image_count = 25
+        use_case = self._use_case_with_estimate(20)
+        self.assertTrue(use_case.is_valid())
+        list(use_case.execute())
+        self.assertEqual(len(use_case.response.data[0]), 25)
+
+    def test_frames_missing_from_the_estimate_are_logged(self):
+        self.backend.get_bulk_images.return_value = []
+        use_case = self._use_case_with_estimate(35)
+        self.assertTrue(use_case.is_valid())
+        with self.assertLogs("root", level="WARNING") as logs:
+            list(use_case.execute())
+        self.assertIn("Decoded 30 frames", "".join(logs.output))
+        self.assertIn("estimated 35", "".join(logs.output))
+        self.assertEqual(len(use_case.response.data[0]), 30)
+
+    def test_frames_of_a_failed_video_are_reported(self):
+        self.backend.get_bulk_images.return_value = []
+        video_paths = self._copy_videos(2)
+        named_frames_generator = VideoPlugin.named_frames_generator
+
+        def failing_generator(video_path, *args, **kwargs):
+            for i, item in enumerate(
+                named_frames_generator(video_path, *args, **kwargs)
+            ):
+                if video_path == video_paths[0] and i == 10:
+                    raise ImageProcessingException("Couldn't decode the video frame.")
+                yield item
+
+        for video_workers in (None, 2):
+            use_case = self._use_case(video_paths, video_workers)
+            self.assertTrue(use_case.is_valid())
+            with patch(
+                "lib.core.plugin.VideoPlugin.named_frames_generator", failing_generator
+            ), self.assertLogs("root", level="ERROR") as logs:
+                list(use_case.execute())
+            self.assertIn("Couldn't decode the video frame.", "".join(logs.output))
+            uploaded, failed, _ = use_case.response.data
+            frame_names = use_case.video_frame_names
+            self.assertEqual(
+                sorted(uploaded),
+                frame_names[video_paths[0]][:10] + frame_names[video_paths[1]],
+            )
+            self.assertEqual(sorted(failed), frame_names[video_paths[0]][10:])